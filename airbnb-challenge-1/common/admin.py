@@ -1,3 +1,104 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.functional import cached_property
 
-# Register your models here.
+from .models import Task
+
+
+def estimate_count(queryset):
+    """
+    필터 없는 전체 테이블 행 수 추정값
+
+    PostgreSQL은 통계(pg_class.reltuples)를, 그 밖의 DB는 MAX(pk)를 읽는다. 둘 다 인덱스나
+    카탈로그만 보므로 행 수와 상관없이 빠르다. 지운 행만큼 실제보다 클 수 있다.
+    """
+    model = queryset.model
+    connection = connections[queryset.db]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [model._meta.db_table])
+            row = cursor.fetchone()
+        if row is not None and row[0] >= 0:
+            return row[0]
+    return model._base_manager.using(queryset.db).aggregate(max_pk=Max("pk"))["max_pk"] or 0
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    전체 COUNT(*) 대신 추정값을 쓰는 관리자 페이지네이터
+
+    필터/검색이 없으면 estimate_count()를, 있으면 count_limit행까지만 세는 COUNT
+    (LIMIT 서브쿼리)를 쓴다. 필터 결과가 count_limit보다 많으면 그 뒤 페이지로는 가지 않는다.
+    """
+
+    count_limit = 10_000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            return estimate_count(queryset)
+        return queryset.order_by()[: self.count_limit].count()
+
+
+class UsernameFilter(admin.SimpleListFilter):
+    """
+    사용자 목록 전체를 사이드바에 읽어 오는 `list_filter = ["user"]` 대신 쓰는 사용자 이름 입력 필터
+
+    서브클래스에서 field_path로 사용자 이름 필드를 정한다.
+    """
+
+    title = "user"
+    parameter_name = "username"
+    field_path = "user__username"
+    template = "common/admin/input_filter.html"
+
+    def lookups(self, request, model_admin):
+        return ()
+
+    def has_output(self):
+        return True
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(**{self.field_path: self.value()})
+        return queryset
+
+    def choices(self, changelist):
+        yield {
+            "parameter_name": self.parameter_name,
+            "value": self.value() or "",
+            "hidden_params": [(key, value) for key, value in changelist.params.items() if key != self.parameter_name],
+            "clear_query_string": changelist.get_query_string(remove=[self.parameter_name]),
+        }
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    수백만 행 테이블용 ModelAdmin
+
+    - 페이지마다 COUNT(*)를 하지 않는다 (EstimatedCountPaginator, show_full_result_count=False)
+    - date_hierarchy는 연도 목록을 만들려고 테이블 전체를 읽으므로 쓰지 않는다.
+      created_at 범위 list_filter(오늘/7일/이번 달/올해)는 인덱스 범위 조회로 대신한다.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(Task)
+class TaskAdmin(LargeTableAdmin):
+    list_display = ["id", "name", "status", "attempts", "max_attempts", "run_at", "created_at"]
+    list_filter = ["status"]
+    search_fields = ["name"]
+    readonly_fields = ["created_at", "updated_at", "locked_at", "last_error"]
+    ordering = ["-id"]
+    actions = ["retry"]
+
+    @admin.action(description="선택한 작업 다시 실행")
+    def retry(self, request, queryset):
+        updated = queryset.update(status=Task.QUEUED, attempts=0, run_at=timezone.now(), locked_at=None)
+        self.message_user(request, f"작업 {updated}개를 다시 대기열에 넣었습니다.")
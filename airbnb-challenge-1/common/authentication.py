@@ -1,13 +1,83 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
 from django.contrib.auth.models import User
 from rest_framework.authentication import BaseAuthentication
 
 
+class UserCache:
+    """크기 제한(LRU)과 TTL이 있는 프로세스 내 User 캐시
+
+    username과 id 두 키로 같은 User를 찾을 수 있고, 조회/저장/무효화 모두 O(1)이다.
+    User가 저장되거나 삭제되면 common.signals에서 invalidate()가 호출된다.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._keys_by_pk = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._discard(user.pk)
+                return None
+            for related_key in self._keys_by_pk[user.pk]:
+                self._entries.move_to_end(related_key)
+        # 요청마다 속성을 바꿔도 캐시된 객체에는 영향이 없도록 복사본을 준다
+        return copy.copy(user)
+
+    def get_by_username(self, username):
+        return self.get(("username", username))
+
+    def get_by_id(self, user_id):
+        return self.get(("id", user_id))
+
+    def set(self, user):
+        keys = (("username", user.get_username()), ("id", user.pk))
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._discard(user.pk)
+            for key in keys:
+                self._entries[key] = (user, expires_at)
+            self._keys_by_pk[user.pk] = keys
+            while len(self._entries) > self.maxsize * 2:
+                _, (oldest, _) = self._entries.popitem(last=False)
+                self._discard(oldest.pk)
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._discard(user_id)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_pk.clear()
+
+    def _discard(self, user_id):
+        for key in self._keys_by_pk.pop(user_id, ()):
+            self._entries.pop(key, None)
+
+
+user_cache = UserCache(maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL)
+
+
 class UsernameAuthentication(BaseAuthentication):
     """X-USERNAME 헤더를 사용하여 사용자를 인증하는 클래스"""
 
     def authenticate(self, request):
         """
         X-USERNAME 헤더에서 username을 추출하여 사용자를 찾습니다.
+        자주 쓰이는 사용자는 user_cache에서 바로 찾으므로 DB를 조회하지 않습니다.
 
         Returns:
             tuple: (user, None) - 사용자가 존재하는 경우
@@ -18,8 +88,14 @@ class UsernameAuthentication(BaseAuthentication):
         if not username:
             return None
 
-        try:
-            user = User.objects.get(username=username)
-            return (user, None)
-        except User.DoesNotExist:
+        user = user_cache.get_by_username(username)
+        if user is None:
+            try:
+                user = User.objects.get(username=username)
+            except User.DoesNotExist:
+                return None
+            user_cache.set(user)
+
+        if not user.is_active:
             return None
+        return (user, None)
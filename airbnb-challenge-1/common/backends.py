@@ -0,0 +1,23 @@
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import User
+
+from .authentication import user_cache
+
+
+class CachedModelBackend(ModelBackend):
+    """세션에 저장된 user id로 사용자를 찾을 때 user_cache를 먼저 보는 인증 백엔드
+
+    AuthenticationMiddleware는 요청마다 get_user()를 호출하므로, 캐시된 사용자는
+    세션 백엔드가 cache/signed_cookies일 때 DB를 전혀 거치지 않고 인증된다.
+    캐시 무효화는 같은 프로세스의 시그널로만 되므로 그 두 세션 프로필에서만 쓴다.
+    """
+
+    def get_user(self, user_id):
+        user = user_cache.get_by_id(user_id)
+        if user is None:
+            try:
+                user = User._default_manager.get(pk=user_id)
+            except User.DoesNotExist:
+                return None
+            user_cache.set(user)
+        return user if self.user_can_authenticate(user) else None
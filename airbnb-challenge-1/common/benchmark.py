@@ -0,0 +1,319 @@
+"""API 벤치마크 하네스
+
+대량 데이터를 시드하고 config/urls.py, users/urls.py의 모든 API 라우트를 Django
+테스트 클라이언트로 반복 호출해 지연 시간 백분위수, 쿼리 수, 최대 메모리를 잰다.
+실행은 `manage.py benchmark`를 사용한다.
+"""
+
+import itertools
+import random
+import time
+import tracemalloc
+import uuid
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import URLPattern, URLResolver, get_resolver
+from rest_framework.test import APIClient
+
+from tweets import entities, timeline
+from tweets.cache import response_cache
+from tweets.models import Like, Tweet
+from users.models import Follow, FollowerCount
+
+USERNAME_PREFIX = "bench_"
+PASSWORD = "benchpassword123"
+WORDS = (
+    "django python coffee music travel weekend deploy bug release cat dog rain sunny "
+    "seoul busan pizza #python #django #devlife #today #weekend #music"
+).split()
+
+
+class BenchmarkContext:
+    """시드된 데이터와 벤치마크에 쓰는 사용자/클라이언트"""
+
+    def __init__(self, actor, target, password):
+        self.actor = actor
+        self.target = target
+        self.password = password
+        self.client = APIClient()
+        self.login()
+        self.tweet_ids = list(Tweet.objects.order_by("-created_at", "-id").values_list("id", flat=True)[:100])
+
+    def login(self):
+        # 비밀번호가 바뀌었을 수 있으므로 세션 해시를 DB 값으로 다시 만든다
+        self.actor.refresh_from_db()
+        self.client.force_login(self.actor)
+
+    def own_tweet(self):
+        return Tweet.objects.create(user=self.actor, payload="benchmark tweet")
+
+
+def batched_create(model, objects, batch_size, **kwargs):
+    """objects를 batch_size씩 끊어 트랜잭션 하나에 bulk_create 한 번씩 넣는다."""
+    created = 0
+    for batch in itertools.batched(objects, batch_size):
+        with transaction.atomic():
+            model.objects.bulk_create(batch, batch_size=batch_size, **kwargs)
+        created += len(batch)
+    return created
+
+
+def seed(users, tweets, likes, follows, batch_size=5000, rng=None, log=print):
+    """users명, tweets개, likes개(중복 제외 전), 사용자당 follows명의 벤치마크 데이터를 만든다."""
+    rng = rng or random.Random(0)
+    password = make_password(PASSWORD)
+    started = time.perf_counter()
+
+    existing = User.objects.filter(username__startswith=USERNAME_PREFIX).count()
+    batched_create(
+        User,
+        (User(username=f"{USERNAME_PREFIX}{i}", password=password) for i in range(existing, users)),
+        batch_size,
+    )
+    user_ids = list(User.objects.filter(username__startswith=USERNAME_PREFIX).values_list("id", flat=True))
+    log(f"users: {len(user_ids)} ({time.perf_counter() - started:.1f}s)")
+    if len(user_ids) < 2:
+        return
+
+    def make_tweet():
+        words = rng.choices(WORDS, k=rng.randint(3, 12))
+        if rng.random() < 0.1:
+            words.append(f"@{USERNAME_PREFIX}{rng.randrange(len(user_ids))}")
+        return Tweet(user_id=rng.choice(user_ids), payload=" ".join(words)[:180])
+
+    for batch in itertools.batched((make_tweet() for _ in range(tweets)), batch_size):
+        with transaction.atomic():
+            entities.index_tweets(Tweet.objects.bulk_create(batch, batch_size=batch_size))
+    tweet_ids = list(Tweet.objects.order_by().values_list("id", flat=True))
+    log(f"tweets: {len(tweet_ids)} ({time.perf_counter() - started:.1f}s)")
+    if not tweet_ids:
+        return
+
+    def make_follow():
+        follower, following = rng.sample(user_ids, 2)
+        return Follow(follower_id=follower, following_id=following)
+
+    follows = (make_follow() for _ in range(follows * len(user_ids)))
+    batched_create(Follow, follows, batch_size, ignore_conflicts=True)
+    FollowerCount.objects.rebuild(batch_size)
+    log(f"follows: {Follow.objects.count()} ({time.perf_counter() - started:.1f}s)")
+
+    batched_create(
+        Like,
+        (Like(user_id=rng.choice(user_ids), tweet_id=rng.choice(tweet_ids)) for _ in range(likes)),
+        batch_size,
+        ignore_conflicts=True,
+    )
+    Tweet.objects.rebuild_like_counts()
+    response_cache.invalidate()
+    log(f"likes: {Like.objects.count()} ({time.perf_counter() - started:.1f}s)")
+
+
+def prepare_actor():
+    """요청을 보낼 사용자와 조회 대상 사용자를 준비한다."""
+    actor, _ = User.objects.get_or_create(username=f"{USERNAME_PREFIX}actor", defaults={"is_staff": True})
+    # 이전 실행에서 비밀번호 변경 시나리오가 바꿔 둔 비밀번호를 되돌린다
+    actor.set_password(PASSWORD)
+    actor.save()
+    target = User.objects.exclude(pk=actor.pk).order_by("id").first()
+    if target is None:
+        target = User.objects.create_user(username=f"{USERNAME_PREFIX}target", password=PASSWORD)
+    if not Tweet.objects.filter(user=actor).exists():
+        Tweet.objects.create(user=actor, payload="benchmark actor tweet")
+    if Follow.objects.get_or_create(follower=actor, following=target)[1]:
+        timeline.backfill(actor, target)
+    return actor, target
+
+
+# (url 이름, 메서드) -> prepare(ctx) 함수. prepare는 시간 측정 밖에서 실행되고
+# (경로, 요청 데이터)를 돌려준다.
+def _follow_post(ctx):
+    Follow.objects.filter(follower=ctx.actor, following=ctx.target).delete()
+    return f"/api/v1/users/{ctx.target.pk}/follow", None
+
+
+def _follow_delete(ctx):
+    Follow.objects.get_or_create(follower=ctx.actor, following=ctx.target)
+    return f"/api/v1/users/{ctx.target.pk}/follow", None
+
+
+def _like_post(ctx):
+    Like.objects.unlike(ctx.actor, ctx.tweet_ids[0])
+    return f"/api/v1/tweets/{ctx.tweet_ids[0]}/like", None
+
+
+def _like_delete(ctx):
+    Like.objects.like(ctx.actor, ctx.tweet_ids[0])
+    return f"/api/v1/tweets/{ctx.tweet_ids[0]}/like", None
+
+
+def _batch_delete(ctx):
+    tweets = Tweet.objects.bulk_create([Tweet(user=ctx.actor, payload="batch") for _ in range(20)])
+    return "/api/v1/tweets/batch", {"ids": [tweet.pk for tweet in tweets]}
+
+
+def _password_update(ctx):
+    ctx.login()
+    new_password = f"{PASSWORD}{uuid.uuid4().hex[:4]}"
+    data = {
+        "current_password": ctx.password,
+        "new_password": new_password,
+        "new_password_confirm": new_password,
+    }
+    ctx.password = new_password
+    return "/api/v1/users/password", data
+
+
+def _logout(ctx):
+    ctx.login()
+    return "/api/v1/users/logout", None
+
+
+def _user_create(ctx):
+    username = f"{USERNAME_PREFIX}new_{uuid.uuid4().hex[:12]}"
+    data = {"username": username, "password": PASSWORD, "password_confirm": PASSWORD}
+    return "/api/v1/users", data
+
+
+SCENARIOS = {
+    ("tweet_list", "GET"): lambda ctx: ("/", None),
+    ("api_tweet_list", "GET"): lambda ctx: ("/api/v1/tweets", None),
+    ("api_tweet_list", "POST"): lambda ctx: ("/api/v1/tweets", {"payload": "benchmark #python"}),
+    ("api_tweet_batch", "POST"): lambda ctx: ("/api/v1/tweets/batch", [{"payload": "batch #python"}] * 20),
+    ("api_tweet_batch", "DELETE"): _batch_delete,
+    ("api_home_timeline", "GET"): lambda ctx: ("/api/v1/timeline", None),
+    ("api_trend_list", "GET"): lambda ctx: ("/api/v1/trends?window=1h&kind=keywords", None),
+    ("api_tweet_detail", "GET"): lambda ctx: (f"/api/v1/tweets/{ctx.tweet_ids[0]}", None),
+    ("api_tweet_detail", "PUT"): lambda ctx: (f"/api/v1/tweets/{ctx.own_tweet().pk}", {"payload": "edited"}),
+    ("api_tweet_detail", "DELETE"): lambda ctx: (f"/api/v1/tweets/{ctx.own_tweet().pk}", None),
+    ("api_tweet_like", "POST"): _like_post,
+    ("api_tweet_like", "DELETE"): _like_delete,
+    ("api_tweet_liked", "GET"): lambda ctx: (
+        "/api/v1/tweets/liked?ids=" + ",".join(map(str, ctx.tweet_ids)),
+        None,
+    ),
+    ("api_tweet_mentions", "GET"): lambda ctx: ("/api/v1/tweets/mentions", None),
+    ("api_tag_tweet_list", "GET"): lambda ctx: ("/api/v1/tags/python/tweets", None),
+    ("api_tweet_search", "GET"): lambda ctx: ("/api/v1/tweets/search?q=python", None),
+    ("api_tweet_export", "GET"): lambda ctx: (f"/api/v1/tweets/export?user={ctx.target.pk}", None),
+    ("api_tweet_cache_stats", "GET"): lambda ctx: ("/api/v1/tweets/cache-stats", None),
+    ("api_metrics", "GET"): lambda ctx: ("/api/v1/metrics", None),
+    ("api_user_list", "GET"): lambda ctx: ("/api/v1/users", None),
+    ("api_user_list", "POST"): _user_create,
+    ("api_user_detail", "GET"): lambda ctx: (f"/api/v1/users/{ctx.target.pk}", None),
+    ("api_user_tweet_list", "GET"): lambda ctx: (f"/api/v1/users/{ctx.target.pk}/tweets", None),
+    ("api_user_follow", "POST"): _follow_post,
+    ("api_user_follow", "DELETE"): _follow_delete,
+    ("api_user_password_update", "PUT"): _password_update,
+    ("api_user_login", "POST"): lambda ctx: (
+        "/api/v1/users/login",
+        {"username": ctx.actor.username, "password": ctx.password},
+    ),
+    ("api_user_logout", "POST"): _logout,
+}
+
+
+def iter_route_names(patterns=None):
+    """URLconf에 등록된 이름 있는 라우트를 모두 돌려준다. (admin 제외)"""
+    patterns = get_resolver().url_patterns if patterns is None else patterns
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.app_name != "admin":
+                yield from iter_route_names(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            yield pattern.name
+
+
+def percentile(sorted_values, p):
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def send(ctx, method, path, data):
+    request = getattr(ctx.client, method.lower())
+    if data is None:
+        return request(path)
+    return request(path, data, format="json")
+
+
+def measure(ctx, method, prepare, iterations):
+    latencies, queries, statuses = [], [], {}
+    for _ in range(iterations):
+        path, data = prepare(ctx)
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = send(ctx, method, path, data)
+            latencies.append((time.perf_counter() - started) * 1000)
+        queries.append(len(captured))
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    # tracemalloc은 느리므로 한 번만 따로 실행해 최대 메모리를 잰다
+    path, data = prepare(ctx)
+    tracemalloc.start()
+    send(ctx, method, path, data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "method": method,
+        "path": path,
+        "iterations": iterations,
+        "status_codes": {str(code): count for code, count in sorted(statuses.items())},
+        "latency_ms": {
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1],
+            "mean": sum(latencies) / len(latencies),
+        },
+        "queries": {"min": min(queries), "max": max(queries), "mean": sum(queries) / len(queries)},
+        "peak_memory_kb": peak / 1024,
+    }
+
+
+def run(iterations=50, routes=None, log=print):
+    """모든 라우트를 iterations번씩 호출하고 결과를 JSON으로 직렬화 가능한 dict로 돌려준다."""
+    # APIClient의 testserver 호스트를 받고, 같은 사용자로 수천 번 호출하므로 요청 제한은 끈다
+    with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"], THROTTLE_ENABLED=False):
+        return measure_routes(iterations, routes, log)
+
+
+def measure_routes(iterations, routes, log):
+    actor, target = prepare_actor()
+    ctx = BenchmarkContext(actor, target, PASSWORD)
+    names = sorted(set(iter_route_names()))
+    if routes:
+        names = [name for name in names if name in routes]
+
+    results, skipped = {}, []
+    for name in names:
+        scenarios = [(method, prepare) for (route, method), prepare in SCENARIOS.items() if route == name]
+        if not scenarios:
+            skipped.append(name)
+            continue
+        for method, prepare in scenarios:
+            log(f"{method} {name}")
+            ctx.login()
+            results[f"{method} {name}"] = measure(ctx, method, prepare, iterations)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "database": connection.vendor,
+            "iterations": iterations,
+            "users": User.objects.count(),
+            "tweets": Tweet.objects.count(),
+            "likes": Like.objects.count(),
+        },
+        "routes": results,
+        "skipped": skipped,
+    }
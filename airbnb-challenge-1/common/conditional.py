@@ -0,0 +1,32 @@
+"""조건부 GET (ETag)
+
+뷰는 응답 본문을 만들기 전에 ETag를 싼 값으로 계산하고 not_modified()로 If-None-Match를
+확인한다. 바뀌지 않았으면 직렬화 없이 304를 돌려준다.
+
+Last-Modified는 보내지 않는다. like_count는 updated_at을 바꾸지 않고 갱신되므로
+updated_at으로 만든 Last-Modified로는 좋아요 뒤에도 304가 나간다.
+"""
+
+import hashlib
+import json
+
+from django.utils.cache import get_conditional_response
+
+
+def make_etag(*parts):
+    """parts(JSON으로 바꿀 수 있는 값)로 만든 강한 ETag"""
+    raw = json.dumps(parts, separators=(",", ":"), default=str)
+    return f'"{hashlib.md5(raw.encode()).hexdigest()}"'
+
+
+def not_modified(request, etag):
+    """If-None-Match가 ETag와 맞으면 304 응답을, 아니면 None을 돌려준다."""
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        set_validators(response, etag)
+    return response
+
+
+def set_validators(response, etag):
+    response["ETag"] = etag
+    return response
@@ -0,0 +1,138 @@
+"""핫 쿼리 인덱스 점검
+
+각 API가 실행하는 대표 queryset을 EXPLAIN해서 테이블 전체 스캔이나 정렬용 임시
+B-tree가 생기는지 확인한다. 실행은 `manage.py explain_queries`를 사용하고,
+테스트에서도 같은 점검을 돌려 쿼리가 인덱스를 벗어나면 실패하게 한다.
+"""
+
+import re
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import User
+from django.db import connections, transaction
+
+from tweets import rows, search
+from tweets.models import Like, Mention, TimelineEntry, Tweet, TweetTag
+from tweets.timeline import older_than
+from users.models import Follow, FollowerCount
+from users.views import user_tweets
+
+from . import tasks
+from .pagination import KeysetPagination
+
+# EXPLAIN에는 실제 행이 필요 없으므로 아무 id나 쓴다
+USER = User(pk=1)
+CURSOR = (datetime(2026, 1, 1, tzinfo=timezone.utc), 1_000_000)
+
+
+class Check:
+    """
+    점검할 쿼리 하나
+
+    ordered_scan: 인덱스 순서대로 읽다가 LIMIT에서 멈추는 첫 페이지라서 인덱스 전체 스캔을 허용한다
+    allow_sort: 이미 작은 결과 집합(예: 전문 검색 결과)만 정렬하므로 임시 정렬을 허용한다
+    """
+
+    def __init__(self, name, build, ordered_scan=False, allow_sort=False):
+        self.name = name
+        self.build = build
+        self.ordered_scan = ordered_scan
+        self.allow_sort = allow_sort
+
+
+def page(queryset, ordering=("created_at", "id"), position=None):
+    """KeysetPagination이 실제로 실행하는 커서 페이지 queryset"""
+    paginator = KeysetPagination()
+    paginator.position, paginator.reverse = position, False
+    return paginator.order_queryset(queryset, ordering)
+
+
+def pages(name, queryset, ordering=("created_at", "id"), **kwargs):
+    """첫 페이지(인덱스 순서 스캔 허용)와 커서 페이지(인덱스 범위 검색) 점검"""
+    return [
+        Check(f"{name} (first page)", lambda: page(queryset(), ordering), ordered_scan=True, **kwargs),
+        Check(f"{name} (cursor page)", lambda: page(queryset(), ordering, CURSOR), **kwargs),
+    ]
+
+
+CHECKS = [
+    *pages("api_tweet_list", lambda: rows.values(Tweet.objects.all())),
+    *pages("api_user_tweet_list", lambda: user_tweets(USER)),
+    *pages("api_home_timeline", lambda: TimelineEntry.objects.filter(owner=USER), ("created_at", "tweet_id")),
+    *pages("api_home_timeline celebrity", lambda: Tweet.objects.filter(user_id=1), ("created_at", "id")),
+    *pages("api_tag_tweet_list", lambda: TweetTag.objects.filter(tag="python"), ("created_at", "tweet_id")),
+    *pages("api_tweet_mentions", lambda: Mention.objects.filter(user=USER), ("created_at", "tweet_id")),
+    *pages("api_tweet_search recent", lambda: Tweet.objects.filter(search.matches("python")), allow_sort=True),
+    Check("rows.load", lambda: rows.by_ids([1, 2, 3])),
+    Check("api_tweet_detail", lambda: Tweet.objects.select_related("user").filter(pk=1)),
+    Check("api_tweet_like", lambda: Like.objects.filter(user=USER, tweet_id=1)),
+    Check("api_tweet_liked", lambda: Like.objects.filter(user=USER, tweet_id__in=[1, 2, 3]).order_by()),
+    Check("likes of tweet", lambda: Like.objects.filter(tweet_id=1)),
+    Check("likes of user", lambda: Like.objects.filter(user=USER)),
+    Check(
+        "timeline.trim cutoff",
+        lambda: TimelineEntry.objects.filter(owner=USER).order_by("-created_at", "-tweet_id")[800:801],
+        ordered_scan=True,
+    ),
+    Check("timeline.trim delete", lambda: TimelineEntry.objects.filter(owner=USER).filter(older_than(*CURSOR))),
+    Check("timeline.fan_out followers", lambda: Follow.objects.filter(following_id=1).values_list("follower_id")),
+    Check("api_user_follow", lambda: Follow.objects.filter(follower=USER, following_id=2)),
+    Check("timeline.celebrities", lambda: FollowerCount.objects.filter(count__gt=10_000).values_list("user_id")),
+    Check("tasks.claim", lambda: tasks.due(CURSOR[0]).values_list("pk", flat=True)[:100]),
+]
+
+# vendor -> (전체 스캔, 인덱스 전체 스캔, 정렬) 정규식. PostgreSQL은 인덱스 전체 스캔을
+# 계획 한 줄로 구분할 수 없어 순차 스캔과 정렬만 본다.
+PATTERNS = {
+    "sqlite": (
+        re.compile(r"\bSCAN (\w+)$"),
+        re.compile(r"\bSCAN (\w+) USING (?:COVERING )?INDEX"),
+        re.compile(r"USE TEMP B-TREE FOR ORDER BY"),
+    ),
+    "postgresql": (
+        re.compile(r"Seq Scan on (\w+)"),
+        None,
+        re.compile(r"(?<!Incremental )\bSort\b(?! Key)"),
+    ),
+}
+
+
+def explain(queryset):
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.explain()
+    # 작은 개발 DB에서는 플래너가 인덱스보다 순차 스캔을 고르므로, 인덱스를 쓸 수 있는지 본다
+    with transaction.atomic(using=queryset.db):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+
+def find_problems(check, plan, vendor):
+    """plan에서 check가 허용하지 않는 전체 스캔/정렬을 찾는다."""
+    patterns = PATTERNS.get(vendor)
+    if patterns is None:
+        return []
+    full_scan, index_scan, sort = patterns
+    problems = []
+    for line in plan.splitlines():
+        match = full_scan.search(line)
+        if match:
+            problems.append(f"full scan of {match.group(1)}")
+            continue
+        match = index_scan and index_scan.search(line)
+        if match and not check.ordered_scan:
+            problems.append(f"full index scan of {match.group(1)}")
+        if sort.search(line) and not check.allow_sort:
+            problems.append("sort without index")
+    return problems
+
+
+def run(checks=None, using="default"):
+    """[(check, plan, problems)] 목록"""
+    vendor = connections[using].vendor
+    results = []
+    for check in CHECKS if checks is None else checks:
+        plan = explain(check.build().using(using))
+        results.append((check, plan, find_problems(check, plan, vendor)))
+    return results
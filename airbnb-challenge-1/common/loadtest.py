@@ -0,0 +1,124 @@
+"""HTTP 부하 테스트
+
+실행 중인 서버(WSGI runserver/gunicorn 또는 ASGI uvicorn 등)에 동시 연결 수를 단계별로
+늘려 가며 표준 라이브러리 스레드와 http.client로 요청을 보내고, 단계마다 처리량과
+지연 시간 백분위수, 오류율을 잰다. 같은 명령을 sync/async 서버에 각각 실행해
+결과를 비교한다. 실행은 `manage.py loadtest`를 사용한다.
+"""
+
+import http.client
+import json
+import threading
+import time
+from http.cookies import SimpleCookie
+from urllib.parse import urlsplit
+
+from .benchmark import percentile
+
+
+def connect(base_url, timeout):
+    parts = urlsplit(base_url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    return connection_class(parts.hostname, parts.port, timeout=timeout)
+
+
+def login(base_url, username, password, timeout=10):
+    """세션 로그인 후 이후 요청에 붙일 Cookie 헤더 값을 돌려준다."""
+    connection = connect(base_url, timeout)
+    try:
+        body = json.dumps({"username": username, "password": password})
+        connection.request("POST", "/api/v1/users/login", body, {"Content-Type": "application/json"})
+        response = connection.getresponse()
+        response.read()
+        if response.status != 200:
+            raise RuntimeError(f"로그인 실패: HTTP {response.status}")
+        cookie = SimpleCookie()
+        for header in response.headers.get_all("Set-Cookie") or ():
+            cookie.load(header)
+        return "; ".join(f"{key}={morsel.value}" for key, morsel in cookie.items())
+    finally:
+        connection.close()
+
+
+def worker(base_url, path, headers, deadline, timeout, results, lock):
+    """deadline까지 keep-alive 연결 하나로 요청을 반복한다."""
+    latencies, statuses, errors = [], {}, 0
+    connection = connect(base_url, timeout)
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection.close()
+            connection = connect(base_url, timeout)
+            continue
+        latencies.append((time.perf_counter() - started) * 1000)
+        statuses[response.status] = statuses.get(response.status, 0) + 1
+    connection.close()
+    with lock:
+        results["latencies"] += latencies
+        results["errors"] += errors
+        for code, count in statuses.items():
+            results["statuses"][code] = results["statuses"].get(code, 0) + count
+
+
+def run_level(base_url, path, concurrency, duration, headers, timeout=10):
+    """concurrency개 스레드로 duration초 동안 요청을 보내고 결과를 요약한다."""
+    results = {"latencies": [], "errors": 0, "statuses": {}}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=worker, args=(base_url, path, headers, deadline, timeout, results, lock))
+        for _ in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(results["latencies"])
+    failed = results["errors"] + sum(count for code, count in results["statuses"].items() if code >= 400)
+    total = len(latencies) + results["errors"]
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "requests_per_second": len(latencies) / elapsed,
+        "error_rate": failed / total if total else 1.0,
+        "status_codes": {str(code): count for code, count in sorted(results["statuses"].items())},
+        "connection_errors": results["errors"],
+        "latency_ms": {
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1] if latencies else None,
+        },
+    }
+
+
+def run(base_url, paths, levels, duration, headers, max_error_rate=0.01, max_p99_ms=1000, log=print):
+    """
+    경로마다 동시 연결 수를 levels 순서로 늘려 가며 측정한다.
+
+    오류율이 max_error_rate 이하이고 p99가 max_p99_ms 이하인 가장 큰 단계를 그
+    경로의 동시성 한계(concurrency_limit)로 기록한다.
+    """
+    report = {}
+    for path in paths:
+        steps, limit = [], None
+        for concurrency in levels:
+            result = run_level(base_url, path, concurrency, duration, headers)
+            p99 = result["latency_ms"]["p99"]
+            log(
+                f"{path} x{concurrency}: {result['requests_per_second']:.0f} req/s, "
+                f"p99 {p99 or 0:.1f}ms, errors {result['error_rate']:.1%}"
+            )
+            steps.append(result)
+            if result["error_rate"] <= max_error_rate and p99 is not None and p99 <= max_p99_ms:
+                limit = concurrency
+        report[path] = {"levels": steps, "concurrency_limit": limit}
+    return report
@@ -0,0 +1,55 @@
+import json
+import random
+
+from django.core.management.base import BaseCommand
+
+from common import benchmark
+
+
+class Command(BaseCommand):
+    help = "대량 데이터를 시드하고 모든 API 라우트의 지연 시간/쿼리 수/메모리를 JSON으로 기록합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", action="store_true", help="측정 전에 벤치마크 데이터를 만듭니다.")
+        parser.add_argument("--users", type=int, default=10_000)
+        parser.add_argument("--tweets", type=int, default=1_000_000)
+        parser.add_argument("--likes", type=int, default=5_000_000)
+        parser.add_argument("--follows", type=int, default=20, help="사용자당 평균 팔로우 수")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--random-seed", type=int, default=0)
+        parser.add_argument("--iterations", type=int, default=50, help="라우트별 반복 횟수")
+        parser.add_argument(
+            "--route",
+            action="append",
+            dest="routes",
+            help="이 URL 이름만 측정합니다. (여러 번 지정 가능)",
+        )
+        parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: 표준 출력)")
+
+    def handle(self, *args, **options):
+        log = self.stderr.write
+        if options["seed"]:
+            benchmark.seed(
+                users=options["users"],
+                tweets=options["tweets"],
+                likes=options["likes"],
+                follows=options["follows"],
+                batch_size=options["batch_size"],
+                rng=random.Random(options["random_seed"]),
+                log=log,
+            )
+
+        report = benchmark.run(iterations=options["iterations"], routes=options["routes"], log=log)
+        if options["seed"]:
+            seed_keys = ("users", "tweets", "likes", "follows", "random_seed")
+            report["meta"]["seed"] = {key: options[key] for key in seed_keys}
+
+        output = json.dumps(report, indent=2, ensure_ascii=False)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                f.write(output + "\n")
+            self.stderr.write(self.style.SUCCESS(f"결과를 {options['output']}에 저장했습니다."))
+        else:
+            self.stdout.write(output)
+        if report["skipped"]:
+            self.stderr.write(self.style.WARNING(f"시나리오가 없는 라우트: {', '.join(report['skipped'])}"))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from common import explain
+
+
+class Command(BaseCommand):
+    help = "API별 핫 쿼리를 EXPLAIN해서 전체 스캔이나 인덱스 없는 정렬이 있으면 실패합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default", help="점검할 DB 별칭")
+        parser.add_argument("--plans", action="store_true", help="문제가 없는 쿼리의 실행 계획도 출력")
+
+    def handle(self, *args, **options):
+        failed = []
+        for check, plan, problems in explain.run(using=options["database"]):
+            if problems:
+                failed.append(check.name)
+                self.stdout.write(self.style.ERROR(f"FAIL {check.name}: {', '.join(problems)}"))
+            else:
+                self.stdout.write(f"ok   {check.name}")
+            if problems or options["plans"]:
+                for line in plan.splitlines():
+                    self.stdout.write(f"       {line}")
+        if failed:
+            raise CommandError(f"인덱스를 쓰지 않는 쿼리 {len(failed)}개: {', '.join(failed)}")
@@ -0,0 +1,71 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from common import loadtest
+
+
+class Command(BaseCommand):
+    help = (
+        "실행 중인 서버에 동시 연결 수를 늘려 가며 GET 요청을 보내 처리량, 지연 시간, "
+        "동시성 한계를 잽니다. sync/async 서버에 각각 실행해 비교하세요."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("base_url", help="예: http://127.0.0.1:8000")
+        parser.add_argument(
+            "--path",
+            action="append",
+            dest="paths",
+            help="요청할 경로 (여러 번 지정 가능, 기본값: /api/v1/tweets)",
+        )
+        parser.add_argument("--concurrency", default="1,8,32,64,128", help="쉼표로 구분한 동시 연결 수 단계")
+        parser.add_argument("--duration", type=float, default=10, help="단계마다 요청을 보내는 시간(초)")
+        parser.add_argument("--username", help="세션 로그인에 쓸 사용자")
+        parser.add_argument("--password", help="세션 로그인 비밀번호")
+        parser.add_argument("--max-error-rate", type=float, default=0.01)
+        parser.add_argument("--max-p99-ms", type=float, default=1000)
+        parser.add_argument("--label", default="", help="결과에 남길 서버 설명 (예: wsgi-sync, asgi-async)")
+        parser.add_argument("--output", help="결과 JSON을 저장할 파일")
+
+    def handle(self, *args, **options):
+        try:
+            levels = [int(value) for value in options["concurrency"].split(",") if value]
+        except ValueError:
+            raise CommandError("--concurrency는 쉼표로 구분한 숫자여야 합니다.")
+        if not levels or min(levels) < 1:
+            raise CommandError("--concurrency에는 1 이상의 값이 하나 이상 있어야 합니다.")
+
+        headers = {"Accept": "application/json"}
+        if options["username"]:
+            try:
+                headers["Cookie"] = loadtest.login(options["base_url"], options["username"], options["password"] or "")
+            except (OSError, RuntimeError) as exc:
+                raise CommandError(str(exc))
+
+        report = loadtest.run(
+            options["base_url"],
+            options["paths"] or ["/api/v1/tweets"],
+            levels,
+            options["duration"],
+            headers,
+            max_error_rate=options["max_error_rate"],
+            max_p99_ms=options["max_p99_ms"],
+            log=self.stdout.write,
+        )
+        result = {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "base_url": options["base_url"],
+                "label": options["label"],
+                "duration": options["duration"],
+            },
+            "paths": report,
+        }
+        for path, summary in report.items():
+            self.stdout.write(self.style.SUCCESS(f"{path}: 동시성 한계 {summary['concurrency_limit']}"))
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"결과를 {options['output']}에 저장했습니다.")
@@ -0,0 +1,35 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import autodiscover_modules
+
+from common import tasks
+
+
+class Command(BaseCommand):
+    help = "작업 큐(common.tasks)의 대기 중인 작업을 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100, help="한 번에 가져올 작업 수")
+        parser.add_argument("--sleep", type=float, default=1.0, help="대기 작업이 없을 때 쉬는 시간(초)")
+        parser.add_argument("--burst", action="store_true", help="대기 작업을 모두 실행하면 종료")
+
+    def handle(self, *args, **options):
+        # 각 앱의 tasks 모듈을 읽어 작업 함수를 등록한다
+        autodiscover_modules("tasks")
+        total_done = total_failed = 0
+        try:
+            while True:
+                tasks.release_stale()
+                done, failed = tasks.run_pending(options["batch_size"])
+                total_done += done
+                total_failed += failed
+                if done or failed:
+                    self.stderr.write(f"done {done}, failed {failed}")
+                elif options["burst"]:
+                    break
+                else:
+                    time.sleep(options["sleep"])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(f"done {total_done}, failed {total_failed}")
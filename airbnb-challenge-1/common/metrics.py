@@ -0,0 +1,183 @@
+"""URL 이름별 요청 지표
+
+common.middleware.MetricsMiddleware가 요청마다 RequestStats를 contextvar에 두고,
+모든 DB 연결에 건 execute wrapper가 쿼리 수와 SQL 시간을, serializing()이
+직렬화 시간을 그 요청에 더한다. contextvar는 sync_to_async 스레드로도 복사되므로
+async 뷰의 쿼리도 같은 요청에 잡힌다.
+
+히스토그램은 프로세스 메모리에만 있으므로 워커마다 따로 센다. Prometheus 텍스트
+형식은 GET /api/v1/metrics 로 읽는다.
+"""
+
+import bisect
+import contextlib
+import contextvars
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# (이름, 설명, 버킷, RequestStats에서 값을 읽는 함수)
+HISTOGRAMS = (
+    ("http_request_duration_seconds", "Request latency", LATENCY_BUCKETS, lambda s: s.duration),
+    ("db_queries_per_request", "SQL queries per request", QUERY_BUCKETS, lambda s: s.queries),
+    ("db_query_duration_seconds", "SQL time per request", LATENCY_BUCKETS, lambda s: s.sql_time),
+    ("serialize_duration_seconds", "Serialization time per request", LATENCY_BUCKETS, lambda s: s.serialize_time),
+    ("http_response_size_bytes", "Response body size", SIZE_BUCKETS, lambda s: s.bytes),
+)
+
+current = contextvars.ContextVar("request_stats", default=None)
+
+
+class RequestStats:
+    """요청 하나에서 잰 값 (시간은 초 단위)"""
+
+    def __init__(self, method):
+        self.method = method
+        self.view = "unmatched"
+        self.status = None
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        self.queries = 0
+        self.sql_time = 0.0
+        self.serialize_time = 0.0
+        self.bytes = 0
+
+    def finish(self):
+        self.duration = time.perf_counter() - self.started
+
+    def server_timing(self):
+        """Server-Timing 헤더 값 (밀리초)"""
+        return ", ".join(
+            [
+                f'db;dur={self.sql_time * 1000:.2f};desc="{self.queries} queries"',
+                f"serialize;dur={self.serialize_time * 1000:.2f}",
+                f"total;dur={(time.perf_counter() - self.started) * 1000:.2f}",
+            ]
+        )
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus histogram과 같은 구조)"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):
+            total += count
+            yield bound, total
+
+
+class MetricsRegistry:
+    """(view, method)별 히스토그램과 (view, method, status)별 요청 수"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.histograms = {}
+            self.requests = {}
+            self.slow_requests = {}
+
+    def observe(self, stats):
+        key = (stats.view, stats.method)
+        with self.lock:
+            histograms = self.histograms.get(key)
+            if histograms is None:
+                histograms = self.histograms[key] = [Histogram(buckets) for _, _, buckets, _ in HISTOGRAMS]
+            for histogram, (_, _, _, value) in zip(histograms, HISTOGRAMS):
+                histogram.observe(value(stats))
+            status_key = (*key, stats.status)
+            self.requests[status_key] = self.requests.get(status_key, 0) + 1
+            slow = stats.duration * 1000 >= settings.METRICS_SLOW_REQUEST_MS
+            if slow:
+                self.slow_requests[key] = self.slow_requests.get(key, 0) + 1
+        if slow:
+            logger.warning(
+                "slow request: %s %s %.1fms (%d queries, %.1fms SQL, %.1fms serialize, %d bytes)",
+                stats.method,
+                stats.view,
+                stats.duration * 1000,
+                stats.queries,
+                stats.sql_time * 1000,
+                stats.serialize_time * 1000,
+                stats.bytes,
+            )
+
+    def render(self):
+        """Prometheus 텍스트 노출 형식(0.0.4)"""
+        with self.lock:
+            lines = [
+                "# HELP http_requests_total Requests by view, method and status",
+                "# TYPE http_requests_total counter",
+            ]
+            for (view, method, status), count in sorted(self.requests.items()):
+                lines.append(f'http_requests_total{{view="{view}",method="{method}",status="{status}"}} {count}')
+            lines += [
+                f"# HELP http_slow_requests_total Requests slower than {settings.METRICS_SLOW_REQUEST_MS}ms",
+                "# TYPE http_slow_requests_total counter",
+            ]
+            for (view, method), count in sorted(self.slow_requests.items()):
+                lines.append(f'http_slow_requests_total{{view="{view}",method="{method}"}} {count}')
+            for index, (name, help_text, _, _) in enumerate(HISTOGRAMS):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+                for (view, method), histograms in sorted(self.histograms.items()):
+                    labels = f'view="{view}",method="{method}"'
+                    histogram = histograms[index]
+                    for bound, count in histogram.cumulative():
+                        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                    lines.append(f"{name}_sum{{{labels}}} {histogram.sum:g}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+def record_query(execute, sql, params, many, context):
+    """모든 DB 연결에 거는 execute wrapper (common.signals 참고)"""
+    stats = current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        stats.queries += 1
+        stats.sql_time += elapsed
+        if elapsed * 1000 >= settings.METRICS_SLOW_QUERY_MS:
+            logger.warning("slow query in %s %s: %.1fms %s", stats.method, stats.view, elapsed * 1000, sql[:500])
+
+
+@contextlib.contextmanager
+def serializing():
+    """블록 실행 시간을 현재 요청의 직렬화 시간에 더한다. (데코레이터로도 쓸 수 있다)"""
+    stats = current.get()
+    if stats is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.serialize_time += time.perf_counter() - started
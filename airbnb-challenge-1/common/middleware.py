@@ -0,0 +1,98 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from . import metrics
+
+
+class MetricsMiddleware:
+    """
+    URL 이름별 쿼리 수, SQL 시간, 직렬화 시간, 지연 시간, 응답 크기를 common.metrics에 기록하고
+    Server-Timing 헤더를 붙인다.
+
+    스트리밍 응답은 본문을 다 보낼 때 기록한다. 헤더가 먼저 나가므로 Server-Timing에는
+    본문을 만들기 전까지의 값만 들어간다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        stats = metrics.RequestStats(request.method)
+        token = metrics.current.set(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.current.reset(token)
+        return self.finish(request, response, stats)
+
+    async def __acall__(self, request):
+        stats = metrics.RequestStats(request.method)
+        token = metrics.current.set(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.current.reset(token)
+        return self.finish(request, response, stats)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # 느린 쿼리 로그에 뷰 이름이 들어가도록 URL을 해석하자마자 적어 둔다
+        stats = metrics.current.get()
+        if stats is not None:
+            stats.view = request.resolver_match.url_name or request.resolver_match.route
+
+    def finish(self, request, response, stats):
+        if request.resolver_match is not None:
+            stats.view = request.resolver_match.url_name or request.resolver_match.route
+        stats.status = response.status_code
+        response["Server-Timing"] = stats.server_timing()
+        if not response.streaming:
+            stats.bytes = len(response.content)
+            stats.finish()
+            metrics.registry.observe(stats)
+        elif response.is_async:
+            response.streaming_content = self.aiter_stream(response.streaming_content, stats)
+        else:
+            response.streaming_content = self.iter_stream(response.streaming_content, stats)
+        return response
+
+    def iter_stream(self, content, stats):
+        # 본문을 만드는 동안 실행되는 쿼리도 이 요청에 더한다
+        iterator = iter(content)
+        try:
+            while True:
+                token = metrics.current.set(stats)
+                try:
+                    chunk = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    metrics.current.reset(token)
+                stats.bytes += len(chunk)
+                yield chunk
+        finally:
+            stats.finish()
+            metrics.registry.observe(stats)
+
+    async def aiter_stream(self, content, stats):
+        iterator = aiter(content)
+        try:
+            while True:
+                token = metrics.current.set(stats)
+                try:
+                    chunk = await anext(iterator)
+                except StopAsyncIteration:
+                    break
+                finally:
+                    metrics.current.reset(token)
+                stats.bytes += len(chunk)
+                yield chunk
+        finally:
+            stats.finish()
+            metrics.registry.observe(stats)
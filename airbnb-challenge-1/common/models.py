@@ -9,3 +9,31 @@ class TimeStampedModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class Task(TimeStampedModel):
+    """common.tasks 작업 큐의 작업 한 건. 성공하면 지우고, 재시도가 끝난 실패만 남긴다."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    FAILED = "failed"
+    STATUS_CHOICES = [(QUEUED, "대기"), (RUNNING, "실행 중"), (FAILED, "실패")]
+
+    name = models.CharField(max_length=200)
+    args = models.JSONField(default=list)
+    kwargs = models.JSONField(default=dict)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=1)
+    run_at = models.DateTimeField()
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [
+            # 워커가 실행할 작업을 run_at 순서로 찾는다
+            models.Index(fields=["status", "run_at", "id"], name="task_status_run_at_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.status}, {self.attempts}/{self.max_attempts})"
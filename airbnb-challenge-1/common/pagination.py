@@ -0,0 +1,159 @@
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """(created_at, id) 기준 내림차순 커서(keyset) 페이지네이션
+
+    OFFSET 대신 마지막으로 본 행의 (created_at, id)보다 작은 행만 조회하므로
+    몇 번째 페이지든 인덱스 범위 스캔 한 번으로 끝난다.
+    """
+
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    ordering_field = "created_at"
+    invalid_cursor_message = "잘못된 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.prepare(request)
+        rows = self.slice_queryset(queryset, (self.ordering_field, "id"))
+        positions = [self.get_position(item) for item in rows]
+        return self.finish(rows, positions)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """async 뷰용 paginate_queryset(). aiterator()로 읽는다."""
+        self.prepare(request)
+        query = self.order_queryset(queryset, (self.ordering_field, "id"))
+        rows = [item async for item in query.aiterator()]
+        positions = [self.get_position(item) for item in rows]
+        return self.finish(rows, positions)
+
+    def paginate_sources(self, sources, loader, request, view=None):
+        """
+        여러 소스를 같은 커서로 잘라 병합한다.
+
+        sources는 (queryset, (정렬 필드, tiebreaker 필드)) 목록으로, 각 소스는 자기
+        인덱스로 (created_at, id) 위치만 page_size + 1개 읽는다. 병합 후 남은 id로
+        loader(ids)를 한 번 호출해 {id: 객체}를 받아 페이지를 만든다.
+        """
+        self.prepare(request)
+        positions = set()
+        for queryset, ordering in sources:
+            positions.update(self.slice_queryset(queryset.values_list(*ordering), ordering))
+        positions = sorted(positions, reverse=not self.reverse)[: self.page_size + 1]
+        objects = loader([pk for _, pk in positions])
+        positions = [position for position in positions if position[1] in objects]
+        return self.finish([objects[pk] for _, pk in positions], positions)
+
+    def prepare(self, request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.position, self.reverse = self.decode_cursor(request)
+
+    def slice_queryset(self, queryset, ordering):
+        return list(self.order_queryset(queryset, ordering))
+
+    def order_queryset(self, queryset, ordering):
+        """커서 조건과 정렬을 걸고 page_size + 1개로 자른 queryset (아직 실행하지 않음)"""
+        field, tiebreaker = ordering
+        if self.position is not None:
+            value, pk = self.position
+            op = "gt" if self.reverse else "lt"
+            # OR 조건만 있으면 SQLite는 인덱스를 처음부터 훑으므로 같은 범위를 AND 조건으로도 건다
+            queryset = queryset.filter(**{f"{field}__{op}e": value}).filter(
+                Q(**{f"{field}__{op}": value}) | Q(**{field: value, f"{tiebreaker}__{op}": pk})
+            )
+        if self.reverse:
+            queryset = queryset.order_by(field, tiebreaker)
+        else:
+            queryset = queryset.order_by(f"-{field}", f"-{tiebreaker}")
+        return queryset[: self.page_size + 1]
+
+    def finish(self, results, positions):
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        positions = positions[: self.page_size]
+
+        if self.reverse:
+            results.reverse()
+            positions.reverse()
+            self.has_previous = has_more
+            self.has_next = self.position is not None
+        else:
+            self.has_next = has_more
+            self.has_previous = self.position is not None
+
+        self.page = results
+        self.positions = positions
+        return results
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_position(self, item):
+        if isinstance(item, tuple):
+            # values_list(named=True) 행
+            return getattr(item, self.ordering_field), item.id
+        return getattr(item, self.ordering_field), item.pk
+
+    def get_next_link(self):
+        if not self.has_next or not self.positions:
+            return None
+        return self.encode_cursor(self.positions[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.positions:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.positions[0], reverse=True)
+
+    def get_paginated_response_data(self, data):
+        return {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_response_data(data))
+
+    def encode_cursor(self, position, reverse):
+        value, pk = position
+        payload = {"v": value.isoformat(), "i": pk}
+        if reverse:
+            payload["r"] = 1
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        token = base64.urlsafe_b64encode(raw).decode().rstrip("=")
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        """커서 문자열을 ((created_at, id), reverse)로 복원한다."""
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            payload = json.loads(raw)
+            value = datetime.fromisoformat(payload["v"])
+            pk = int(payload["i"])
+            reverse = bool(payload.get("r"))
+        except (TypeError, ValueError, KeyError, AttributeError):
+            raise NotFound(self.invalid_cursor_message)
+        return (value, pk), reverse
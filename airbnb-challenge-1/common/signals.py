@@ -0,0 +1,21 @@
+from django.contrib.auth.models import User
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import metrics
+from .authentication import user_cache
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """User가 바뀌면 인증 캐시에서 뺀다."""
+    user_cache.invalidate(instance.pk)
+
+
+@receiver(connection_created)
+def install_query_metrics(sender, connection, **kwargs):
+    """새 DB 연결마다 요청별 쿼리 수/SQL 시간을 세는 wrapper를 건다."""
+    if metrics.record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(metrics.record_query)
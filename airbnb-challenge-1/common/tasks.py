@@ -0,0 +1,127 @@
+"""DB 테이블 기반 작업 큐
+
+요청 안에서 끝낼 필요 없는 파생 작업(타임라인 팬아웃, 해시태그/멘션 색인 등)을
+Task 행으로 넣고 `manage.py run_worker`가 꺼내 실행한다. ATOMIC_REQUESTS는 꺼져 있으므로
+enqueue는 호출한 쪽의 트랜잭션에 작업 행을 넣을 뿐이고, 호출하는 곳(트윗 작성/수정, 일괄 작성,
+팔로우)이 쓰기와 enqueue를 transaction.atomic() 하나로 묶는다. 그래서 롤백된 쓰기의 작업은
+실행되지 않고, 커밋된 쓰기의 작업은 사라지지 않는다. 실패하면 TASKS_RETRY_DELAY초부터
+두 배씩 늘려 가며 max_attempts번까지 다시 시도한다.
+
+like_count 갱신, 응답 캐시 무효화, 트렌드 집계는 큐에 넣지 않는다. 각각 좋아요 행과 같이
+커밋돼야 하는 UPDATE 한 번, 캐시 연산 한 번, 웹 프로세스 메모리 갱신이라 작업 행을 넣는 것보다 싸다.
+
+TASKS_EAGER가 켜져 있으면(DJANGO_TASKS_EAGER=1, 테스트 설정) 큐에 넣지 않고 바로 실행한다.
+"""
+
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+# 작업 이름 -> (함수, 최대 시도 횟수)
+registry = {}
+
+
+def task(func=None, *, max_attempts=None):
+    """
+    함수를 작업으로 등록한다. 인자는 JSON으로 저장되므로 모델 대신 id를 넘긴다.
+
+    @task
+    def publish_tweets(tweet_ids): ...
+    """
+
+    def register(func):
+        name = f"{func.__module__}.{func.__name__}"
+        registry[name] = (func, max_attempts)
+        func.task_name = name
+        return func
+
+    return register(func) if func is not None else register
+
+
+def enqueue(func, *args, **kwargs):
+    """
+    작업을 큐에 넣는다. TASKS_EAGER면 바로 실행하고 결과를 돌려준다.
+
+    트랜잭션 밖에서 부르면 작업 행이 바로 커밋되므로, 쓰기와 같은 transaction.atomic() 안에서 부른다.
+    """
+    if settings.TASKS_EAGER:
+        return func(*args, **kwargs)
+    _, max_attempts = registry[func.task_name]
+    return Task.objects.create(
+        name=func.task_name,
+        args=list(args),
+        kwargs=kwargs,
+        max_attempts=max_attempts or settings.TASKS_MAX_ATTEMPTS,
+        run_at=timezone.now(),
+    )
+
+
+def release_stale():
+    """TASKS_LOCK_TIMEOUT초 넘게 실행 중인 작업(워커가 죽은 경우)을 다시 대기 상태로 돌린다."""
+    expired = timezone.now() - timedelta(seconds=settings.TASKS_LOCK_TIMEOUT)
+    return Task.objects.filter(status=Task.RUNNING, locked_at__lt=expired).update(status=Task.QUEUED, locked_at=None)
+
+
+def due(now):
+    """now까지 실행할 때가 된 대기 작업 (task_status_run_at_idx 순서)"""
+    return Task.objects.filter(status=Task.QUEUED, run_at__lte=now).order_by("run_at", "id")
+
+
+def claim(limit):
+    """
+    실행할 때가 된 작업을 limit개까지 가져와 실행 중으로 표시한다.
+
+    status=queued 조건을 건 UPDATE로 하나씩 잡으므로 워커가 여럿이어도 같은 작업을
+    두 번 실행하지 않는다.
+    """
+    now = timezone.now()
+    claimed = [
+        pk
+        for pk in due(now).values_list("pk", flat=True)[:limit]
+        if Task.objects.filter(pk=pk, status=Task.QUEUED).update(
+            status=Task.RUNNING, locked_at=now, attempts=F("attempts") + 1
+        )
+    ]
+    return list(Task.objects.filter(pk__in=claimed).order_by("run_at", "id"))
+
+
+def execute(task):
+    """작업 하나를 실행한다. 성공하면 행을 지우고 True, 실패하면 재시도를 예약하고 False."""
+    entry = registry.get(task.name)
+    try:
+        if entry is None:
+            raise LookupError(f"등록되지 않은 작업입니다: {task.name}")
+        with transaction.atomic():
+            entry[0](*task.args, **task.kwargs)
+    except Exception:
+        logger.exception("task %s #%s failed (attempt %s/%s)", task.name, task.pk, task.attempts, task.max_attempts)
+        error = traceback.format_exc()
+        if task.attempts < task.max_attempts:
+            delay = settings.TASKS_RETRY_DELAY * 2 ** (task.attempts - 1)
+            retry = {"status": Task.QUEUED, "run_at": timezone.now() + timedelta(seconds=delay)}
+        else:
+            retry = {"status": Task.FAILED}
+        Task.objects.filter(pk=task.pk).update(locked_at=None, last_error=error, **retry)
+        return False
+    task.delete()
+    return True
+
+
+def run_pending(limit=100):
+    """대기 중인 작업을 limit개까지 실행하고 (성공 수, 실패 수)를 돌려준다."""
+    done = failed = 0
+    for task in claim(limit):
+        if execute(task):
+            done += 1
+        else:
+            failed += 1
+    return done, failed
@@ -0,0 +1,18 @@
+class QueryCountAssertionsMixin:
+    """목록 엔드포인트의 쿼리 수가 행 수와 무관하게 고정인지 검증하는 TestCase 믹스인"""
+
+    def assertListQueryCount(self, url, expected, grow):
+        """
+        url을 요청했을 때 쿼리가 정확히 expected번 실행되는지 확인하고,
+        grow()로 데이터를 늘린 뒤에도 같은 횟수인지 다시 확인한다.
+        """
+        with self.assertNumQueries(expected):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        grow()
+
+        with self.assertNumQueries(expected):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
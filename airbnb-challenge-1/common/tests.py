@@ -1,3 +1,542 @@
-from django.test import TestCase
+import json
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connection, transaction
+from django.db.utils import ConnectionHandler
+from django.test import LiveServerTestCase, TestCase, override_settings
+from django.urls import include, path
+from rest_framework.test import APIClient, APIRequestFactory
+
+from config.database import database_config
+from tweets import async_views as tweet_async_views
+from tweets.models import TimelineEntry, Tweet, TweetTag
+from users import async_views as user_async_views
+
+from . import explain, metrics, tasks, throttling
+from .authentication import UserCache, UsernameAuthentication, user_cache
+from .models import Task
+
+
+class DatabaseProfileTestCase(TestCase):
+    def test_sqlite_pragmas_applied(self):
+        """Test the test connection runs the configured PRAGMAs on connect"""
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA synchronous")
+            self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+            cursor.execute("PRAGMA busy_timeout")
+            self.assertEqual(cursor.fetchone()[0], 20_000)
+
+    def test_sqlite_concurrent_writers_wait(self):
+        """Test a read-then-write transaction waits for the lock instead of failing with "database is locked\""""
+        with tempfile.TemporaryDirectory() as directory:
+            handler = ConnectionHandler({"default": database_config({}, Path(directory))})
+            with handler["default"].cursor() as cursor:
+                cursor.execute("PRAGMA journal_mode")
+                self.assertEqual(cursor.fetchone()[0], "wal")
+                cursor.execute("CREATE TABLE counter (value integer)")
+            errors = []
+
+            def increment(hold=0):
+                try:
+                    with transaction.atomic(), handler["default"].cursor() as cursor:
+                        cursor.execute("SELECT count(*) FROM counter")
+                        cursor.execute("INSERT INTO counter VALUES (%s)", [cursor.fetchone()[0] + 1])
+                        time.sleep(hold)
+                except Exception as error:
+                    errors.append(error)
+                finally:
+                    handler["default"].close()
+
+            # atomic()이 스레드마다 임시 DB의 연결을 쓰게 한다
+            with mock.patch("django.db.transaction.get_connection", lambda using=None: handler["default"]):
+                thread = threading.Thread(target=increment, kwargs={"hold": 0.3})
+                thread.start()
+                time.sleep(0.1)
+                increment()
+                thread.join()
+            with handler["default"].cursor() as cursor:
+                cursor.execute("SELECT value FROM counter ORDER BY value")
+                self.assertEqual([row[0] for row in cursor.fetchall()], [1, 2])
+            handler["default"].close()
+        self.assertEqual(errors, [])
+
+    def test_postgresql_pool_disables_persistent_connections(self):
+        """Test the psycopg pool and CONN_MAX_AGE are never combined"""
+        env = {"DJANGO_DB_ENGINE": "postgresql", "DJANGO_DB_NAME": "tweets"}
+        persistent = database_config(env, Path("."))
+        self.assertEqual(persistent["CONN_MAX_AGE"], 60)
+        self.assertTrue(persistent["CONN_HEALTH_CHECKS"])
+        self.assertNotIn("pool", persistent["OPTIONS"])
+
+        pooled = database_config({**env, "DJANGO_DB_POOL": "1", "DJANGO_DB_POOL_MAX_SIZE": "20"}, Path("."))
+        self.assertEqual(pooled["CONN_MAX_AGE"], 0)
+        self.assertFalse(pooled["CONN_HEALTH_CHECKS"])
+        self.assertEqual(pooled["OPTIONS"]["pool"]["max_size"], 20)
+
+        with self.assertRaises(ImproperlyConfigured):
+            database_config({"DJANGO_DB_ENGINE": "mysql"}, Path("."))
+
+
+class UsernameAuthenticationTestCase(TestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = User.objects.create_user(username="header-user", password="testpassword123")
+        self.factory = APIRequestFactory()
+
+    def authenticate(self, username):
+        request = self.factory.get("/", HTTP_X_USERNAME=username)
+        return UsernameAuthentication().authenticate(request)
+
+    def test_hot_user_skips_database(self):
+        """Test a cached user is authenticated without a query"""
+        with self.assertNumQueries(1):
+            user, _ = self.authenticate("header-user")
+        with self.assertNumQueries(0):
+            cached, _ = self.authenticate("header-user")
+        self.assertEqual(cached, user)
+
+    def test_save_and_delete_invalidate(self):
+        """Test saving or deleting a user drops it from the cache"""
+        self.authenticate("header-user")
+        self.user.is_active = False
+        self.user.save()
+        self.assertIsNone(self.authenticate("header-user"))
+
+        self.user.delete()
+        self.assertIsNone(user_cache.get_by_username("header-user"))
+        self.assertIsNone(self.authenticate("header-user"))
+
+    def test_unknown_user(self):
+        """Test a missing username is not authenticated"""
+        self.assertIsNone(self.authenticate("nobody"))
+
+
+class UserCacheTestCase(TestCase):
+    def test_entries_expire(self):
+        """Test entries are dropped after the TTL"""
+        cache = UserCache(maxsize=10, ttl=60)
+        user = User(pk=1, username="ttl")
+        cache.set(user)
+        self.assertEqual(cache.get_by_id(1), user)
+        with mock.patch("common.authentication.time.monotonic", return_value=10**9):
+            self.assertIsNone(cache.get_by_username("ttl"))
+
+    def test_size_is_bounded(self):
+        """Test the least recently used user is evicted"""
+        cache = UserCache(maxsize=2, ttl=60)
+        for pk in (1, 2):
+            cache.set(User(pk=pk, username=f"user{pk}"))
+        cache.get_by_id(1)
+        cache.set(User(pk=3, username="user3"))
+        self.assertIsNone(cache.get_by_id(2))
+        self.assertIsNotNone(cache.get_by_id(1))
+        self.assertIsNotNone(cache.get_by_username("user3"))
+
+
+class MetricsMiddlewareTestCase(TestCase):
+    def setUp(self):
+        metrics.registry.clear()
+        self.user = User.objects.create_user(username="metrics-user", password="testpassword123")
+        Tweet.objects.create(user=self.user, payload="hello")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def histogram(self, view, method, name):
+        index = [histogram[0] for histogram in metrics.HISTOGRAMS].index(name)
+        return metrics.registry.histograms[(view, method)][index]
+
+    def test_records_per_url_name(self):
+        """Test queries, bytes and Server-Timing are recorded under the URL name"""
+        response = self.client.get("/api/v1/tweets")
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^db;dur=[\d.]+;desc="\d+ queries", serialize;dur=[\d.]+, total;dur=',
+        )
+        self.assertEqual(metrics.registry.requests[("api_tweet_list", "GET", 200)], 1)
+        self.assertGreater(self.histogram("api_tweet_list", "GET", "db_queries_per_request").sum, 0)
+        self.assertGreater(self.histogram("api_tweet_list", "GET", "serialize_duration_seconds").sum, 0)
+        self.assertEqual(self.histogram("api_tweet_list", "GET", "http_response_size_bytes").sum, len(response.content))
+
+    def test_streaming_response_recorded_when_consumed(self):
+        """Test a streaming export is recorded after its body, including queries made while streaming"""
+        response = self.client.get("/api/v1/tweets/export")
+        self.assertNotIn(("api_tweet_export", "GET"), metrics.registry.histograms)
+        body = b"".join(response.streaming_content)
+        self.assertEqual(self.histogram("api_tweet_export", "GET", "http_response_size_bytes").sum, len(body))
+        self.assertGreater(self.histogram("api_tweet_export", "GET", "db_queries_per_request").sum, 0)
+
+    @override_settings(METRICS_SLOW_REQUEST_MS=0, METRICS_SLOW_QUERY_MS=0)
+    def test_slow_requests_logged(self):
+        """Test requests and queries over the thresholds are logged and counted"""
+        with self.assertLogs("common.metrics", "WARNING") as logs:
+            self.client.get("/api/v1/tweets")
+        self.assertTrue(any("slow query in GET api_tweet_list" in line for line in logs.output))
+        self.assertTrue(any("slow request: GET api_tweet_list" in line for line in logs.output))
+        self.assertEqual(metrics.registry.slow_requests[("api_tweet_list", "GET")], 1)
+
+    @override_settings(METRICS_TOKEN="scrape-token")
+    def test_metrics_endpoint(self):
+        """Test the Prometheus endpoint needs staff or the bearer token"""
+        self.client.get("/api/v1/tweets")
+        self.assertEqual(self.client.get("/api/v1/metrics").status_code, 403)
+
+        client = APIClient()
+        self.assertEqual(client.get("/api/v1/metrics", HTTP_AUTHORIZATION="Bearer wrong").status_code, 403)
+        response = client.get("/api/v1/metrics", HTTP_AUTHORIZATION="Bearer scrape-token")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        text = response.content.decode()
+        self.assertIn('http_requests_total{view="api_tweet_list",method="GET",status="200"} 1', text)
+        self.assertIn('http_request_duration_seconds_bucket{view="api_tweet_list",method="GET",le="+Inf"} 1', text)
+        self.assertIn('db_queries_per_request_count{view="api_tweet_list",method="GET"} 1', text)
+
+
+class ExplainQueriesTestCase(TestCase):
+    def test_hot_queries_use_indexes(self):
+        """Test every hot API query is answered from an index (fails when one regresses)"""
+        out = StringIO()
+        call_command("explain_queries", stdout=out)
+        self.assertIn("ok   api_tweet_list (cursor page)", out.getvalue())
+
+    def test_full_scan_fails(self):
+        """Test a full table scan or an unindexed sort is reported and fails the command"""
+        checks = [
+            explain.Check("payload lookup", lambda: Tweet.objects.filter(payload="x").order_by()),
+            explain.Check("payload order", lambda: Tweet.objects.order_by("payload")[:20]),
+        ]
+        results = explain.run(checks)
+        self.assertEqual(results[0][2], ["full scan of tweets_tweet"])
+        self.assertIn("sort without index", results[1][2])
+
+        out = StringIO()
+        with mock.patch.object(explain, "CHECKS", checks), self.assertRaises(CommandError):
+            call_command("explain_queries", stdout=out)
+        self.assertIn("FAIL payload lookup: full scan of tweets_tweet", out.getvalue())
+
+
+calls = []
+
+
+@tasks.task(max_attempts=2)
+def flaky_task(value):
+    calls.append(value)
+    raise RuntimeError(f"boom {value}")
+
+
+@override_settings(TASKS_EAGER=False)
+class TaskQueueTestCase(TestCase):
+    def setUp(self):
+        calls.clear()
+        self.author = User.objects.create_user(username="author", password="testpassword123")
+        self.follower = User.objects.create_user(username="follower", password="testpassword123")
+        self.client = APIClient()
+
+    def test_tweet_side_effects_run_on_worker(self):
+        """Test timeline fan-out and tag indexing wait for the worker"""
+        self.client.force_authenticate(user=self.follower)
+        self.client.post(f"/api/v1/users/{self.author.pk}/follow")
+        self.client.force_authenticate(user=self.author)
+        response = self.client.post("/api/v1/tweets", {"payload": "hello #django"}, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Task.objects.count(), 2)  # 팔로우 백필, 트윗 발행
+        self.assertFalse(TimelineEntry.objects.exists())
+        self.assertFalse(TweetTag.objects.exists())
+
+        out = StringIO()
+        call_command("run_worker", "--burst", stdout=out, stderr=StringIO())
+        self.assertIn("done 2, failed 0", out.getvalue())
+        self.assertFalse(Task.objects.exists())
+        tweet_id = response.json()["id"]
+        self.assertEqual(
+            set(TimelineEntry.objects.values_list("owner_id", "tweet_id")),
+            {(self.author.pk, tweet_id), (self.follower.pk, tweet_id)},
+        )
+        self.assertEqual(list(TweetTag.objects.values_list("tag", flat=True)), ["django"])
+
+    def test_rolled_back_write_enqueues_nothing(self):
+        """Test tasks are committed with the caller's transaction"""
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            tasks.enqueue(flaky_task, 1)
+            raise RuntimeError
+        self.assertFalse(Task.objects.exists())
+
+    def test_write_and_task_commit_together(self):
+        """Test a write is rolled back when its task row cannot be inserted"""
+        self.client.force_authenticate(user=self.author)
+        with mock.patch.object(Task.objects, "create", side_effect=DatabaseError("queue full")):
+            with self.assertRaises(DatabaseError):
+                self.client.post("/api/v1/tweets", {"payload": "hello"}, format="json")
+            with self.assertRaises(DatabaseError):
+                self.client.post(f"/api/v1/users/{self.follower.pk}/follow")
+        self.assertFalse(Tweet.objects.exists())
+        self.assertFalse(self.author.following_set.exists())
+
+    def test_retry_then_fail(self):
+        """Test a failing task is retried with backoff and then kept as failed"""
+        task = tasks.enqueue(flaky_task, 7)
+        with self.assertLogs("common.tasks", "ERROR"):
+            self.assertEqual(tasks.run_pending(), (0, 1))
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.attempts), (Task.QUEUED, 1))
+        self.assertGreater(task.run_at, task.created_at)
+        self.assertEqual(tasks.run_pending(), (0, 0))  # 아직 재시도 시각이 아니다
+
+        Task.objects.update(run_at=task.created_at)
+        with self.assertLogs("common.tasks", "ERROR"):
+            self.assertEqual(tasks.run_pending(), (0, 1))
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.attempts), (Task.FAILED, 2))
+        self.assertIn("RuntimeError: boom 7", task.last_error)
+        self.assertEqual(calls, [7, 7])
+
+    def test_release_stale(self):
+        """Test tasks left running by a dead worker are queued again"""
+        task = tasks.enqueue(flaky_task, 1)
+        self.assertEqual(len(tasks.claim(10)), 1)
+        self.assertEqual(tasks.claim(10), [])
+        Task.objects.update(locked_at=task.created_at - timedelta(hours=1))
+        self.assertEqual(tasks.release_stale(), 1)
+        self.assertEqual([claimed.pk for claimed in tasks.claim(10)], [task.pk])
+
+    @override_settings(TASKS_EAGER=True)
+    def test_eager(self):
+        """Test TASKS_EAGER runs the task inline without a row"""
+        with self.assertRaises(RuntimeError):
+            tasks.enqueue(flaky_task, 3)
+        self.assertEqual(calls, [3])
+        self.assertFalse(Task.objects.exists())
+
+
+class BenchmarkCommandTestCase(TestCase):
+    def test_benchmark_covers_every_route(self):
+        """Test manage.py benchmark seeds data and reports every named route"""
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "benchmark.json"
+            call_command(
+                "benchmark",
+                "--seed",
+                users=5,
+                tweets=20,
+                likes=20,
+                follows=2,
+                iterations=2,
+                output=str(output),
+                stderr=StringIO(),
+            )
+            report = json.loads(output.read_text())
+
+        self.assertEqual(report["skipped"], [])
+        self.assertEqual(report["meta"]["tweets"], Tweet.objects.count())
+        for name, result in report["routes"].items():
+            with self.subTest(route=name):
+                self.assertTrue(all(int(code) < 400 for code in result["status_codes"]), result)
+                self.assertIn("p99", result["latency_ms"])
+                self.assertGreaterEqual(result["queries"]["min"], 0)
+
+
+# AsyncAPIViewTestCase용 URLconf: async 뷰를 async/ 아래에, 나머지는 원래 라우트를 연결한다
+urlpatterns = [
+    path("async/api/v1/tweets", tweet_async_views.TweetListCreateAPIView.as_view()),
+    path("async/api/v1/tweets/<int:pk>", tweet_async_views.TweetDetailAPIView.as_view()),
+    path("async/api/v1/users", user_async_views.UserListCreateAPIView.as_view()),
+    path("async/api/v1/users/<int:pk>", user_async_views.UserDetailAPIView.as_view()),
+    path("async/api/v1/users/<int:pk>/tweets", user_async_views.UserTweetsAPIView.as_view()),
+    path("", include("config.urls")),
+]
+
+
+@override_settings(ROOT_URLCONF="common.tests")
+class AsyncAPIViewTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="alice", password="password123")
+        self.other = User.objects.create_user(username="bob", password="password123")
+        for i in range(3):
+            Tweet.objects.create(user=self.other, payload=f"트윗 {i}")
+        self.client.force_login(self.user)
+
+    def test_responses_match_sync_views(self):
+        """Test async list/detail views return the same JSON as the sync views"""
+        tweet = Tweet.objects.first()
+        for url in (
+            "/api/v1/tweets?page_size=2",
+            f"/api/v1/tweets/{tweet.pk}",
+            "/api/v1/users",
+            f"/api/v1/users/{self.other.pk}",
+            f"/api/v1/users/{self.other.pk}/tweets?page_size=2",
+        ):
+            with self.subTest(url=url):
+                expected = self.client.get(url)
+                response = self.client.get(f"/async{url}")
+                self.assertEqual(response.status_code, expected.status_code)
+                body = json.loads(response.content.replace(b"/async/", b"/"))
+                self.assertEqual(body, expected.json())
+
+    def test_create_update_delete(self):
+        """Test async create runs fan-out and owner checks match the sync view"""
+        response = self.client.post("/async/api/v1/tweets", {"payload": "async #tweet"}, format="json")
+        self.assertEqual(response.status_code, 201)
+        tweet_id = response.json()["id"]
+        self.assertTrue(TimelineEntry.objects.filter(owner=self.user, tweet_id=tweet_id).exists())
+
+        response = self.client.post("/async/api/v1/tweets", {"payload": ""}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.put(f"/async/api/v1/tweets/{tweet_id}", {"payload": "edited"}, format="json")
+        self.assertEqual(response.json()["payload"], "edited")
+        other_tweet = Tweet.objects.filter(user=self.other).first()
+        response = self.client.delete(f"/async/api/v1/tweets/{other_tweet.pk}")
+        self.assertEqual(response.status_code, 403)
+        response = self.client.delete(f"/async/api/v1/tweets/{tweet_id}")
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Tweet.objects.filter(pk=tweet_id).exists())
+
+    def test_authentication_and_errors(self):
+        """Test async views reject anonymous requests and map errors like DRF"""
+        response = self.client.get("/async/api/v1/tweets/999999")
+        self.assertEqual(response.status_code, 404)
+        response = self.client.patch("/async/api/v1/tweets/999999", {}, format="json")
+        self.assertEqual(response.status_code, 405)
+
+        self.client.logout()
+        self.assertEqual(self.client.get("/async/api/v1/tweets").status_code, 403)
+        self.assertEqual(self.client.get("/async/api/v1/users").status_code, 401)
+        response = self.client.post(
+            "/async/api/v1/users",
+            {"username": "carol", "password": "password123", "password_confirm": "password123"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+
+
+@override_settings(ROOT_URLCONF="common.tests", THROTTLE_ENABLED=True)
+class ThrottleTestCase(TestCase):
+    def setUp(self):
+        throttling.store.clear()
+        self.addCleanup(throttling.store.clear)
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="alice", password="password123")
+
+    def login(self, username="alice", password="wrong", ip="10.0.0.1", forwarded_for=None):
+        headers = {"HTTP_X_FORWARDED_FOR": forwarded_for} if forwarded_for else {}
+        data = {"username": username, "password": password}
+        return self.client.post("/api/v1/users/login", data, format="json", REMOTE_ADDR=ip, **headers)
+
+    def test_refill(self):
+        """Test a bucket refills at capacity / period and reports the wait for missing tokens"""
+        self.assertEqual(throttling.parse_rate("10/min"), (10, 10 / 60))
+        self.assertEqual(throttling.refill_and_take(0, 0, 10, 1, 1, 3), (2, 0))
+        self.assertEqual(throttling.refill_and_take(5, 0, 10, 1, 1, 100), (9, 0))
+        self.assertEqual(throttling.refill_and_take(0.5, 0, 10, 0.5, 2, 1), (1, 2))
+
+    def test_login_limited_per_ip_with_retry_after(self):
+        """Test login attempts past the IP limit get 429 with Retry-After while other IPs still pass"""
+        for i in range(10):
+            self.assertEqual(self.login(username=f"user{i}").status_code, 400)
+        response = self.login(username="user10")
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response["Retry-After"]), 1)
+        self.assertEqual(self.login(username="user10", ip="10.0.0.2").status_code, 400)
+
+    def test_spoofed_forwarded_for_ignored(self):
+        """Test a client-supplied X-Forwarded-For does not give it a fresh login bucket"""
+        for i in range(10):
+            self.assertEqual(self.login(username=f"user{i}", forwarded_for=f"192.0.2.{i}").status_code, 400)
+        self.assertEqual(self.login(username="user10", forwarded_for="192.0.2.99").status_code, 429)
+
+    @override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "NUM_PROXIES": 1})
+    def test_forwarded_for_trusted_behind_proxy(self):
+        """Test NUM_PROXIES=1 keys the bucket on the address the proxy appended"""
+        for _ in range(5):
+            self.assertEqual(self.login(ip="10.9.9.9", forwarded_for="198.51.100.1").status_code, 400)
+        self.assertEqual(self.login(ip="10.9.9.9", forwarded_for="198.51.100.1").status_code, 429)
+        self.assertEqual(self.login(ip="10.9.9.9", forwarded_for="198.51.100.2").status_code, 400)
+
+    def test_login_limited_per_ip_and_username(self):
+        """Test one IP is limited per account without locking the account out for other IPs"""
+        for _ in range(5):
+            self.assertEqual(self.login().status_code, 400)
+        self.assertEqual(self.login().status_code, 429)
+        self.assertEqual(self.login(username="ALICE").status_code, 429)
+        self.assertEqual(self.login(username="bob").status_code, 400)
+        self.assertEqual(self.login(password="password123", ip="10.0.0.2").status_code, 200)
+
+    def test_login_limited_per_account(self):
+        """Test one account is limited even when attempts come from different IPs"""
+        with mock.patch.dict(throttling.api_settings.DEFAULT_THROTTLE_RATES, {"login_account": "3/min"}):
+            for i in range(3):
+                self.assertEqual(self.login(ip=f"10.0.1.{i}").status_code, 400)
+            self.assertEqual(self.login(ip="10.0.1.9").status_code, 429)
+            self.assertEqual(self.login(username="bob", ip="10.0.1.9").status_code, 400)
+
+    def test_batch_costs_one_token_per_tweet(self):
+        """Test a batch spends as many tweet_create tokens as it has tweets"""
+        self.client.force_authenticate(user=self.user)
+        batch = [{"payload": f"트윗 {i}"} for i in range(50)]
+        self.assertEqual(self.client.post("/api/v1/tweets/batch", batch, format="json").status_code, 201)
+        response = self.client.post("/api/v1/tweets/batch", batch[:20], format="json")
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(self.client.post("/api/v1/tweets", {"payload": "one"}, format="json").status_code, 201)
+        self.assertEqual(self.client.get("/api/v1/tweets").status_code, 200)
+
+    def test_batch_delete_costs_one_token_per_id(self):
+        """Test a batch delete spends as many tweet_delete tokens as it has ids"""
+        self.client.force_authenticate(user=self.user)
+        with mock.patch.dict(throttling.api_settings.DEFAULT_THROTTLE_RATES, {"tweet_delete": "10/min"}):
+            response = self.client.delete("/api/v1/tweets/batch", {"ids": list(range(1, 9))}, format="json")
+            self.assertEqual(response.status_code, 200)
+            response = self.client.delete("/api/v1/tweets/batch", {"ids": [9, 10, 11]}, format="json")
+            self.assertEqual(response.status_code, 429)
+            self.assertEqual(response["Retry-After"], "6")
+            # 삭제 버킷은 작성 버킷과 따로 센다
+            self.assertEqual(self.client.post("/api/v1/tweets", {"payload": "one"}, format="json").status_code, 201)
+
+    def test_async_views_throttled(self):
+        """Test async views apply the same throttles and copy Retry-After"""
+        self.client.force_login(self.user)
+        with mock.patch.dict(throttling.api_settings.DEFAULT_THROTTLE_RATES, {"read": "2/min"}):
+            self.assertEqual(self.client.get("/async/api/v1/tweets").status_code, 200)
+            self.assertEqual(self.client.get("/async/api/v1/users").status_code, 200)
+            response = self.client.get("/async/api/v1/tweets")
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "30")
+
+    @override_settings(THROTTLE_ENABLED=False)
+    def test_disabled(self):
+        """Test THROTTLE_ENABLED=False lets every request through"""
+        for _ in range(11):
+            self.assertEqual(self.login().status_code, 400)
+
+
+class LoadTestCommandTestCase(LiveServerTestCase):
+    def test_loadtest_reports_each_level(self):
+        """Test manage.py loadtest logs in and measures every concurrency level"""
+        User.objects.create_user(username="loader", password="password123")
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "loadtest.json"
+            call_command(
+                "loadtest",
+                self.live_server_url,
+                concurrency="1,2",
+                duration=0.2,
+                username="loader",
+                password="password123",
+                output=str(output),
+                stdout=StringIO(),
+            )
+            report = json.loads(output.read_text())
+
+        summary = report["paths"]["/api/v1/tweets"]
+        self.assertEqual([level["concurrency"] for level in summary["levels"]], [1, 2])
+        self.assertEqual(summary["concurrency_limit"], 2)
+        self.assertEqual(summary["levels"][0]["error_rate"], 0)
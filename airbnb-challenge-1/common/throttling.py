@@ -0,0 +1,212 @@
+"""토큰 버킷 요청 제한
+
+scope마다 DRF의 DEFAULT_THROTTLE_RATES("횟수/기간")를 버킷 크기와 충전 속도로 쓴다.
+예: "10/min"이면 한 번에 10번까지 몰아서 보낼 수 있고 6초에 한 번씩 다시 채워진다.
+DRF의 SimpleRateThrottle처럼 요청 시각 목록을 들고 있지 않으므로 요청마다 O(1)이다.
+
+버킷 저장소는 THROTTLE_BACKEND로 고른다.
+- memory: 프로세스 내 LRU dict (기본값, 워커마다 따로 센다)
+- cache: Django 캐시 THROTTLE_CACHE 별칭 (여러 워커가 공유, 읽고 쓰기가 원자적이지 않아 경합 시 조금 느슨하다)
+
+제한에 걸리면 DRF가 429와 Retry-After 헤더(wait())로 응답한다.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+
+class MemoryBucketStore:
+    """크기 제한(LRU)이 있는 프로세스 내 버킷 저장소"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key, capacity, rate, cost, now):
+        """cost개 토큰을 꺼낸다. (허용 여부, 다음에 허용될 때까지 남은 초)"""
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (capacity, now))
+            tokens, wait = refill_and_take(tokens, updated, capacity, rate, cost, now)
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+        return wait == 0, wait
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+class CacheBucketStore:
+    """Django 캐시 버킷 저장소 (프로세스 간 공유)"""
+
+    def __init__(self, alias):
+        self.alias = alias
+
+    def take(self, key, capacity, rate, cost, now):
+        cache = caches[self.alias]
+        tokens, updated = cache.get(key, (capacity, now))
+        tokens, wait = refill_and_take(tokens, updated, capacity, rate, cost, now)
+        # 버킷이 다 찰 시간이 지나면 기본값과 같으므로 지워도 된다
+        cache.set(key, (tokens, now), math.ceil((capacity - tokens) / rate) + 1)
+        return wait == 0, wait
+
+    def clear(self):
+        caches[self.alias].clear()
+
+
+def refill_and_take(tokens, updated, capacity, rate, cost, now):
+    """지난 시간만큼 채운 뒤 cost개를 꺼낸다. 모자라면 그대로 두고 기다릴 시간을 돌려준다."""
+    tokens = min(capacity, tokens + (now - updated) * rate)
+    if tokens >= cost:
+        return tokens - cost, 0
+    return tokens, (cost - tokens) / rate
+
+
+def make_store():
+    if settings.THROTTLE_BACKEND == "cache":
+        return CacheBucketStore(settings.THROTTLE_CACHE)
+    return MemoryBucketStore(settings.THROTTLE_MAX_KEYS)
+
+
+store = make_store()
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    scope별 토큰 버킷 제한. 로그인 사용자는 사용자별로, 아니면 IP별로 센다.
+
+    methods에 들어 있는 메서드만 제한하고, get_cost()로 요청 하나가 쓰는 토큰 수를 바꿀 수 있다.
+    """
+
+    scope = None
+    methods = None
+
+    def allow_request(self, request, view):
+        if not settings.THROTTLE_ENABLED:
+            return True
+        if self.methods is not None and request.method not in self.methods:
+            return True
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+        ident = self.get_ident_key(request)
+        if rate is None or ident is None:
+            return True
+        capacity, per_second = parse_rate(rate)
+        cost = min(self.get_cost(request), capacity)
+        # cache 저장소는 여러 프로세스가 같은 시각을 보아야 하므로 벽시계를 쓴다
+        allowed, self.retry_after = store.take(
+            f"throttle:{self.scope}:{ident}", capacity, per_second, cost, time.time()
+        )
+        return allowed
+
+    def get_ident_key(self, request):
+        user = request.user
+        if user is not None and user.is_authenticated:
+            return f"user:{user.pk}"
+        return f"ip:{self.get_ident(request)}"
+
+    def get_cost(self, request):
+        return 1
+
+    def wait(self):
+        return self.retry_after
+
+
+def parse_rate(rate):
+    """ "횟수/기간" -> (버킷 크기, 초당 충전 토큰 수)"""
+    num, period = rate.split("/")
+    seconds = {"s": 1, "m": 60, "h": 3600, "d": 86400}[period[0]]
+    return int(num), int(num) / seconds
+
+
+class ReadThrottle(TokenBucketThrottle):
+    """조회(GET/HEAD/OPTIONS) 요청"""
+
+    scope = "read"
+    methods = SAFE_METHODS
+
+
+class TweetCreateThrottle(TokenBucketThrottle):
+    """트윗 작성. 일괄 작성은 트윗 수만큼 토큰을 쓴다."""
+
+    scope = "tweet_create"
+    methods = ("POST",)
+
+    def get_cost(self, request):
+        if isinstance(request.data, list):
+            return max(1, len(request.data))
+        return 1
+
+
+class TweetDeleteThrottle(TokenBucketThrottle):
+    """트윗 일괄 삭제. 요청한 id 수만큼 토큰을 쓴다."""
+
+    scope = "tweet_delete"
+    methods = ("DELETE",)
+
+    def get_cost(self, request):
+        ids = request.data.get("ids") if hasattr(request.data, "get") else None
+        if isinstance(ids, list):
+            return max(1, len(ids))
+        return 1
+
+
+class LoginThrottle(TokenBucketThrottle):
+    """비밀번호 해시를 계산하는 요청(로그인, 회원가입, 비밀번호 변경)의 IP별 제한"""
+
+    scope = "login"
+    methods = ("POST", "PUT")
+
+    def get_ident_key(self, request):
+        return f"ip:{self.get_ident(request)}"
+
+
+class LoginUsernameThrottle(TokenBucketThrottle):
+    """
+    (IP, username)별 로그인 시도 제한. 한 곳에서 한 계정을 두드리는 경우를 막는다.
+
+    username만으로 세면 누구나 남의 계정을 잠글 수 있으므로 IP를 같이 쓴다.
+    """
+
+    scope = "login_username"
+    methods = ("POST",)
+
+    def get_ident_key(self, request):
+        username = login_username(request)
+        if username is None:
+            return None
+        return f"ip:{self.get_ident(request)}:username:{username}"
+
+
+class LoginAccountThrottle(TokenBucketThrottle):
+    """
+    username별 로그인 시도 제한 (여러 IP에서 한 계정을 두드리는 경우).
+
+    이 제한에 걸리면 그 계정은 모든 IP에서 로그인할 수 없으므로 한도를 넉넉하게 둔다.
+    """
+
+    scope = "login_account"
+    methods = ("POST",)
+
+    def get_ident_key(self, request):
+        username = login_username(request)
+        if username is None:
+            return None
+        return f"username:{username}"
+
+
+def login_username(request):
+    """요청 본문의 username (대소문자 구분 없이), 없으면 None"""
+    username = request.data.get("username") if hasattr(request.data, "get") else None
+    if not isinstance(username, str) or not username:
+        return None
+    return username.casefold()
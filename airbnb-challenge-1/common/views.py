@@ -1,3 +1,111 @@
-from django.shortcuts import render
+"""async(ASGI) API 뷰 기반 클래스
 
-# Create your views here.
+DRF APIView는 핸들러를 동기로만 실행하므로 ASGI에서는 요청마다 sync_to_async
+스레드를 하나씩 쓴다. AsyncAPIView는 Django의 async View 위에서 DRF의 Request
+(파서, query_params), 예외 처리기, JSON 렌더러 형식만 빌려 와 async 핸들러를
+이벤트 루프에서 바로 실행한다. 인증은 세션(그리고 켜져 있으면 X-USERNAME)만
+지원한다. 요청 제한은 DRF와 같이 throttle_classes로 건다.
+"""
+
+import secrets
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.decorators import classonlymethod
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.permissions import SAFE_METHODS, BasePermission
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.views import APIView, exception_handler
+
+from . import metrics
+from .authentication import UsernameAuthentication
+from .renderers import dumps
+
+
+class AsyncAPIView(View):
+    """async def get/post/... 핸들러를 쓰는 API 뷰"""
+
+    # True면 DRF IsAuthenticated처럼 로그인하지 않은 요청을 403으로 거절한다
+    login_required = True
+    parser_classes = [JSONParser, FormParser, MultiPartParser]
+    throttle_classes = api_settings.DEFAULT_THROTTLE_CLASSES
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        # DRF APIView와 같이 CSRF는 세션으로 인증된 요청에만 authenticate()에서 검사한다
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        request = Request(request, parsers=[parser() for parser in self.parser_classes])
+        self.request = request
+        try:
+            handler = getattr(self, request.method.lower(), None)
+            if request.method.lower() not in self.http_method_names or handler is None:
+                raise exceptions.MethodNotAllowed(request.method)
+            await self.authenticate(request)
+            self.check_throttles(request)
+            return await handler(request, *args, **kwargs)
+        except Exception as exc:
+            if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+                # 세션 인증에는 WWW-Authenticate 헤더가 없으므로 DRF와 같이 403으로 응답한다
+                exc.status_code = status.HTTP_403_FORBIDDEN
+            response = exception_handler(exc, {"view": self, "args": args, "kwargs": kwargs, "request": request})
+            if response is None:
+                raise
+            rendered = self.render(response.data, response.status_code)
+            for header in ("Retry-After", "WWW-Authenticate"):
+                if header in response:
+                    rendered[header] = response[header]
+            return rendered
+
+    async def authenticate(self, request):
+        user = await request._request.auser()
+        if user.is_authenticated:
+            if request.method not in SAFE_METHODS:
+                SessionAuthentication().enforce_csrf(request)
+        elif settings.USERNAME_AUTH_ENABLED:
+            result = await sync_to_async(UsernameAuthentication().authenticate)(request)
+            if result is not None:
+                user = result[0]
+        request.user = user
+        if self.login_required and not user.is_authenticated:
+            raise exceptions.NotAuthenticated()
+
+    def check_throttles(self, request):
+        """DRF APIView.check_throttles()와 같다. 토큰 버킷은 O(1)이라 이벤트 루프에서 바로 검사한다."""
+        throttles = [throttle_class() for throttle_class in self.throttle_classes]
+        waits = [throttle.wait() for throttle in throttles if not throttle.allow_request(request, self)]
+        if waits:
+            raise exceptions.Throttled(max(waits))
+
+    def render(self, data, status_code=status.HTTP_200_OK):
+        """DRF JSONRenderer와 같은 바이트의 JSON 응답"""
+        if data is None:
+            return HttpResponse(status=status_code)
+        return HttpResponse(dumps(data), status=status_code, content_type="application/json")
+
+
+class CanReadMetrics(BasePermission):
+    """관리자, 또는 METRICS_TOKEN이 설정돼 있으면 `Authorization: Bearer <토큰>`을 보낸 요청"""
+
+    def has_permission(self, request, view):
+        if request.user and request.user.is_staff:
+            return True
+        token = settings.METRICS_TOKEN
+        header = request.headers.get("Authorization", "")
+        return bool(token) and secrets.compare_digest(header, f"Bearer {token}")
+
+
+class MetricsAPIView(APIView):
+    """URL 이름별 요청 지표 (Prometheus 텍스트 형식)"""
+
+    permission_classes = [CanReadMetrics]
+
+    def get(self, request):
+        return HttpResponse(metrics.registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
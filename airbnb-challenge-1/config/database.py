@@ -0,0 +1,72 @@
+"""환경 변수로 고르는 데이터베이스 설정 프로파일
+
+DJANGO_DB_ENGINE=sqlite(기본값) / postgresql
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+
+# 연결할 때마다 실행하는 SQLite PRAGMA
+# - WAL: 읽기와 쓰기가 서로 막지 않는다
+# - synchronous=NORMAL: WAL에서는 커밋마다 fsync하지 않아도 DB가 깨지지 않는다
+# - busy_timeout: 다른 연결이 쓰는 중이면 바로 실패하지 않고 기다린다
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,  # 음수는 KiB 단위 (64MiB)
+    "busy_timeout": 20_000,
+    "temp_store": "MEMORY",
+}
+
+
+def sqlite(env, base_dir):
+    return {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": env.get("DJANGO_DB_NAME") or base_dir / "db.sqlite3",
+        "OPTIONS": {
+            "init_command": "".join(f"PRAGMA {name}={value};" for name, value in SQLITE_PRAGMAS.items()),
+            # 트랜잭션을 BEGIN IMMEDIATE로 시작해 쓰기 잠금을 처음부터 잡는다. DEFERRED로
+            # 시작해 읽기 후 쓰기로 올리면 busy_timeout을 기다리지 않고 "database is locked"가 난다.
+            "transaction_mode": "IMMEDIATE",
+            "timeout": SQLITE_PRAGMAS["busy_timeout"] / 1000,
+        },
+    }
+
+
+def postgresql(env):
+    """
+    PostgreSQL (psycopg 3 필요: `uv add "psycopg[binary,pool]"`)
+
+    DJANGO_DB_POOL=1이면 psycopg_pool 연결 풀을 쓴다. 풀은 요청이 끝날 때 연결을
+    돌려받으므로 CONN_MAX_AGE는 0이어야 한다. 풀을 쓰지 않으면 CONN_MAX_AGE초 동안
+    연결을 재사용하고, CONN_HEALTH_CHECKS로 끊긴 연결을 요청 시작 때 걸러낸다.
+    """
+    pool = env.get("DJANGO_DB_POOL", "0") == "1"
+    options = {}
+    if pool:
+        options["pool"] = {
+            "min_size": int(env.get("DJANGO_DB_POOL_MIN_SIZE", 2)),
+            "max_size": int(env.get("DJANGO_DB_POOL_MAX_SIZE", 10)),
+            "timeout": float(env.get("DJANGO_DB_POOL_TIMEOUT", 10)),
+        }
+    conn_max_age = 0 if pool else int(env.get("DJANGO_DB_CONN_MAX_AGE", 60))
+    return {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": env.get("DJANGO_DB_NAME", "airbnb_challenge"),
+        "USER": env.get("DJANGO_DB_USER", ""),
+        "PASSWORD": env.get("DJANGO_DB_PASSWORD", ""),
+        "HOST": env.get("DJANGO_DB_HOST", ""),
+        "PORT": env.get("DJANGO_DB_PORT", ""),
+        "CONN_MAX_AGE": conn_max_age,
+        "CONN_HEALTH_CHECKS": conn_max_age > 0,
+        "OPTIONS": options,
+    }
+
+
+def database_config(env, base_dir):
+    engine = env.get("DJANGO_DB_ENGINE", "sqlite")
+    if engine == "sqlite":
+        return sqlite(env, base_dir)
+    if engine == "postgresql":
+        return postgresql(env)
+    raise ImproperlyConfigured(f"DJANGO_DB_ENGINE은 sqlite 또는 postgresql이어야 합니다: {engine!r}")
@@ -10,8 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from .database import database_config
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -48,6 +51,8 @@ INSTALLED_APPS = CUSTOM_APPS + [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # 세션/인증 쿼리까지 요청 지표에 넣도록 앞쪽에 둔다
+    "common.middleware.MetricsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -62,13 +67,22 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [],
-        "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
             ],
+            # 컴파일한 템플릿을 프로세스에 보관해 요청마다 파일을 다시 읽고 파싱하지 않는다
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
         },
     },
 ]
@@ -79,14 +93,123 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# DJANGO_DB_ENGINE=sqlite(기본값, WAL/PRAGMA 튜닝) / postgresql (config/database.py 참고)
 DATABASES = {
+    "default": database_config(os.environ, BASE_DIR),
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+# locmem: 프로세스 내 LRU (기본값) / file: 파일 캐시 / dummy: 캐시 끄기
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "dummy": "django.core.cache.backends.dummy.DummyCache",
+}
+CACHE_BACKEND = os.environ.get("DJANGO_CACHE_BACKEND", "locmem")
+
+CACHES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": str(BASE_DIR / ".cache" / "default") if CACHE_BACKEND == "file" else "default",
+    },
+    # 트윗 목록/상세 API 응답 캐시
+    "responses": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": str(BASE_DIR / ".cache" / "responses") if CACHE_BACKEND == "file" else "responses",
+        "TIMEOUT": int(os.environ.get("DJANGO_RESPONSE_CACHE_TIMEOUT", 60)),
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.environ.get("DJANGO_RESPONSE_CACHE_MAX_ENTRIES", 10_000)),
+        },
+    },
 }
 
 
+# 캐시된 트윗 목록의 like_count를 다시 읽기까지의 시간(초). 좋아요는 목록 캐시를 무효화하지 않는다
+RESPONSE_CACHE_COUNTS_TTL = int(os.environ.get("DJANGO_RESPONSE_CACHE_COUNTS_TTL", 5))
+
+
+# Django REST framework
+# https://www.django-rest-framework.org/api-guide/settings/
+
+# X-USERNAME 헤더 인증은 비밀번호 확인이 없으므로 개발/벤치마크에서만 켠다
+USERNAME_AUTH_ENABLED = os.environ.get("DJANGO_USERNAME_AUTH", "0") == "1"
+
+REST_FRAMEWORK = {
+    # FastJSONRenderer는 JSONRenderer와 같은 바이트를 더 빠르게 만든다
+    "DEFAULT_RENDERER_CLASSES": [
+        "common.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "rest_framework.authentication.SessionAuthentication",
+        *(["common.authentication.UsernameAuthentication"] if USERNAME_AUTH_ENABLED else []),
+    ],
+    # 모든 조회에 read 제한. 작성/로그인 제한은 해당 뷰의 throttle_classes에 있다 (common.throttling)
+    "DEFAULT_THROTTLE_CLASSES": ["common.throttling.ReadThrottle"],
+    # 토큰 버킷 크기/기간: "10/min"이면 10번까지 몰아서, 이후 6초에 한 번
+    "DEFAULT_THROTTLE_RATES": {
+        "read": os.environ.get("DJANGO_THROTTLE_READ", "600/min"),
+        "tweet_create": os.environ.get("DJANGO_THROTTLE_TWEET_CREATE", "60/min"),
+        "tweet_delete": os.environ.get("DJANGO_THROTTLE_TWEET_DELETE", "100/min"),
+        "login": os.environ.get("DJANGO_THROTTLE_LOGIN", "10/min"),
+        "login_username": os.environ.get("DJANGO_THROTTLE_LOGIN_USERNAME", "5/min"),
+        "login_account": os.environ.get("DJANGO_THROTTLE_LOGIN_ACCOUNT", "100/hour"),
+    },
+    # IP별 제한 키(get_ident())를 정할 때 믿을 X-Forwarded-For 프록시 수. 0이면 REMOTE_ADDR만 쓴다
+    # 지정하지 않으면 DRF가 클라이언트가 보낸 X-Forwarded-For를 그대로 믿어 버킷을 마음대로 바꿀 수 있다
+    "NUM_PROXIES": int(os.environ.get("DJANGO_NUM_PROXIES", 0)),
+}
+
+# 요청 제한 (common.throttling). 테스트 설정(config.test_settings)에서는 끈다
+THROTTLE_ENABLED = os.environ.get("DJANGO_THROTTLE", "1") == "1"
+# memory: 프로세스 내 LRU / cache: THROTTLE_CACHE 캐시 별칭 (워커 간 공유)
+THROTTLE_BACKEND = os.environ.get("DJANGO_THROTTLE_BACKEND", "memory")
+THROTTLE_CACHE = "default"
+THROTTLE_MAX_KEYS = 100_000
+
+# 목록/상세/작성 API 뷰 구현: sync(DRF APIView) / async(common.views.AsyncAPIView, ASGI용)
+API_VIEWS = os.environ.get("DJANGO_API_VIEWS", "sync")
+
+# common.authentication.user_cache 크기(사용자 수)와 TTL(초)
+USER_CACHE_MAX_SIZE = 10_000
+USER_CACHE_TTL = 300
+
+
+# Sessions and authentication
+# https://docs.djangoproject.com/en/5.2/topics/http/sessions/#configuring-the-session-engine
+
+# db: 기본값 / cached_db: 캐시 우선 읽기 / cache: 캐시만 / signed_cookies: 서버 저장소 없음
+SESSION_BACKENDS = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "cache": "django.contrib.sessions.backends.cache",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+}
+SESSION_BACKEND = os.environ.get("DJANGO_SESSION_BACKEND", "db")
+SESSION_ENGINE = SESSION_BACKENDS[SESSION_BACKEND]
+
+# 세션을 DB에서 읽지 않는 cache/signed_cookies에서만 세션 사용자를 프로세스 내 user_cache로
+# 찾는다. 다른 프로세스에서 바뀐 비활성화/비밀번호는 USER_CACHE_TTL초까지 늦게 반영된다.
+AUTHENTICATION_BACKENDS = [
+    "common.backends.CachedModelBackend"
+    if SESSION_BACKEND in ("cache", "signed_cookies")
+    else "django.contrib.auth.backends.ModelBackend"
+]
+
+# 로그인 시 check_password()가 첫 번째 hasher와 다른 해시(또는 반복 횟수가 낮은 해시)를
+# 자동으로 다시 저장한다. 테스트용 MD5 hasher는 config.test_settings에만 있다.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -127,3 +250,80 @@ STATIC_URL = "static/"
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# manage.py test는 config.test_settings.OVERRIDES를 적용한 채로 실행한다
+TEST_RUNNER = "config.test_runner.TestRunner"
+
+
+# tweet_list HTML의 트윗 카드 조각 캐시 시간(초). 키에 updated_at이 들어가므로 수정되면 새로 만든다
+TWEET_FRAGMENT_CACHE_TIMEOUT = 600
+
+
+# Home timeline (fan-out-on-write)
+
+# 타임라인마다 유지하는 최대 항목 수
+TIMELINE_MAX_LENGTH = 800
+
+# 팔로워가 이보다 많은 작성자는 팬아웃하지 않고 읽기 시점에 병합한다
+TIMELINE_FANOUT_FOLLOWER_LIMIT = 10_000
+
+# 팬아웃 때 타임라인마다 길이 제한을 검사할 확률 (1이면 매번)
+TIMELINE_TRIM_PROBABILITY = float(os.environ.get("DJANGO_TIMELINE_TRIM_PROBABILITY", 0.02))
+
+TIMELINE_CELEBRITY_CACHE_TIMEOUT = 300
+
+
+# Trends (tweets.trends)
+
+# 윈도 이름 -> 길이(초). 윈도마다 TRENDS_BUCKETS_PER_WINDOW개의 버킷으로 나눠 센다
+TRENDS_WINDOWS = {"5m": 5 * 60, "1h": 60 * 60, "24h": 24 * 60 * 60}
+TRENDS_BUCKETS_PER_WINDOW = 60
+
+# 프로세스 내 카운터를 재시작 후에도 이어 쓰기 위한 체크포인트 디렉터리 (빈 값이면 끄기)
+# 프로세스마다 <pid>.json을 TRENDS_CHECKPOINT_INTERVAL초마다 백그라운드 스레드에서 쓴다
+TRENDS_CHECKPOINT_DIR = os.environ.get("DJANGO_TRENDS_CHECKPOINT_DIR", str(BASE_DIR / ".cache" / "trends"))
+TRENDS_CHECKPOINT_INTERVAL = 60
+
+
+# Request metrics (common.metrics, GET /api/v1/metrics)
+
+# 이보다 느린 요청/쿼리는 common.metrics 로거에 경고로 남긴다 (밀리초)
+METRICS_SLOW_REQUEST_MS = int(os.environ.get("DJANGO_METRICS_SLOW_REQUEST_MS", 500))
+METRICS_SLOW_QUERY_MS = int(os.environ.get("DJANGO_METRICS_SLOW_QUERY_MS", 100))
+
+# 설정하면 관리자 세션 없이 `Authorization: Bearer <토큰>`으로 지표를 읽을 수 있다 (Prometheus 스크레이프용)
+METRICS_TOKEN = os.environ.get("DJANGO_METRICS_TOKEN", "")
+
+
+# Logging
+# https://docs.djangoproject.com/en/5.2/topics/logging/
+
+# 느린 요청/쿼리 경고를 logging.lastResort 대신 타임스탬프가 붙은 콘솔 핸들러로 보낸다
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "verbose": {"format": "{asctime} {levelname} {name} {message}", "style": "{"},
+    },
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "formatter": "verbose"},
+    },
+    "loggers": {
+        "common.metrics": {
+            "handlers": ["console"],
+            "level": os.environ.get("DJANGO_METRICS_LOG_LEVEL", "WARNING"),
+            "propagate": False,
+        },
+    },
+}
+
+
+# Task queue (common.tasks, manage.py run_worker)
+
+# 켜면 작업을 큐에 넣지 않고 요청 안에서 바로 실행한다 (워커 없이 개발할 때만 명시적으로 켠다)
+TASKS_EAGER = os.environ.get("DJANGO_TASKS_EAGER", "0") == "1"
+TASKS_MAX_ATTEMPTS = 5
+# 첫 재시도까지 기다리는 시간(초). 실패할 때마다 두 배로 늘린다
+TASKS_RETRY_DELAY = 5
+# 이보다 오래 실행 중인 작업은 워커가 죽은 것으로 보고 다시 대기 상태로 돌린다 (초)
+TASKS_LOCK_TIMEOUT = 300
@@ -0,0 +1,17 @@
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+from .test_settings import OVERRIDES
+
+
+class TestRunner(DiscoverRunner):
+    """config.test_settings.OVERRIDES를 적용한 채로 테스트를 실행한다."""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.test_settings = override_settings(**OVERRIDES)
+        self.test_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.test_settings.disable()
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,20 @@
+"""테스트 설정
+
+`manage.py test`는 TEST_RUNNER(config.test_runner.TestRunner)가 OVERRIDES를 적용하고,
+다른 러너(pytest 등)는 DJANGO_SETTINGS_MODULE=config.test_settings로 이 모듈을 그대로 쓴다.
+"""
+
+from .settings import *  # noqa: F403
+
+OVERRIDES = {
+    # 해시 비용이 거의 없는 MD5 (운영 설정에서는 고를 수 없다)
+    "PASSWORD_HASHERS": ["django.contrib.auth.hashers.MD5PasswordHasher"],
+    # 트렌드 체크포인트 파일을 쓰지 않는다
+    "TRENDS_CHECKPOINT_DIR": "",
+    # 워커 없이 작업을 요청 안에서 실행한다
+    "TASKS_EAGER": True,
+    # 요청 제한은 제한 테스트에서만 override_settings로 켠다
+    "THROTTLE_ENABLED": False,
+}
+
+globals().update(OVERRIDES)
@@ -15,23 +15,79 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
 
-from tweets import views
+from common.views import MetricsAPIView
+from tweets import async_views, views
+
+# settings.API_VIEWS에 따라 목록/상세/작성 API를 async 뷰로 바꿔 연결한다
+api_views = async_views if settings.API_VIEWS == "async" else views
 
 urlpatterns = [
     path("", views.tweet_list, name="tweet_list"),
     path(
         "api/v1/tweets",
-        views.TweetListCreateAPIView.as_view(),
+        api_views.TweetListCreateAPIView.as_view(),
         name="api_tweet_list",
     ),
+    path(
+        "api/v1/tweets/batch",
+        views.TweetBatchAPIView.as_view(),
+        name="api_tweet_batch",
+    ),
+    path(
+        "api/v1/timeline",
+        views.HomeTimelineAPIView.as_view(),
+        name="api_home_timeline",
+    ),
+    path(
+        "api/v1/trends",
+        views.TrendListAPIView.as_view(),
+        name="api_trend_list",
+    ),
     path(
         "api/v1/tweets/<int:pk>",
-        views.TweetDetailAPIView.as_view(),
+        api_views.TweetDetailAPIView.as_view(),
         name="api_tweet_detail",
     ),
+    path(
+        "api/v1/tweets/<int:pk>/like",
+        views.TweetLikeAPIView.as_view(),
+        name="api_tweet_like",
+    ),
+    path(
+        "api/v1/tweets/liked",
+        views.TweetLikedLookupAPIView.as_view(),
+        name="api_tweet_liked",
+    ),
+    path(
+        "api/v1/tweets/mentions",
+        views.MentionTweetListAPIView.as_view(),
+        name="api_tweet_mentions",
+    ),
+    path(
+        "api/v1/tags/<str:tag>/tweets",
+        views.TagTweetListAPIView.as_view(),
+        name="api_tag_tweet_list",
+    ),
+    path(
+        "api/v1/tweets/search",
+        views.TweetSearchAPIView.as_view(),
+        name="api_tweet_search",
+    ),
+    path(
+        "api/v1/tweets/export",
+        views.TweetExportAPIView.as_view(),
+        name="api_tweet_export",
+    ),
+    path(
+        "api/v1/tweets/cache-stats",
+        views.TweetCacheStatsAPIView.as_view(),
+        name="api_tweet_cache_stats",
+    ),
+    path("api/v1/metrics", MetricsAPIView.as_view(), name="api_metrics"),
     path("", include("users.urls")),
     path("admin/", admin.site.urls),
 ]
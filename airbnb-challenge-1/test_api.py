@@ -66,7 +66,7 @@ def test_all_tweets_api():
     print(f"Response: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
 
     assert response.status_code == 200, f"예상: 200, 실제: {response.status_code}"
-    assert isinstance(response.json(), list), "응답이 리스트여야 합니다"
+    assert isinstance(response.json()["results"], list), "results는 리스트여야 합니다"
     print("✓ 테스트 통과!")
 
 
@@ -88,7 +88,7 @@ def test_user_tweets_api():
     print(f"Response: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
 
     assert response.status_code == 200, f"예상: 200, 실제: {response.status_code}"
-    assert isinstance(response.json(), list), "응답이 리스트여야 합니다"
+    assert isinstance(response.json()["results"], list), "results는 리스트여야 합니다"
     print("✓ 테스트 통과!")
 
 
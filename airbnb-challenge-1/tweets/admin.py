@@ -1,5 +1,9 @@
 from django.contrib import admin
+from django.db.models import Q
 
+from common.admin import LargeTableAdmin, UsernameFilter
+
+from . import search
 from .models import Like, Tweet
 
 
@@ -15,14 +19,14 @@ class ElonMuskFilter(admin.SimpleListFilter):
 
     def queryset(self, request, queryset):
         if self.value() == "contains":
-            return queryset.filter(payload__icontains="Elon Musk")
+            return queryset.filter(search.matches("Elon Musk", phrase=True))
         if self.value() == "not_contains":
-            return queryset.exclude(payload__icontains="Elon Musk")
+            return queryset.exclude(search.matches("Elon Musk", phrase=True))
         return queryset
 
 
 @admin.register(Tweet)
-class TweetAdmin(admin.ModelAdmin):
+class TweetAdmin(LargeTableAdmin):
     list_display = [
         "id",
         "payload",
@@ -31,21 +35,29 @@ class TweetAdmin(admin.ModelAdmin):
         "created_at",
         "updated_at",
     ]
-    list_filter = ["created_at", "updated_at", "user", ElonMuskFilter]
+    # like_count는 비정규화 컬럼이므로 행마다 COUNT하지 않는다
+    list_select_related = ["user"]
+    list_filter = ["created_at", UsernameFilter, ElonMuskFilter]
     search_fields = ["payload", "user__username"]
-    readonly_fields = ["created_at", "updated_at"]
-    date_hierarchy = "created_at"
-
-    def like_count(self, obj):
-        return obj.likes.count()
+    readonly_fields = ["like_count", "created_at", "updated_at"]
+    autocomplete_fields = ["user"]
 
-    like_count.short_description = "Likes"
+    def get_search_results(self, request, queryset, search_term):
+        # payload는 LIKE '%...%' 전체 스캔 대신 전문 검색 인덱스로 찾는다
+        if not search_term or not search.is_supported():
+            return super().get_search_results(request, queryset, search_term)
+        queryset = queryset.filter(search.matches(search_term) | Q(user__username__icontains=search_term))
+        return queryset, False
 
 
 @admin.register(Like)
-class LikeAdmin(admin.ModelAdmin):
+class LikeAdmin(LargeTableAdmin):
     list_display = ["id", "user", "tweet", "created_at", "updated_at"]
-    list_filter = ["created_at", "updated_at", "user"]
+    # Tweet.__str__가 작성자 이름을 읽으므로 tweet__user까지 함께 읽는다
+    list_select_related = ["user", "tweet__user"]
+    list_filter = ["created_at", UsernameFilter]
     search_fields = ["user__username"]
     readonly_fields = ["created_at", "updated_at"]
-    date_hierarchy = "created_at"
+    autocomplete_fields = ["user", "tweet"]
+    # id는 생성 순서와 같고 기본 키 인덱스를 그대로 쓴다
+    ordering = ["-id"]
@@ -0,0 +1,86 @@
+"""tweets.views의 목록/상세/작성 API를 async ORM으로 구현한 뷰
+
+settings.API_VIEWS가 "async"면 config/urls.py가 이 모듈의 뷰를 연결한다.
+응답 형식은 동기 뷰와 같다.
+"""
+
+from asgiref.sync import sync_to_async
+from django.shortcuts import aget_object_or_404
+from rest_framework import status
+
+from common.conditional import not_modified, set_validators
+from common.pagination import KeysetPagination
+from common.throttling import ReadThrottle, TweetCreateThrottle
+from common.views import AsyncAPIView
+
+from . import rows
+from .cache import overlay_like_counts, response_cache
+from .models import Tweet
+from .serializers import TweetSerializer
+from .views import tweet_etag
+
+
+class TweetListCreateAPIView(AsyncAPIView):
+    """GET: 전체 트윗 목록 / POST: 새 트윗 생성"""
+
+    throttle_classes = [ReadThrottle, TweetCreateThrottle]
+
+    async def get(self, request):
+        cached = response_cache.get_list(request)
+        if cached is None:
+            paginator = KeysetPagination()
+            tweets = await paginator.apaginate_queryset(rows.values(Tweet.objects.all()), request, view=self)
+            data = paginator.get_paginated_response_data(rows.to_dicts(tweets))
+            response_cache.set_list(request, data)
+        else:
+            data, stale_counts = cached
+            if stale_counts:
+                ids = [tweet["id"] for tweet in data["results"]]
+                counts = Tweet.objects.filter(pk__in=ids).values_list("id", "like_count")
+                data = overlay_like_counts(data, {pk: count async for pk, count in counts})
+                response_cache.set_list(request, data)
+        return self.render(data)
+
+    async def post(self, request):
+        serializer = TweetSerializer(data=request.data, context={"request": request})
+        if not serializer.is_valid():
+            return self.render(serializer.errors, status.HTTP_400_BAD_REQUEST)
+        # 트윗과 작업 행을 한 트랜잭션에서 넣는다 (TweetSerializer.create)
+        tweet = await sync_to_async(serializer.save)()
+        return self.render(TweetSerializer(tweet).data, status.HTTP_201_CREATED)
+
+
+class TweetDetailAPIView(AsyncAPIView):
+    """단일 트윗 조회/수정/삭제"""
+
+    async def get_object(self, pk):
+        return await aget_object_or_404(Tweet.objects.with_author(), pk=pk)
+
+    async def get(self, request, pk):
+        data = response_cache.get_detail(pk)
+        tweet = await self.get_object(pk) if data is None else None
+        etag = tweet_etag(tweet, data)
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+        if data is None:
+            data = TweetSerializer(tweet).data
+            response_cache.set_detail(pk, data)
+        return set_validators(self.render(data), etag)
+
+    async def put(self, request, pk):
+        tweet = await self.get_object(pk)
+        if tweet.user_id != request.user.pk:
+            return self.render({"detail": "본인 트윗만 수정할 수 있습니다."}, status.HTTP_403_FORBIDDEN)
+        serializer = TweetSerializer(tweet, data=request.data, context={"request": request})
+        if not serializer.is_valid():
+            return self.render(serializer.errors, status.HTTP_400_BAD_REQUEST)
+        await sync_to_async(serializer.save)()
+        return self.render(serializer.data)
+
+    async def delete(self, request, pk):
+        tweet = await self.get_object(pk)
+        if tweet.user_id != request.user.pk:
+            return self.render({"detail": "본인 트윗만 삭제할 수 있습니다."}, status.HTTP_403_FORBIDDEN)
+        await tweet.adelete()
+        return self.render(None, status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,125 @@
+"""트윗 목록/상세 API 응답 캐시
+
+목록 키에는 세대(generation) 번호가 들어가 있어 트윗 작성/수정/삭제가 일어나면 세대만
+올려 모든 목록 페이지를 한 번에 무효화한다. 상세 키는 트윗별로 지운다.
+
+좋아요가 바뀌면 상세 캐시는 바로 지우지만 목록 세대는 올리지 않는다. 캐시된 목록의 like_count는
+최대 RESPONSE_CACHE_COUNTS_TTL초까지 옛 값일 수 있고, 그 뒤에는 뷰가 페이지 트윗의 like_count만
+다시 읽어 덮어쓴다(overlay_like_counts). 이 한도는 TweetResponseCacheTestCase.test_like_staleness_bound가 지킨다.
+
+무효화는 transaction.on_commit()으로 커밋 뒤에 한다. 커밋 전에만 지우면 그 사이에 들어온
+조회가 커밋 전 데이터를 새 세대 키에 다시 캐시해 버린다. 트랜잭션 안에서는 같은 트랜잭션의
+이후 조회가 옛 응답을 받지 않도록 바로 한 번 더 무효화한다.
+"""
+
+import hashlib
+import threading
+import time
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+CACHE_ALIAS = "responses"
+GENERATION_KEY = "tweets:generation"
+
+
+class TweetResponseCache:
+    def __init__(self, alias=CACHE_ALIAS):
+        self.alias = alias
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def _record(self, value):
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def get_generation(self):
+        generation = self.cache.get(GENERATION_KEY)
+        if generation is None:
+            # 세대 키가 밀려나도 예전 세대 키와 겹치지 않도록 시각으로 시작한다
+            generation = time.time_ns()
+            self.cache.add(GENERATION_KEY, generation, timeout=None)
+        return generation
+
+    def list_key(self, request):
+        """엔드포인트와 페이지(커서, page_size)마다 다른 키"""
+        digest = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+        return f"tweets:list:{self.get_generation()}:{digest}"
+
+    def detail_key(self, pk):
+        return f"tweets:detail:{pk}"
+
+    def get_list(self, request):
+        """(응답, like_count를 다시 읽어야 하는지) 또는 None"""
+        entry = self._record(self.cache.get(self.list_key(request)))
+        if entry is None:
+            return None
+        data, counted_at = entry
+        return data, time.time() - counted_at >= settings.RESPONSE_CACHE_COUNTS_TTL
+
+    def set_list(self, request, data):
+        self.cache.set(self.list_key(request), (data, time.time()))
+
+    def get_detail(self, pk):
+        return self._record(self.cache.get(self.detail_key(pk)))
+
+    def set_detail(self, pk, data):
+        self.cache.set(self.detail_key(pk), data)
+
+    def invalidate(self, pk=None, using=None):
+        """목록 캐시 전체와 (pk가 있으면) 해당 트윗 상세 캐시를 커밋 뒤에 무효화한다."""
+        self._after_commit(partial(self._invalidate, pk), using)
+
+    def invalidate_detail(self, pk, using=None):
+        """like_count만 바뀐 트윗: 상세 캐시만 커밋 뒤에 지우고 목록은 overlay_like_counts()에 맡긴다."""
+        self._after_commit(partial(self._invalidate_detail, pk), using)
+
+    def _after_commit(self, func, using):
+        if transaction.get_connection(using).in_atomic_block:
+            func()
+        transaction.on_commit(func, using=using)
+
+    def _invalidate(self, pk):
+        try:
+            self.cache.incr(GENERATION_KEY)
+        except ValueError:
+            self.cache.set(GENERATION_KEY, time.time_ns(), timeout=None)
+        if pk is not None:
+            self._invalidate_detail(pk)
+
+    def _invalidate_detail(self, pk):
+        self.cache.delete(self.detail_key(pk))
+
+    def stats(self):
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = 0
+
+
+def overlay_like_counts(data, like_counts):
+    """캐시된 목록 응답의 like_count를 {id: like_count}로 바꾼 사본"""
+    results = [{**tweet, "like_count": like_counts.get(tweet["id"], tweet["like_count"])} for tweet in data["results"]]
+    return {**data, "results": results}
+
+
+response_cache = TweetResponseCache()
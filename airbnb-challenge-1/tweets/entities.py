@@ -0,0 +1,68 @@
+"""해시태그/멘션 추출과 역색인
+
+트윗을 작성하거나 수정할 때 payload에서 #태그와 @멘션을 뽑아 TweetTag, Mention
+테이블에 넣는다. 태그별/멘션별 트윗 목록은 payload를 스캔하지 않고 이 테이블의
+(키, created_at, tweet) 인덱스만 읽는다.
+"""
+
+import re
+
+from django.contrib.auth.models import User
+
+from .models import Mention, TweetTag
+
+BATCH_SIZE = 500
+
+HASHTAG_RE = re.compile(r"(?<![\w&#])#(\w+)")
+# username에 쓸 수 있는 . + - 는 단어 사이에 있을 때만 포함한다 ("@alice." -> alice)
+MENTION_RE = re.compile(r"(?<![\w@])@(\w+(?:[.+-]\w+)*)")
+
+
+def extract_hashtags(payload):
+    max_length = TweetTag._meta.get_field("tag").max_length
+    return {tag.casefold() for tag in HASHTAG_RE.findall(payload) if len(tag) <= max_length}
+
+
+def extract_mentions(payload):
+    return set(MENTION_RE.findall(payload))
+
+
+def index_tweets(tweets, replace=False):
+    """
+    트윗들의 해시태그와 멘션을 색인한다.
+
+    replace=True면 (트윗 수정 시) 기존 색인을 먼저 지운다. 존재하지 않는 username에
+    대한 멘션은 버린다. 트윗 수와 관계없이 쿼리 수는 일정하다.
+    """
+    tweets = list(tweets)
+    if not tweets:
+        return
+    if replace:
+        tweet_ids = [tweet.pk for tweet in tweets]
+        TweetTag.objects.filter(tweet_id__in=tweet_ids).delete()
+        Mention.objects.filter(tweet_id__in=tweet_ids).delete()
+
+    tags, mentions = [], []
+    for tweet in tweets:
+        tags += [TweetTag(tag=tag, tweet=tweet, created_at=tweet.created_at) for tag in extract_hashtags(tweet.payload)]
+        mentions += [(username, tweet) for username in extract_mentions(tweet.payload)]
+
+    if tags:
+        TweetTag.objects.bulk_create(tags, batch_size=BATCH_SIZE, ignore_conflicts=True)
+    if mentions:
+        usernames = {username for username, _ in mentions}
+        user_ids = dict(User.objects.filter(username__in=usernames).values_list("username", "id"))
+        Mention.objects.bulk_create(
+            [
+                Mention(user_id=user_ids[username], tweet=tweet, created_at=tweet.created_at)
+                for username, tweet in mentions
+                if username in user_ids
+            ],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+
+def normalize_tag(tag):
+    """URL 등으로 받은 태그를 색인과 같은 형태로 바꾼다. (앞의 # 제거, casefold)"""
+    return tag.lstrip("#").casefold()
@@ -0,0 +1,30 @@
+"""트윗 스트리밍 내보내기
+
+values_list()로 필요한 컬럼만 iterator(chunk_size=...)로 읽고, 행마다 tweets.rows의
+매퍼로 dict를 만들어 바로 인코딩해 흘려보내므로 내보내는 행 수와 관계없이 메모리
+사용량이 일정하다. 출력 필드는 TweetSerializer와 같다.
+"""
+
+from common.renderers import encoder
+
+from . import rows
+
+CHUNK_SIZE = 2000
+
+
+def iter_rows(queryset, chunk_size=CHUNK_SIZE):
+    return rows.iter_dicts(queryset.values_list(*rows.COLUMNS).iterator(chunk_size=chunk_size))
+
+
+def stream_ndjson(rows):
+    for row in rows:
+        yield encoder.encode(row) + "\n"
+
+
+def stream_json_array(rows):
+    yield "["
+    separator = ""
+    for row in rows:
+        yield separator + encoder.encode(row)
+        separator = ","
+    yield "]"
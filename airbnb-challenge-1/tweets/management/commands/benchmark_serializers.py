@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from common.renderers import FastJSONRenderer
+from tweets import rows
+from tweets.models import Tweet
+from tweets.serializers import TweetSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "트윗 목록 응답 만들기(직렬화 + JSON 렌더링)를 TweetSerializer/JSONRenderer와 "
+        "tweets.rows/FastJSONRenderer로 각각 반복해 시간을 비교합니다. 쿼리 시간은 빼고 잽니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100, help="응답 하나에 넣을 트윗 수")
+        parser.add_argument("--iterations", type=int, default=200)
+
+    def handle(self, *args, **options):
+        size, iterations = options["rows"], options["iterations"]
+        tweets = list(Tweet.objects.with_author().order_by("-created_at", "-id")[:size])
+        values = list(rows.values(Tweet.objects.order_by("-created_at", "-id"))[:size])
+        if not tweets:
+            raise CommandError("트윗이 없습니다. load_data나 benchmark --seed로 데이터를 먼저 넣으세요.")
+
+        paths = {
+            "TweetSerializer + JSONRenderer": lambda: JSONRenderer().render(TweetSerializer(tweets, many=True).data),
+            "rows.to_dicts + FastJSONRenderer": lambda: FastJSONRenderer().render(rows.to_dicts(values)),
+        }
+        outputs = {name: render() for name, render in paths.items()}
+        if len(set(outputs.values())) != 1:
+            raise CommandError("두 경로의 출력 바이트가 다릅니다.")
+
+        timings = {}
+        for name, render in paths.items():
+            started = time.perf_counter()
+            for _ in range(iterations):
+                render()
+            timings[name] = (time.perf_counter() - started) / iterations * 1000
+            self.stdout.write(f"{name}: {timings[name]:.3f}ms / 응답 ({len(tweets)}행)")
+
+        baseline, fast = timings.values()
+        self.stdout.write(self.style.SUCCESS(f"출력 바이트 동일, {baseline / fast:.1f}배 빠름"))
@@ -0,0 +1,202 @@
+import csv
+import itertools
+import json
+import time
+from pathlib import Path
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from tweets import entities
+from tweets.cache import response_cache
+from tweets.models import Like, Tweet
+
+
+def iter_records(path):
+    """CSV(헤더 필수) 또는 JSONL 파일을 (줄 번호, dict)로 한 줄씩 읽는다."""
+    path = Path(path)
+    with path.open(encoding="utf-8", newline="") as f:
+        if path.suffix == ".csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+        elif path.suffix in (".jsonl", ".ndjson"):
+            for line_num, line in enumerate(f, start=1):
+                if line.strip():
+                    try:
+                        row = json.loads(line)
+                    except ValueError as e:
+                        raise CommandError(f"{path}:{line_num}: JSON이 아닙니다 ({e})") from e
+                    if not isinstance(row, dict):
+                        raise CommandError(f"{path}:{line_num}: JSON 객체여야 합니다.")
+                    yield line_num, row
+        else:
+            raise CommandError(f"지원하지 않는 파일 형식입니다: {path} (.csv, .jsonl, .ndjson)")
+
+
+def insert_raw(model, objs):
+    """
+    객체에 넣어 둔 값 그대로 INSERT하고 pk를 채운다.
+
+    bulk_create는 auto_now/auto_now_add 필드의 pre_save가 명시한 시각도 현재 시각으로 덮어쓴다.
+    공유된 필드 객체의 설정을 바꾸는 대신 loaddata처럼 raw INSERT(pre_save를 부르지 않는다)를 쓴다.
+    """
+    connection = connections[model.objects.db]
+    fields = [field for field in model._meta.concrete_fields if not field.primary_key]
+    batch_size = max(connection.ops.bulk_batch_size(fields, objs), 1)
+    for batch in itertools.batched(objs, batch_size):
+        rows = model.objects._insert(batch, fields=fields, returning_fields=[model._meta.pk], raw=True)
+        for obj, (pk,) in zip(batch, rows):
+            obj.pk = pk
+            obj._state.adding = False
+            obj._state.db = connection.alias
+    return objs
+
+
+class Command(BaseCommand):
+    help = (
+        "CSV/JSONL 파일의 사용자, 트윗, 좋아요를 배치 bulk_create로 적재합니다. "
+        "해시태그/멘션은 색인하지만 홈 타임라인 팬아웃은 하지 않습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users",
+            help="username, email, password 또는 password_hash 컬럼 (같은 password는 한 번만 해시해 같은 해시를 쓴다)",
+        )
+        parser.add_argument("--tweets", help="user(username) 또는 user_id, payload, created_at(선택) 컬럼")
+        parser.add_argument("--likes", help="user(username) 또는 user_id, tweet_id 컬럼")
+        parser.add_argument("--batch-size", type=int, default=5000, help="트랜잭션 하나에 넣을 행 수")
+
+    def handle(self, *args, **options):
+        if not any(options[kind] for kind in ("users", "tweets", "likes")):
+            raise CommandError("--users, --tweets, --likes 중 하나 이상을 지정해야 합니다.")
+        self.batch_size = options["batch_size"]
+        self.user_ids = {}
+        self.password_hashes = {}
+
+        if options["users"]:
+            self.load("users", options["users"], User, self.load_users)
+        if options["tweets"]:
+            self.load("tweets", options["tweets"], Tweet, self.load_tweets)
+        if options["likes"]:
+            self.load("likes", options["likes"], Like, self.load_likes)
+        # bulk_create는 시그널을 보내지 않으므로 응답 캐시를 직접 비운다
+        response_cache.invalidate()
+
+    def load(self, kind, path, model, load_batch):
+        started = time.perf_counter()
+        before = model.objects.count()
+        read = attempted = 0
+        # (파일, 줄 번호, 행)으로 넘겨 잘못된 행을 오류 메시지에서 가리킨다
+        records = ((path, line_num, row) for line_num, row in iter_records(path))
+        for batch in itertools.batched(records, self.batch_size):
+            with transaction.atomic():
+                attempted += load_batch(batch)
+            read += len(batch)
+            # ignore_conflicts로 무시된 행은 알 수 없으므로 배치마다는 INSERT를 시도한 행 수만 센다
+            rate = read / (time.perf_counter() - started)
+            self.stdout.write(f"{kind}: {read:,}행 읽음, {attempted:,}행 INSERT 시도 ({rate:,.0f}행/초)")
+        inserted = model.objects.count() - before
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(f"{kind}: {read:,}행 중 {inserted:,}행을 {elapsed:.1f}초에 새로 적재했습니다.")
+        )
+
+    def invalid(self, record, message):
+        path, line_num, _ = record
+        return CommandError(f"{path}:{line_num}: {message}")
+
+    def required(self, record, *names):
+        """names 중 처음으로 값이 있는 필드 이름. 모두 비어 있으면 CommandError."""
+        row = record[2]
+        for name in names:
+            if row.get(name) not in (None, ""):
+                return name
+        raise self.invalid(record, f"{' 또는 '.join(names)} 값이 없습니다.")
+
+    def integer(self, record, name):
+        """정수 필드 값. 숫자가 아니면 CommandError."""
+        value = record[2][name]
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.strip().isdigit():
+            return int(value)
+        raise self.invalid(record, f"{name}은(는) 정수여야 합니다: {value!r}")
+
+    def timestamp(self, record, name, default):
+        """ISO 8601 날짜/시간 필드 값 (비어 있으면 default). 형식이나 범위가 틀리면 CommandError."""
+        value = record[2].get(name)
+        if value in (None, ""):
+            return default
+        try:
+            parsed = parse_datetime(value) if isinstance(value, str) else None
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise self.invalid(record, f"{name}은(는) ISO 8601 날짜/시간이어야 합니다: {value!r}")
+        return timezone.make_aware(parsed) if timezone.is_naive(parsed) else parsed
+
+    def resolve_user_ids(self, batch):
+        """행마다 user_id를 찾는다. username은 배치마다 쿼리 한 번으로 조회해 기억해 둔다."""
+        keys = [
+            ("user_id", self.integer(record, "user_id"))
+            if self.required(record, "user_id", "user") == "user_id"
+            else ("user", record[2]["user"])
+            for record in batch
+        ]
+        missing = {value for name, value in keys if name == "user" and value not in self.user_ids}
+        if missing:
+            self.user_ids.update(User.objects.filter(username__in=missing).values_list("username", "id"))
+        return [value if name == "user_id" else self.user_ids.get(value) for name, value in keys]
+
+    def hash_password(self, password):
+        """PBKDF2는 행마다 돌리기엔 비싸므로 같은 비밀번호는 한 번만 해시한다."""
+        if not password:
+            return make_password(None)
+        if password not in self.password_hashes:
+            self.password_hashes[password] = make_password(password)
+        return self.password_hashes[password]
+
+    def load_users(self, batch):
+        users = []
+        for record in batch:
+            self.required(record, "username")
+            row = record[2]
+            password = row.get("password_hash") or self.hash_password(row.get("password"))
+            users.append(User(username=row["username"], email=row.get("email") or "", password=password))
+        # 이미 있는 username은 unique 제약에 걸려 조용히 무시된다
+        User.objects.bulk_create(users, ignore_conflicts=True)
+        return len(users)
+
+    def load_tweets(self, batch):
+        now = timezone.now()
+        tweets = []
+        for record, user_id in zip(batch, self.resolve_user_ids(batch)):
+            self.required(record, "payload")
+            row = record[2]
+            if user_id is None:
+                continue
+            created_at = self.timestamp(record, "created_at", now)
+            tweets.append(Tweet(user_id=user_id, payload=row["payload"], created_at=created_at, updated_at=created_at))
+        # created_at을 INSERT 한 번에 그대로 넣는다
+        entities.index_tweets(insert_raw(Tweet, tweets))
+        return len(tweets)
+
+    def load_likes(self, batch):
+        tweet_ids = [self.integer(record, self.required(record, "tweet_id")) for record in batch]
+        tweets = Tweet.objects.filter(pk__in=set(tweet_ids))
+        existing = set(tweets.values_list("id", flat=True))
+        likes = [
+            Like(user_id=user_id, tweet_id=tweet_id)
+            for tweet_id, user_id in zip(tweet_ids, self.resolve_user_ids(batch))
+            if user_id is not None and tweet_id in existing
+        ]
+        # 이미 있는 (user, tweet) 조합은 unique 제약에 걸려 조용히 무시된다
+        Like.objects.bulk_create(likes, ignore_conflicts=True)
+        tweets.rebuild_like_counts()
+        return len(likes)
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from tweets.models import Tweet
+
+
+class Command(BaseCommand):
+    help = "Like 테이블을 기준으로 Tweet.like_count를 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        updated = Tweet.objects.rebuild_like_counts()
+        self.stdout.write(self.style.SUCCESS(f"{updated}개 트윗의 like_count를 갱신했습니다."))
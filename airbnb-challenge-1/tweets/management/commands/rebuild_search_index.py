@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tweets import search
+
+
+class Command(BaseCommand):
+    help = "트윗 전문 검색 인덱스(FTS5)를 tweets_tweet에서 다시 만듭니다."
+
+    def handle(self, *args, **options):
+        if not search.is_supported():
+            raise CommandError("전문 검색 인덱스는 SQLite에서만 사용합니다.")
+        search.rebuild()
+        self.stdout.write(self.style.SUCCESS("검색 인덱스를 다시 만들었습니다."))
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.8 on 2026-10-18 08:04
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_like_count(apps, schema_editor):
+    """기존 Like 데이터로 like_count를 채운다."""
+    Tweet = apps.get_model("tweets", "Tweet")
+    Like = apps.get_model("tweets", "Like")
+    likes = (
+        Like.objects.filter(tweet=OuterRef("pk")).order_by().values("tweet").annotate(count=Count("id")).values("count")
+    )
+    Tweet.objects.update(like_count=Coalesce(Subquery(likes), 0))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tweets", "0004_tweet_cursor_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tweet",
+            name="like_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_like_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+from django.db import migrations
+
+# SQLite 전용: tweets_tweet을 content 테이블로 쓰는 FTS5 인덱스와 동기화 트리거.
+# 다른 DB에서는 아무것도 만들지 않고 tweets.search가 icontains로 대신한다.
+CREATE_SQL = [
+    """
+    CREATE VIRTUAL TABLE tweets_tweet_fts USING fts5(
+        payload,
+        content='tweets_tweet',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER tweets_tweet_fts_insert AFTER INSERT ON tweets_tweet BEGIN
+        INSERT INTO tweets_tweet_fts(rowid, payload) VALUES (new.id, new.payload);
+    END
+    """,
+    """
+    CREATE TRIGGER tweets_tweet_fts_delete AFTER DELETE ON tweets_tweet BEGIN
+        INSERT INTO tweets_tweet_fts(tweets_tweet_fts, rowid, payload) VALUES ('delete', old.id, old.payload);
+    END
+    """,
+    """
+    CREATE TRIGGER tweets_tweet_fts_update AFTER UPDATE OF payload ON tweets_tweet BEGIN
+        INSERT INTO tweets_tweet_fts(tweets_tweet_fts, rowid, payload) VALUES ('delete', old.id, old.payload);
+        INSERT INTO tweets_tweet_fts(rowid, payload) VALUES (new.id, new.payload);
+    END
+    """,
+    "INSERT INTO tweets_tweet_fts(tweets_tweet_fts) VALUES ('rebuild')",
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS tweets_tweet_fts_update",
+    "DROP TRIGGER IF EXISTS tweets_tweet_fts_delete",
+    "DROP TRIGGER IF EXISTS tweets_tweet_fts_insert",
+    "DROP TABLE IF EXISTS tweets_tweet_fts",
+]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        if schema_editor.connection.vendor != "sqlite":
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+
+    return operation
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tweets", "0006_timelineentry"),
+    ]
+
+    operations = [
+        migrations.RunPython(run(CREATE_SQL), run(DROP_SQL)),
+    ]
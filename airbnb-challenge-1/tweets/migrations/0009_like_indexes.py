@@ -0,0 +1,22 @@
+# Generated by Django 5.2.8 on 2026-10-18 08:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tweets", "0008_tweettag_mention"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="like",
+            index=models.Index(fields=["tweet", "-created_at"], name="like_tweet_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="like",
+            index=models.Index(fields=["user", "-created_at"], name="like_user_created_idx"),
+        ),
+    ]
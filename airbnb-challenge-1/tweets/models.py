@@ -1,31 +1,229 @@
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import connections, models, router, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
 
 from common.models import TimeStampedModel
 
+from .cache import response_cache
+
+
+class TweetQuerySet(models.QuerySet):
+    """Tweet 조회용 QuerySet"""
+
+    # TweetSerializer가 읽는 컬럼만 불러온다
+    SERIALIZER_FIELDS = [
+        "id",
+        "payload",
+        "like_count",
+        "created_at",
+        "updated_at",
+        "user__id",
+        "user__username",
+    ]
+
+    def with_author(self):
+        """작성자를 JOIN으로 함께 불러와 행마다 User 쿼리가 나가지 않게 한다."""
+        return self.select_related("user").only(*self.SERIALIZER_FIELDS)
+
+    def adjust_like_count(self, tweet_id, delta):
+        """like_count를 F() 식으로 원자적으로 증감한다. 어긋난 카운터라도 0 아래로는 내리지 않는다."""
+        return self.filter(pk=tweet_id).update(like_count=Greatest(F("like_count") + delta, 0))
+
+    def rebuild_like_counts(self):
+        """Like 테이블을 기준으로 like_count를 UPDATE 한 번에 다시 계산한다."""
+        likes = (
+            Like.objects.filter(tweet=OuterRef("pk"))
+            .order_by()
+            .values("tweet")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        return self.update(like_count=Coalesce(Subquery(likes), 0))
+
 
 class Tweet(TimeStampedModel):
     """트윗 모델"""
 
     payload = models.TextField(max_length=180)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # Like 생성/삭제 시 signals에서 함께 갱신되는 비정규화 카운터
+    like_count = models.PositiveIntegerField(default=0)
+
+    objects = TweetQuerySet.as_manager()
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # 커서 페이지네이션 정렬 키 (created_at, id)
+            models.Index(fields=["-created_at", "-id"], name="tweet_created_id_idx"),
+            models.Index(fields=["user", "-created_at", "-id"], name="tweet_user_created_id_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user.username}: {self.payload[:50]}"
 
 
+class LikeQuerySet(models.QuerySet):
+    """Like 조회/쓰기용 QuerySet
+
+    like()/unlike()는 unique_together(user, tweet)에 기대어 쓰기 한 번으로 끝나는
+    raw SQL을 사용하므로 post_save/post_delete 시그널이 발생하지 않는다.
+    like_count와 상세 응답 캐시는 여기서 직접 갱신한다.
+    """
+
+    def _execute(self, sql, params):
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.rowcount
+
+    def _write(self, sql, params, tweet_id, delta):
+        """
+        좋아요 행 쓰기와 like_count 증감을 한 트랜잭션으로 묶는다. 행이 바뀌었으면 True.
+        아무것도 바뀌지 않았으면 트윗이 있는지 확인해 없으면 Tweet.DoesNotExist를 던진다.
+        """
+        with transaction.atomic(using=self.db, savepoint=False):
+            changed = self._execute(sql, params) == 1
+            if changed:
+                Tweet.objects.using(self.db).adjust_like_count(tweet_id, delta)
+        if changed:
+            response_cache.invalidate_detail(tweet_id, using=self.db)
+        elif not Tweet.objects.using(self.db).filter(pk=tweet_id).exists():
+            raise Tweet.DoesNotExist
+        return changed
+
+    def like(self, user, tweet_id):
+        """
+        좋아요를 남긴다. 새로 생겼으면 True, 이미 있었으면 False.
+
+        트윗 행에서 SELECT하는 INSERT ... ON CONFLICT DO NOTHING이라 없는 트윗에는 아무것도
+        넣지 않는다. (FK 검사는 커밋까지 미뤄지므로 IntegrityError에 기대지 않는다)
+        """
+        opts = self.model._meta
+        ops = connections[self.db].ops
+        now = ops.adapt_datetimefield_value(timezone.now())
+        sql = (
+            f"INSERT INTO {ops.quote_name(opts.db_table)} (user_id, tweet_id, created_at, updated_at) "
+            f"SELECT %s, id, %s, %s FROM {ops.quote_name(Tweet._meta.db_table)} WHERE id = %s "
+            "ON CONFLICT (user_id, tweet_id) DO NOTHING"
+        )
+        return self._write(sql, [user.pk, now, now, tweet_id], tweet_id, 1)
+
+    def unlike(self, user, tweet_id):
+        """DELETE 한 번으로 좋아요를 취소한다. 실제로 지워졌으면 True."""
+        opts = self.model._meta
+        ops = connections[self.db].ops
+        sql = f"DELETE FROM {ops.quote_name(opts.db_table)} WHERE user_id = %s AND tweet_id = %s"
+        return self._write(sql, [user.pk, tweet_id], tweet_id, -1)
+
+    def delete(self):
+        """
+        지우는 좋아요 수만큼 트윗별 like_count를 내린다.
+
+        post_delete 수신기를 두면 트윗/사용자 삭제의 CASCADE가 fast delete를 못 하고 좋아요마다
+        UPDATE를 보내므로 명시적인 삭제 경로(이 메서드, Like.delete(), unlike())에서만 센다.
+        CASCADE로 지워지는 좋아요는 트윗 자체가 지워지거나 사용자와 함께 지워진다.
+        """
+        with transaction.atomic(using=self.db, savepoint=False):
+            counts = list(self.order_by().values_list("tweet_id").annotate(count=Count("id")))
+            deleted = super().delete()
+            for tweet_id, count in counts:
+                Tweet.objects.using(self.db).adjust_like_count(tweet_id, -count)
+        for tweet_id, _ in counts:
+            response_cache.invalidate_detail(tweet_id, using=self.db)
+        return deleted
+
+    def liked_tweet_ids(self, user, tweet_ids):
+        """tweet_ids 중 user가 좋아요한 트윗 id 집합을 쿼리 한 번으로 돌려준다."""
+        likes = self.filter(user=user, tweet_id__in=tweet_ids).order_by()
+        return set(likes.values_list("tweet_id", flat=True))
+
+
 class Like(TimeStampedModel):
     """좋아요 모델"""
 
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     tweet = models.ForeignKey(Tweet, on_delete=models.CASCADE, related_name="likes")
 
+    objects = LikeQuerySet.as_manager()
+
     class Meta:
         unique_together = ["user", "tweet"]
         ordering = ["-created_at"]
+        indexes = [
+            # 트윗/사용자별 좋아요를 최신순으로 읽을 때 정렬 없이 인덱스 순서대로 읽는다
+            models.Index(fields=["tweet", "-created_at"], name="like_tweet_created_idx"),
+            models.Index(fields=["user", "-created_at"], name="like_user_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user.username} likes {self.tweet.id}"
+
+    def delete(self, using=None, keep_parents=False):
+        """좋아요 하나를 지우고 트윗의 like_count를 내린다. (LikeQuerySet.delete() 참고)"""
+        using = using or router.db_for_write(Like, instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            deleted = super().delete(using=using, keep_parents=keep_parents)
+            Tweet.objects.using(using).adjust_like_count(self.tweet_id, -1)
+        response_cache.invalidate_detail(self.tweet_id, using=using)
+        return deleted
+
+
+class TimelineEntry(models.Model):
+    """미리 계산된 홈 타임라인 항목 (fan-out-on-write)
+
+    created_at은 트윗의 created_at을 복사해 둔 값으로, (owner, created_at, tweet)
+    인덱스 하나로 홈 타임라인 한 페이지를 범위 스캔할 수 있게 한다.
+    """
+
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    tweet = models.ForeignKey(Tweet, on_delete=models.CASCADE, related_name="timeline_entries")
+    created_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ["owner", "tweet"]
+        indexes = [
+            models.Index(fields=["owner", "-created_at", "-tweet"], name="timeline_owner_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.owner_id} <- {self.tweet_id}"
+
+
+class TweetTag(models.Model):
+    """해시태그 역색인: 태그 -> 트윗
+
+    tag는 #을 뺀 소문자(casefold) 값이다. created_at은 트윗의 created_at을 복사해
+    두어 (tag, created_at, tweet) 인덱스 하나로 태그 타임라인을 범위 스캔한다.
+    """
+
+    tag = models.CharField(max_length=100)
+    tweet = models.ForeignKey(Tweet, on_delete=models.CASCADE, related_name="tags")
+    created_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ["tag", "tweet"]
+        indexes = [
+            models.Index(fields=["tag", "-created_at", "-tweet"], name="tweettag_tag_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"#{self.tag} <- {self.tweet_id}"
+
+
+class Mention(models.Model):
+    """멘션 역색인: 언급된 사용자 -> 트윗"""
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    tweet = models.ForeignKey(Tweet, on_delete=models.CASCADE, related_name="mentions")
+    created_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ["user", "tweet"]
+        indexes = [
+            models.Index(fields=["user", "-created_at", "-tweet"], name="mention_user_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"@{self.user_id} <- {self.tweet_id}"
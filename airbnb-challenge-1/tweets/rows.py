@@ -0,0 +1,75 @@
+"""읽기 전용 트윗 목록 행 매퍼
+
+목록 응답은 모델 객체와 DRF 필드를 거치지 않고 values_list()로 필요한 컬럼만 튜플로
+읽은 뒤, 고정된 키로 dict를 바로 만든다. 결과는 TweetSerializer(tweets, many=True).data와
+키 순서와 값 형식까지 같으므로 렌더링하면 같은 JSON 바이트가 나온다.
+쓰기와 단건 조회는 계속 TweetSerializer를 사용한다.
+"""
+
+from django.utils import timezone
+
+from common import metrics
+
+from .models import Tweet
+
+# TweetSerializer 필드 순서대로: id, payload, user, username, like_count, created_at, updated_at
+COLUMNS = ("id", "payload", "user_id", "user__username", "like_count", "created_at", "updated_at")
+
+
+def values(queryset):
+    """queryset을 매퍼가 읽는 컬럼의 named 튜플로 바꾼다. (커서 페이지네이션은 .created_at/.id를 읽는다)"""
+    return queryset.values_list(*COLUMNS, named=True)
+
+
+def make_datetime_formatter():
+    """DRF DateTimeField와 같은 형식(현재 시간대의 ISO 8601, UTC는 Z)으로 바꾸는 함수"""
+    tz = timezone.get_current_timezone()
+
+    def format_datetime(value):
+        value = value.astimezone(tz).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return format_datetime
+
+
+def format_datetime(value):
+    return make_datetime_formatter()(value)
+
+
+def to_dict(row, fmt):
+    pk, payload, user_id, username, like_count, created_at, updated_at = row
+    return {
+        "id": pk,
+        "payload": payload,
+        "user": user_id,
+        "username": username,
+        "like_count": like_count,
+        "created_at": fmt(created_at),
+        "updated_at": fmt(updated_at),
+    }
+
+
+@metrics.serializing()
+def to_dicts(rows):
+    """COLUMNS 순서의 행들을 TweetSerializer와 같은 dict 목록으로 바꾼다."""
+    fmt = make_datetime_formatter()
+    return [to_dict(row, fmt) for row in rows]
+
+
+def iter_dicts(rows):
+    """to_dicts()의 지연 버전 (스트리밍 내보내기용)"""
+    fmt = make_datetime_formatter()
+    for row in rows:
+        yield to_dict(row, fmt)
+
+
+def by_ids(tweet_ids):
+    """tweet_ids의 행 (순서 없음: 기본 정렬 -created_at을 빼서 정렬 단계를 없앤다)"""
+    return values(Tweet.objects.filter(pk__in=tweet_ids).order_by())
+
+
+def load(tweet_ids):
+    """KeysetPagination.paginate_sources()용 loader: {id: 행}"""
+    return {row.id: row for row in by_ids(tweet_ids)}
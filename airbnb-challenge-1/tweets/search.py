@@ -0,0 +1,79 @@
+"""트윗 본문 전문 검색 (SQLite FTS5)
+
+tweets_tweet_fts는 tweets_tweet을 content 테이블로 쓰는 FTS5 외부 콘텐츠 인덱스로,
+0007 마이그레이션이 만든 트리거가 INSERT/UPDATE OF payload/DELETE마다 동기화한다.
+트리거는 DB 안에서 실행되므로 bulk_create나 raw SQL로 쓴 행도 색인된다.
+SQLite가 아닌 DB에서는 인덱스가 없으므로 icontains로 대신한다.
+"""
+
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "tweets_tweet_fts"
+
+# 단어와 끝에 붙은 * (접두사 검색)만 남긴다. FTS5 연산자와 따옴표는 버린다.
+TERM_RE = re.compile(r"\w+\*?")
+
+
+def is_supported():
+    return connection.vendor == "sqlite"
+
+
+def parse_terms(query):
+    """검색어를 [(단어, 접두사 여부)] 목록으로 나눈다."""
+    return [(term.rstrip("*"), term.endswith("*")) for term in TERM_RE.findall(query)]
+
+
+def build_match_expression(query, phrase=False):
+    """
+    검색어를 FTS5 MATCH 식으로 바꾼다.
+
+    단어는 모두 따옴표로 감싸 FTS5 문법으로 해석되지 않게 하고 AND로 묶는다.
+    `djan*`처럼 끝에 *가 붙은 단어는 접두사 검색이 된다. phrase=True면 단어들이
+    순서대로 붙어 있어야 하는 구문 검색이 된다.
+    """
+    terms = parse_terms(query)
+    if not terms:
+        return ""
+    if phrase:
+        return '"' + " ".join(term for term, _ in terms) + '"'
+    return " ".join(f'"{term}"*' if prefix else f'"{term}"' for term, prefix in terms)
+
+
+def matches(query, phrase=False):
+    """payload가 검색어와 맞는 트윗을 고르는 Q 객체"""
+    if not is_supported():
+        if phrase:
+            return Q(payload__icontains=" ".join(term for term, _ in parse_terms(query)))
+        condition = Q()
+        for term, _ in parse_terms(query):
+            condition &= Q(payload__icontains=term)
+        return condition
+    expression = build_match_expression(query, phrase=phrase)
+    if not expression:
+        return Q(pk__in=[])
+    return Q(pk__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", (expression,)))
+
+
+def ranked_ids(query, limit):
+    """bm25 점수가 높은 순서로 트윗 id를 최대 limit개 돌려준다. (SQLite 전용)"""
+    expression = build_match_expression(query)
+    if not expression:
+        return []
+    with connection.cursor() as cursor:
+        # FTS5의 rank 열은 bm25()이고, 값이 작을수록 관련도가 높다
+        cursor.execute(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s ORDER BY rank LIMIT %s",
+            [expression, limit],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def rebuild():
+    """content 테이블(tweets_tweet)에서 인덱스를 처음부터 다시 만든다."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
@@ -1,6 +1,44 @@
+from django.db import transaction
 from rest_framework import serializers
 
+from common import metrics, tasks
+
+from . import tasks as tweet_tasks
+from .cache import response_cache
 from .models import Tweet
+from .trends import trend_tracker
+
+
+def publish(*tweets):
+    """
+    새 트윗들을 트렌드에 반영하고 타임라인 팬아웃과 해시태그/멘션 색인은 작업 큐로 넘긴다.
+
+    트렌드 카운터는 이 프로세스 메모리에 있으므로 워커가 아니라 요청 안에서 센다.
+    """
+    for tweet in tweets:
+        trend_tracker.record(tweet.payload)
+    tasks.enqueue(tweet_tasks.publish_tweets, [tweet.pk for tweet in tweets])
+
+
+class TweetBatchCreateSerializer(serializers.ListSerializer):
+    """TweetSerializer(many=True)용: 검증을 모두 통과한 트윗을 bulk_create 한 번으로 만든다."""
+
+    def create(self, validated_data):
+        request = self.context.get("request")
+        user = getattr(request, "user", None)
+        if user is None or not user.is_authenticated:
+            raise serializers.ValidationError("인증된 사용자만 트윗을 작성할 수 있습니다.")
+        tweets = Tweet.objects.bulk_create([Tweet(user=user, **item) for item in validated_data])
+        # bulk_create는 post_save 시그널을 보내지 않으므로 캐시 무효화와 후처리를 직접 한다
+        # (무효화는 뷰의 transaction.atomic()이 커밋된 뒤에 한 번 더 실행된다)
+        response_cache.invalidate()
+        publish(*tweets)
+        return tweets
+
+    @property
+    def data(self):
+        with metrics.serializing():
+            return super().data
 
 
 class TweetSerializer(serializers.ModelSerializer):
@@ -11,8 +49,14 @@ class TweetSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Tweet
-        fields = ["id", "payload", "user", "username", "created_at", "updated_at"]
-        read_only_fields = ["id", "user", "username", "created_at", "updated_at"]
+        fields = ["id", "payload", "user", "username", "like_count", "created_at", "updated_at"]
+        read_only_fields = ["id", "user", "username", "like_count", "created_at", "updated_at"]
+        list_serializer_class = TweetBatchCreateSerializer
+
+    @property
+    def data(self):
+        with metrics.serializing():
+            return super().data
 
     def create(self, validated_data):
         """요청한 사용자로 Tweet을 생성한다."""
@@ -20,4 +64,17 @@ class TweetSerializer(serializers.ModelSerializer):
         user = getattr(request, "user", None)
         if user is None or not user.is_authenticated:
             raise serializers.ValidationError("인증된 사용자만 트윗을 작성할 수 있습니다.")
-        return Tweet.objects.create(user=user, **validated_data)
+        # 작업 행이 트윗과 같이 커밋되도록 한 트랜잭션에서 넣는다
+        with transaction.atomic():
+            tweet = Tweet.objects.create(user=user, **validated_data)
+            publish(tweet)
+        return tweet
+
+    def update(self, instance, validated_data):
+        """payload가 바뀌면 해시태그/멘션 색인을 다시 만든다."""
+        payload_changed = validated_data.get("payload", instance.payload) != instance.payload
+        with transaction.atomic():
+            tweet = super().update(instance, validated_data)
+            if payload_changed:
+                tasks.enqueue(tweet_tasks.reindex_tweet, tweet.pk)
+        return tweet
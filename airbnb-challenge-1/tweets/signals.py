@@ -0,0 +1,36 @@
+from django.contrib.auth.models import User
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .cache import response_cache
+from .models import Like, Tweet
+
+
+@receiver(post_save, sender=Like)
+def increment_like_count(sender, instance, created, **kwargs):
+    """좋아요가 새로 생기면 트윗의 like_count를 1 올린다."""
+    if created:
+        Tweet.objects.using(kwargs["using"]).adjust_like_count(instance.tweet_id, 1)
+        response_cache.invalidate_detail(instance.tweet_id, using=kwargs["using"])
+
+
+# Like에는 post_delete 수신기를 두지 않는다. 수신기가 있으면 트윗/사용자 삭제의 CASCADE가
+# 좋아요를 한 줄씩 지우고 UPDATE를 보낸다. 명시적인 삭제는 LikeQuerySet.delete()/Like.delete()가 센다.
+
+
+@receiver(pre_delete, sender=User)
+def decrement_liked_tweets(sender, instance, **kwargs):
+    """사용자가 지워지면 CASCADE로 사라질 좋아요만큼 다른 트윗의 like_count를 UPDATE 한 번으로 내린다."""
+    liked = list(Tweet.objects.filter(likes__user=instance).exclude(user=instance).values_list("id", flat=True))
+    Tweet.objects.filter(pk__in=liked).update(like_count=Greatest(F("like_count") - 1, 0))
+    for tweet_id in liked:
+        response_cache.invalidate_detail(tweet_id, using=kwargs["using"])
+
+
+@receiver(post_save, sender=Tweet)
+@receiver(post_delete, sender=Tweet)
+def invalidate_tweet_cache(sender, instance, **kwargs):
+    """트윗이 생성/수정/삭제되면 커밋 뒤에 응답 캐시를 무효화한다."""
+    response_cache.invalidate(instance.pk, using=kwargs["using"])
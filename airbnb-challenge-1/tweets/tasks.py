@@ -0,0 +1,34 @@
+"""트윗 쓰기 후 작업 큐(common.tasks)에서 실행하는 파생 작업"""
+
+from django.contrib.auth.models import User
+
+from common.tasks import task
+
+from . import entities, timeline
+from .models import Tweet
+
+
+@task
+def publish_tweets(tweet_ids):
+    """새 트윗들을 홈 타임라인에 팬아웃하고 해시태그/멘션을 색인한다."""
+    # 실행 전에 지워진 트윗은 건너뛴다
+    tweets = list(Tweet.objects.filter(pk__in=tweet_ids).only("id", "user_id", "payload", "created_at").order_by())
+    if tweets:
+        timeline.fan_out(*tweets)
+        entities.index_tweets(tweets)
+
+
+@task
+def reindex_tweet(tweet_id):
+    """수정된 트윗의 해시태그/멘션 색인을 다시 만든다."""
+    tweets = list(Tweet.objects.filter(pk=tweet_id).only("id", "payload", "created_at"))
+    entities.index_tweets(tweets, replace=True)
+
+
+@task
+def backfill_timeline(follower_id, following_id):
+    """새로 팔로우한 사용자의 최근 트윗을 팔로워 타임라인에 채운다."""
+    follower = User.objects.filter(pk=follower_id).first()
+    following = User.objects.filter(pk=following_id).first()
+    if follower is not None and following is not None:
+        timeline.backfill(follower, following)
@@ -1,25 +1,47 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
 from rest_framework import status
-from rest_framework.test import APITestCase
-from .models import Tweet
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from common.renderers import FastJSONRenderer
+from common.testing import QueryCountAssertionsMixin
+from users.models import Follow
+
+from . import rows, search, timeline
+from .admin import ElonMuskFilter
+from .cache import response_cache
+from .models import Like, Mention, TimelineEntry, Tweet, TweetQuerySet, TweetTag
+from .serializers import TweetSerializer
+from .trends import TrendTracker, trend_tracker
+from .views import TweetListAPIView
+
 
 class TweetAPITestCase(APITestCase):
     def setUp(self):
         # Create a test user
-        self.user = User.objects.create_user(
-            username="testuser", 
-            password="testpassword123"
-        )
+        self.user = User.objects.create_user(username="testuser", password="testpassword123")
         # Create another user for permission testing
-        self.other_user = User.objects.create_user(
-            username="otheruser", 
-            password="testpassword123"
-        )
+        self.other_user = User.objects.create_user(username="otheruser", password="testpassword123")
         # Create a test tweet
-        self.tweet = Tweet.objects.create(
-            payload="This is a test tweet", 
-            user=self.user
-        )
+        self.tweet = Tweet.objects.create(payload="This is a test tweet", user=self.user)
         # URL endpoints
         self.list_url = "/api/v1/tweets"
         self.detail_url = f"/api/v1/tweets/{self.tweet.pk}"
@@ -28,16 +50,26 @@ class TweetAPITestCase(APITestCase):
         """Test GET /api/v1/tweets"""
         # Authenticate
         self.client.force_authenticate(user=self.user)
-        
+
         response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Should return at least one tweet
-        self.assertGreaterEqual(len(response.data), 1)
+        self.assertEqual([tweet["id"] for tweet in response.data["results"]], [self.tweet.pk])
+        self.assertIsNone(response.data["next"])
+
+        # Newest first, page_size per page, and the next cursor continues where the page ended
+        newer = [Tweet.objects.create(payload=f"Newer tweet {i}", user=self.other_user) for i in range(2)]
+        response = self.client.get(self.list_url, {"page_size": 2})
+        self.assertEqual([tweet["id"] for tweet in response.data["results"]], [newer[1].pk, newer[0].pk])
+        self.assertIsNotNone(response.data["next"])
+        response = self.client.get(response.data["next"])
+        self.assertEqual([tweet["id"] for tweet in response.data["results"]], [self.tweet.pk])
+        self.assertIsNone(response.data["next"])
+        self.assertIsNotNone(response.data["previous"])
 
     def test_post_tweet(self):
         """Test POST /api/v1/tweets"""
         self.client.force_authenticate(user=self.user)
-        
+
         data = {"payload": "New tweet content"}
         response = self.client.post(self.list_url, data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -47,7 +79,7 @@ class TweetAPITestCase(APITestCase):
     def test_get_tweet_detail(self):
         """Test GET /api/v1/tweets/<int:pk>"""
         self.client.force_authenticate(user=self.user)
-        
+
         response = self.client.get(self.detail_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["payload"], self.tweet.payload)
@@ -55,12 +87,12 @@ class TweetAPITestCase(APITestCase):
     def test_put_tweet(self):
         """Test PUT /api/v1/tweets/<int:pk>"""
         self.client.force_authenticate(user=self.user)
-        
+
         data = {"payload": "Updated tweet content"}
         response = self.client.put(self.detail_url, data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["payload"], "Updated tweet content")
-        
+
         # Verify update in DB
         self.tweet.refresh_from_db()
         self.assertEqual(self.tweet.payload, "Updated tweet content")
@@ -68,17 +100,17 @@ class TweetAPITestCase(APITestCase):
     def test_delete_tweet(self):
         """Test DELETE /api/v1/tweets/<int:pk>"""
         self.client.force_authenticate(user=self.user)
-        
+
         response = self.client.delete(self.detail_url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        
+
         # Verify deletion
         self.assertFalse(Tweet.objects.filter(pk=self.tweet.pk).exists())
 
     def test_put_tweet_not_owner(self):
         """Test PUT /api/v1/tweets/<int:pk> by non-owner"""
         self.client.force_authenticate(user=self.other_user)
-        
+
         data = {"payload": "Malicious update"}
         response = self.client.put(self.detail_url, data)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -86,6 +118,905 @@ class TweetAPITestCase(APITestCase):
     def test_delete_tweet_not_owner(self):
         """Test DELETE /api/v1/tweets/<int:pk> by non-owner"""
         self.client.force_authenticate(user=self.other_user)
-        
+
         response = self.client.delete(self.detail_url)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TweetPaginationTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="pageuser", password="testpassword123")
+        # created_at이 같은 트윗이 섞여도 id로 순서가 결정되어야 한다
+        tweets = [Tweet.objects.create(payload=f"tweet {i}", user=self.user) for i in range(5)]
+        Tweet.objects.filter(pk__in=[t.pk for t in tweets]).update(created_at=tweets[0].created_at)
+        self.expected_ids = sorted((t.pk for t in tweets), reverse=True)
+        self.client.force_authenticate(user=self.user)
+
+    def test_cursor_pages_cover_all_tweets(self):
+        """Test GET /api/v1/tweets?page_size=2 walks every page"""
+        seen = []
+        url = "/api/v1/tweets?page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            seen.extend(tweet["id"] for tweet in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(seen, self.expected_ids)
+
+    def test_previous_cursor(self):
+        """Test the previous cursor returns the preceding page"""
+        first = self.client.get("/api/v1/tweets?page_size=2")
+        self.assertIsNone(first.data["previous"])
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+        self.assertEqual(
+            [tweet["id"] for tweet in back.data["results"]],
+            [tweet["id"] for tweet in first.data["results"]],
+        )
+
+    def test_page_size_is_bounded(self):
+        """Test page_size is capped at max_page_size"""
+        response = self.client.get("/api/v1/tweets?page_size=100000")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 5)
+
+    def test_invalid_cursor(self):
+        """Test an invalid cursor returns 404"""
+        response = self.client.get("/api/v1/tweets?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_user_tweets_paginated(self):
+        """Test GET /api/v1/users/<pk>/tweets is paginated"""
+        response = self.client.get(f"/api/v1/users/{self.user.pk}/tweets?page_size=3")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [tweet["id"] for tweet in response.data["results"]],
+            self.expected_ids[:3],
+        )
+        self.assertIsNotNone(response.data["next"])
+
+
+class TweetQueryCountTestCase(QueryCountAssertionsMixin, APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="queryuser", password="testpassword123")
+        Tweet.objects.create(payload="first", user=self.user)
+        self.client.force_authenticate(user=self.user)
+
+    def grow(self):
+        # 작성자가 서로 다른 트윗을 늘려도 쿼리 수는 그대로여야 한다
+        for i in range(5):
+            author = User.objects.create_user(username=f"author{i}", password="testpassword123")
+            Tweet.objects.create(payload=f"tweet {i}", user=author)
+
+    def test_tweet_list_queries(self):
+        """Test GET /api/v1/tweets runs a fixed number of queries"""
+        self.assertListQueryCount("/api/v1/tweets", 1, self.grow)
+
+    def test_user_tweets_queries(self):
+        """Test GET /api/v1/users/<pk>/tweets runs a fixed number of queries"""
+        # 사용자, ETag용 페이지 집계, 페이지
+        self.assertListQueryCount(f"/api/v1/users/{self.user.pk}/tweets", 3, self.grow)
+
+    def test_html_tweet_list_queries(self):
+        """Test GET / runs a fixed number of queries"""
+        self.assertListQueryCount("/", 1, self.grow)
+
+    def test_tweet_list_api_view_queries(self):
+        """Test TweetListAPIView runs a single query"""
+        self.grow()
+        request = APIRequestFactory().get("/")
+        with self.assertNumQueries(1):
+            response = TweetListAPIView.as_view()(request)
+        self.assertEqual(len(response.data), 6)
+
+
+class LikeCountTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="likeuser", password="testpassword123")
+        self.other_user = User.objects.create_user(username="likeother", password="testpassword123")
+        self.tweet = Tweet.objects.create(payload="like me", user=self.user)
+
+    def test_like_count_follows_likes(self):
+        """Test like_count is incremented and decremented with Like rows"""
+        like = Like.objects.create(user=self.user, tweet=self.tweet)
+        Like.objects.create(user=self.other_user, tweet=self.tweet)
+        self.tweet.refresh_from_db()
+        self.assertEqual(self.tweet.like_count, 2)
+
+        like.delete()
+        self.tweet.refresh_from_db()
+        self.assertEqual(self.tweet.like_count, 1)
+
+    def test_like_count_in_serializer(self):
+        """Test like_count is exposed in the API"""
+        Like.objects.create(user=self.other_user, tweet=self.tweet)
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(f"/api/v1/tweets/{self.tweet.pk}")
+        self.assertEqual(response.data["like_count"], 1)
+
+    def test_queryset_delete_adjusts_like_count(self):
+        """Test Like queryset deletes lower like_count once per tweet, never below zero"""
+        Like.objects.bulk_create([Like(user=self.user, tweet=self.tweet), Like(user=self.other_user, tweet=self.tweet)])
+        Tweet.objects.filter(pk=self.tweet.pk).update(like_count=1)
+        with self.assertNumQueries(3):  # 트윗별 개수, DELETE, like_count UPDATE
+            Like.objects.filter(tweet=self.tweet).delete()
+        self.tweet.refresh_from_db()
+        self.assertEqual(self.tweet.like_count, 0)
+
+    def test_tweet_delete_fast_deletes_likes(self):
+        """Test deleting a tweet removes its likes with one DELETE and no like_count UPDATE"""
+        users = User.objects.bulk_create([User(username=f"fan{i}") for i in range(20)])
+        Like.objects.bulk_create([Like(user=user, tweet=self.tweet) for user in users])
+        with CaptureQueriesContext(connection) as queries:
+            self.tweet.delete()
+        sql = [query["sql"] for query in queries.captured_queries]
+        self.assertFalse([statement for statement in sql if statement.startswith("UPDATE")])
+        self.assertEqual(len([statement for statement in sql if 'DELETE FROM "tweets_like"' in statement]), 1)
+        self.assertFalse(Like.objects.exists())
+
+    def test_user_delete_lowers_liked_tweet_counts(self):
+        """Test deleting a user lowers like_count on the tweets they liked"""
+        Like.objects.create(user=self.other_user, tweet=self.tweet)
+        self.other_user.delete()
+        self.tweet.refresh_from_db()
+        self.assertEqual(self.tweet.like_count, 0)
+
+    def test_rebuild_like_counts_command(self):
+        """Test rebuild_like_counts repairs drifted counters"""
+        Like.objects.create(user=self.other_user, tweet=self.tweet)
+        Tweet.objects.filter(pk=self.tweet.pk).update(like_count=42)
+        call_command("rebuild_like_counts", stdout=StringIO())
+        self.tweet.refresh_from_db()
+        self.assertEqual(self.tweet.like_count, 1)
+
+
+class TweetLikeAPITestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="liker", password="testpassword123")
+        self.tweet = Tweet.objects.create(payload="likeable", user=self.user)
+        self.other_tweet = Tweet.objects.create(payload="not liked", user=self.user)
+        self.like_url = f"/api/v1/tweets/{self.tweet.pk}/like"
+        self.client.force_authenticate(user=self.user)
+
+    def test_like_is_idempotent(self):
+        """Test POST /api/v1/tweets/<pk>/like twice keeps one Like"""
+        with self.assertNumQueries(2):  # INSERT ... SELECT, like_count UPDATE
+            response = self.client.post(self.like_url)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        with self.assertNumQueries(2):  # INSERT (충돌), 트윗 존재 확인
+            response = self.client.post(self.like_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(Like.objects.filter(tweet=self.tweet).count(), 1)
+        self.tweet.refresh_from_db()
+        self.assertEqual(self.tweet.like_count, 1)
+
+    def test_unlike_is_idempotent(self):
+        """Test DELETE /api/v1/tweets/<pk>/like twice"""
+        self.client.post(self.like_url)
+        response = self.client.delete(self.like_url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        response = self.client.delete(self.like_url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertFalse(Like.objects.filter(tweet=self.tweet).exists())
+        self.tweet.refresh_from_db()
+        self.assertEqual(self.tweet.like_count, 0)
+
+    def test_like_missing_tweet(self):
+        """Test liking a missing tweet returns 404"""
+        response = self.client.post("/api/v1/tweets/999999/like")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.delete("/api/v1/tweets/999999/like")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Like.objects.exists())
+
+    def test_like_count_rolled_back_with_insert(self):
+        """Test a failing like_count update also rolls back the Like row"""
+        with mock.patch.object(TweetQuerySet, "adjust_like_count", side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError), transaction.atomic():
+                Like.objects.like(self.user, self.tweet.pk)
+        self.assertFalse(Like.objects.exists())
+
+    def test_liked_lookup(self):
+        """Test GET /api/v1/tweets/liked?ids= runs one query"""
+        self.client.post(self.like_url)
+        url = f"/api/v1/tweets/liked?ids={self.tweet.pk},{self.other_tweet.pk}"
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["liked"], [self.tweet.pk])
+
+    def test_liked_lookup_invalid_ids(self):
+        """Test GET /api/v1/tweets/liked with non-numeric ids"""
+        response = self.client.get("/api/v1/tweets/liked?ids=1,abc")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class HomeTimelineTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.reader = User.objects.create_user(username="reader", password="testpassword123")
+        self.author = User.objects.create_user(username="author", password="testpassword123")
+        self.stranger = User.objects.create_user(username="stranger", password="testpassword123")
+        Follow.objects.create(follower=self.reader, following=self.author)
+        self.timeline_url = "/api/v1/timeline"
+
+    def post_tweet(self, user, payload):
+        self.client.force_authenticate(user=user)
+        response = self.client.post("/api/v1/tweets", {"payload": payload})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data["id"]
+
+    def get_timeline_ids(self, user):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(self.timeline_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [tweet["id"] for tweet in response.data["results"]]
+
+    def test_fan_out_on_write(self):
+        """Test new tweets are pushed to followers' and the author's timelines"""
+        own = self.post_tweet(self.reader, "mine")
+        followed = self.post_tweet(self.author, "followed")
+        self.post_tweet(self.stranger, "not followed")
+
+        self.assertEqual(self.get_timeline_ids(self.reader), [followed, own])
+        self.assertTrue(TimelineEntry.objects.filter(owner=self.reader, tweet_id=followed).exists())
+
+    @override_settings(TIMELINE_FANOUT_FOLLOWER_LIMIT=0)
+    def test_high_follower_author_merged_on_read(self):
+        """Test tweets from authors over the fan-out limit are merged at read time"""
+        own = self.post_tweet(self.reader, "mine")
+        celebrity = self.post_tweet(self.author, "celebrity")
+
+        self.assertFalse(TimelineEntry.objects.filter(owner=self.reader, tweet_id=celebrity).exists())
+        self.assertEqual(self.get_timeline_ids(self.reader), [celebrity, own])
+
+    @override_settings(TIMELINE_FANOUT_FOLLOWER_LIMIT=0)
+    def test_celebrity_cache_stays_warm(self):
+        """Test a known celebrity's tweets keep the cached set, and a cold read is one indexed query"""
+        self.post_tweet(self.author, "first")
+        with self.assertNumQueries(1):  # FollowerCount count 인덱스 범위 조회
+            self.assertEqual(timeline.get_celebrity_ids(), {self.author.pk})
+        self.post_tweet(self.author, "second")
+        with self.assertNumQueries(0):
+            timeline.get_celebrity_ids()
+
+    @override_settings(TIMELINE_MAX_LENGTH=2, TIMELINE_TRIM_PROBABILITY=1)
+    def test_timeline_is_capped(self):
+        """Test timelines keep only TIMELINE_MAX_LENGTH entries"""
+        ids = [self.post_tweet(self.author, f"tweet {i}") for i in range(4)]
+        entries = TimelineEntry.objects.filter(owner=self.reader).order_by("-created_at", "-tweet_id")
+        self.assertEqual(list(entries.values_list("tweet_id", flat=True)), ids[:1:-1])
+
+    @override_settings(TIMELINE_MAX_LENGTH=2, TIMELINE_TRIM_PROBABILITY=0)
+    def test_timeline_trimmed_lazily(self):
+        """Test fan-out skips the trim unless sampled, and trim() cuts the same tie-broken position"""
+        ids = [self.post_tweet(self.author, f"tweet {i}") for i in range(4)]
+        entries = TimelineEntry.objects.filter(owner=self.reader).order_by("-created_at", "-tweet_id")
+        self.assertEqual(entries.count(), 4)
+        TimelineEntry.objects.filter(owner=self.reader).update(created_at=timezone.now())
+        with self.assertNumQueries(2):
+            timeline.trim(self.reader.pk)
+        self.assertEqual(list(entries.values_list("tweet_id", flat=True)), ids[:1:-1])
+
+    def test_timeline_queries(self):
+        """Test GET /api/v1/timeline runs a fixed number of queries"""
+        self.post_tweet(self.author, "first")
+        self.get_timeline_ids(self.reader)  # 유명인 캐시 채우기
+        self.post_tweet(self.author, "second")
+        self.client.force_authenticate(user=self.reader)
+        # 타임라인 범위 스캔 1번 + 트윗 일괄 조회 1번
+        with self.assertNumQueries(2):
+            self.client.get(self.timeline_url)
+
+
+class TweetResponseCacheTestCase(APITestCase):
+    def setUp(self):
+        response_cache.cache.clear()
+        response_cache.reset_stats()
+        self.user = User.objects.create_user(username="cacheuser", password="testpassword123")
+        self.tweet = Tweet.objects.create(payload="cached", user=self.user)
+        self.detail_url = f"/api/v1/tweets/{self.tweet.pk}"
+        self.client.force_authenticate(user=self.user)
+
+    def test_list_served_from_cache(self):
+        """Test repeated GET /api/v1/tweets hits the cache"""
+        self.client.get("/api/v1/tweets")
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/v1/tweets")
+        self.assertEqual(response.data["results"][0]["id"], self.tweet.pk)
+        self.assertEqual(response_cache.stats()["hits"], 1)
+        self.assertEqual(response_cache.stats()["misses"], 1)
+
+    def test_pages_cached_separately(self):
+        """Test each page has its own cache entry"""
+        Tweet.objects.create(payload="second", user=self.user)
+        first = self.client.get("/api/v1/tweets?page_size=1")
+        second = self.client.get(first.data["next"])
+        self.assertNotEqual(first.data["results"], second.data["results"])
+
+    def test_post_invalidates_list(self):
+        """Test POST /api/v1/tweets invalidates cached lists"""
+        self.client.get("/api/v1/tweets")
+        self.client.post("/api/v1/tweets", {"payload": "fresh"})
+        response = self.client.get("/api/v1/tweets")
+        self.assertEqual(response.data["results"][0]["payload"], "fresh")
+
+    def test_put_and_delete_invalidate_detail(self):
+        """Test PUT/DELETE /api/v1/tweets/<pk> invalidate the cached detail"""
+        self.client.get(self.detail_url)
+        self.client.put(self.detail_url, {"payload": "edited"})
+        self.assertEqual(self.client.get(self.detail_url).data["payload"], "edited")
+
+        self.client.delete(self.detail_url)
+        self.assertEqual(self.client.get(self.detail_url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalidated_again_after_commit(self):
+        """Test a page cached from pre-commit data between the write and the commit is dropped on commit"""
+        url = "/api/v1/tweets"
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                Tweet.objects.create(payload="fresh", user=self.user)
+                # 커밋 전 데이터를 본 동시 요청이 새 세대 키에 목록을 캐시한 상황
+                response_cache.set_list(APIRequestFactory().get(url), {"results": [], "next": None})
+        self.assertEqual(self.client.get(url).data["results"][0]["payload"], "fresh")
+
+    def test_like_invalidates_detail(self):
+        """Test liking a tweet invalidates the cached detail"""
+        self.client.get(self.detail_url)
+        self.client.post(f"{self.detail_url}/like")
+        self.assertEqual(self.client.get(self.detail_url).data["like_count"], 1)
+
+    @override_settings(RESPONSE_CACHE_COUNTS_TTL=5)
+    def test_like_staleness_bound(self):
+        """
+        Test the like contract: the detail is invalidated at once, list pages within RESPONSE_CACHE_COUNTS_TTL
+
+        Likes don't drop cached list pages. A page may show the old like_count for up to
+        RESPONSE_CACHE_COUNTS_TTL seconds and then re-reads only the counts.
+        """
+        with mock.patch("tweets.cache.time.time", return_value=1000.0) as now:
+            self.client.get("/api/v1/tweets")
+            self.client.get(self.detail_url)
+            self.client.post(f"{self.detail_url}/like")
+            self.assertEqual(self.client.get(self.detail_url).data["like_count"], 1)
+
+            now.return_value = 1004.9
+            with self.assertNumQueries(0):
+                response = self.client.get("/api/v1/tweets")
+            self.assertEqual(response.data["results"][0]["like_count"], 0)
+
+            now.return_value = 1005.0
+            with self.assertNumQueries(1):  # 페이지 트윗의 like_count만
+                response = self.client.get("/api/v1/tweets")
+            self.assertEqual(response.data["results"][0]["like_count"], 1)
+            self.assertEqual(response.data["results"][0]["payload"], "cached")
+
+            self.client.delete(f"{self.detail_url}/like")
+            now.return_value = 1010.0
+            self.assertEqual(self.client.get("/api/v1/tweets").data["results"][0]["like_count"], 0)
+        # 목록 첫 조회, 좋아요 전후의 상세 조회만 캐시를 놓쳤다
+        self.assertEqual(response_cache.stats()["misses"], 3)
+
+    def test_cache_stats_admin_only(self):
+        """Test GET /api/v1/tweets/cache-stats requires staff"""
+        response = self.client.get("/api/v1/tweets/cache-stats")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get("/api/v1/tweets/cache-stats")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("hit_rate", response.data)
+
+
+class LoadDataCommandTestCase(APITestCase):
+    def write(self, directory, name, content):
+        path = Path(directory) / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    def test_load_users_tweets_and_likes(self):
+        """Test load_data streams CSV/JSONL files in batches"""
+        with tempfile.TemporaryDirectory() as tmp:
+            users = self.write(tmp, "users.csv", "username,email,password\nalice,a@example.com,pw\nbob,,\n")
+            tweets = self.write(
+                tmp,
+                "tweets.jsonl",
+                '{"user": "alice", "payload": "hello", "created_at": "2024-01-02T03:04:05+00:00"}\n'
+                '{"user": "bob", "payload": "hi"}\n'
+                '{"user": "ghost", "payload": "skipped"}\n',
+            )
+            call_command("load_data", users=users, tweets=tweets, batch_size=2, stdout=StringIO())
+
+            alice_tweet = Tweet.objects.get(payload="hello")
+            self.assertEqual(alice_tweet.user.username, "alice")
+            self.assertEqual(alice_tweet.created_at.year, 2024)
+            self.assertFalse(Tweet.objects.filter(payload="skipped").exists())
+            self.assertFalse(User.objects.get(username="bob").has_usable_password())
+
+            likes = self.write(
+                tmp,
+                "likes.csv",
+                f"user,tweet_id\nalice,{alice_tweet.pk}\nbob,{alice_tweet.pk}\nalice,{alice_tweet.pk}\n",
+            )
+            out = StringIO()
+            call_command("load_data", likes=likes, batch_size=2, stdout=out)
+
+        # ignore_conflicts로 무시된 중복 좋아요는 적재 건수에 들어가지 않는다
+        self.assertIn("3행 중 2행을", out.getvalue())
+        self.assertEqual(Like.objects.filter(tweet=alice_tweet).count(), 2)
+        alice_tweet.refresh_from_db()
+        self.assertEqual(alice_tweet.like_count, 2)
+
+    def test_single_insert_and_shared_password_hash(self):
+        """Test tweets keep created_at without a second UPDATE and equal passwords are hashed once"""
+        with tempfile.TemporaryDirectory() as tmp:
+            users = self.write(tmp, "users.csv", "username,password\nalice,samepassword\nbob,samepassword\n")
+            with mock.patch("tweets.management.commands.load_data.make_password", wraps=make_password) as hasher:
+                call_command("load_data", users=users, stdout=StringIO())
+            hasher.assert_called_once_with("samepassword")
+            self.assertTrue(User.objects.get(username="bob").check_password("samepassword"))
+
+            tweets = self.write(
+                tmp, "tweets.jsonl", '{"user": "alice", "payload": "old", "created_at": "2024-01-02T03:04:05+00:00"}\n'
+            )
+            with CaptureQueriesContext(connection) as queries:
+                call_command("load_data", tweets=tweets, stdout=StringIO())
+        self.assertFalse([query for query in queries if query["sql"].startswith('UPDATE "tweets_tweet"')])
+        tweet = Tweet.objects.get(payload="old")
+        self.assertEqual((tweet.created_at.year, tweet.updated_at.year), (2024, 2024))
+        self.assertTrue(Tweet._meta.get_field("created_at").auto_now_add)
+
+    def test_missing_column(self):
+        """Test a row without a required field raises CommandError naming the file and line"""
+        with tempfile.TemporaryDirectory() as tmp:
+            tweets = self.write(tmp, "tweets.jsonl", '{"user": "alice", "payload": "ok"}\n{"payload": "no user"}\n')
+            with self.assertRaisesMessage(CommandError, f"{tweets}:2: user_id 또는 user 값이 없습니다"):
+                call_command("load_data", tweets=tweets, stdout=StringIO())
+
+    def test_invalid_values(self):
+        """Test malformed ids and timestamps raise CommandError naming the file and line"""
+        User.objects.create_user(username="alice", password="password123")
+        cases = [
+            ("tweets.csv", "user_id,payload\nabc,hi\n", "tweets", ":2: user_id은(는) 정수여야 합니다: 'abc'"),
+            (
+                "tweets.jsonl",
+                '\n{"user": "alice", "payload": "hi", "created_at": "yesterday"}\n',
+                "tweets",
+                ":2: created_at",
+            ),
+            (
+                "tweets.jsonl",
+                '{"user": "alice", "payload": "hi", "created_at": "2024-13-01T00:00:00"}\n',
+                "tweets",
+                ":1: created_at",
+            ),
+            ("tweets.jsonl", "[1, 2]\n", "tweets", ":1: JSON 객체여야 합니다"),
+            ("likes.csv", "user,tweet_id\nalice,1x\n", "likes", ":2: tweet_id은(는) 정수여야 합니다: '1x'"),
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, content, option, message in cases:
+                with self.subTest(content=content):
+                    path = self.write(tmp, name, content)
+                    with self.assertRaisesMessage(CommandError, path + message):
+                        call_command("load_data", stdout=StringIO(), **{option: path})
+        self.assertFalse(Tweet.objects.exists())
+
+
+class TweetExportAPITestCase(APITestCase):
+    def setUp(self):
+        self.alice = User.objects.create_user(username="alice", password="password123")
+        self.bob = User.objects.create_user(username="bob", password="password123")
+        self.old = Tweet.objects.create(user=self.alice, payload='old "quoted" 한글')
+        Tweet.objects.filter(pk=self.old.pk).update(created_at=self.old.created_at - timedelta(days=10))
+        self.new = Tweet.objects.create(user=self.bob, payload="new")
+        self.client.force_authenticate(user=self.alice)
+
+    def export(self, query=""):
+        response = self.client.get(f"/api/v1/tweets/export{query}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_ndjson_matches_serializer(self):
+        """Test NDJSON export streams one serializer-compatible row per line"""
+        response, body = self.export()
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in body.splitlines()]
+        expected = TweetSerializer(Tweet.objects.order_by("-created_at", "-id"), many=True).data
+        self.assertEqual(rows, json.loads(json.dumps(expected)))
+
+    def test_json_array_with_filters(self):
+        """Test JSON array export honours user and date range filters"""
+        _, body = self.export(f"?output=json&user={self.bob.pk}")
+        self.assertEqual([row["id"] for row in json.loads(body)], [self.new.pk])
+
+        since = (self.new.created_at - timedelta(days=1)).date().isoformat()
+        _, body = self.export(f"?output=json&since={since}")
+        self.assertEqual([row["id"] for row in json.loads(body)], [self.new.pk])
+
+        _, body = self.export(f"?output=json&until={since}")
+        self.assertEqual([row["id"] for row in json.loads(body)], [self.old.pk])
+
+        _, body = self.export(f"?output=json&user={self.alice.pk}&since={since}")
+        self.assertEqual(json.loads(body), [])
+
+    def test_invalid_parameters(self):
+        """Test export rejects unknown formats and malformed filters"""
+        for query in ("?output=xml", "?user=abc", "?since=yesterday", "?until=2024-01-01T25:00", "?since=2024-02-30"):
+            response = self.client.get(f"/api/v1/tweets/export{query}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, query)
+
+    def test_requires_authentication(self):
+        """Test export requires authentication"""
+        self.client.force_authenticate(user=None)
+        response = self.client.get("/api/v1/tweets/export")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TweetSearchTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="alice", password="password123")
+        self.django = Tweet.objects.create(user=self.user, payload="Django Django tips")
+        self.python = Tweet.objects.create(user=self.user, payload="python and django")
+        self.elon = Tweet.objects.create(user=self.user, payload="elon musk bought it")
+        self.client.force_authenticate(user=self.user)
+
+    def search(self, query):
+        response = self.client.get("/api/v1/tweets/search", {"q": query} if isinstance(query, str) else query)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [tweet["id"] for tweet in response.json()["results"]]
+
+    def test_ranked_search(self):
+        """Test search ranks tweets by bm25 relevance"""
+        self.assertEqual(self.search("django"), [self.django.pk, self.python.pk])
+        self.assertEqual(self.search("python django"), [self.python.pk])
+        self.assertEqual(self.search("dja"), [])
+
+    def test_prefix_and_recent_order(self):
+        """Test trailing * does a prefix search and order=recent paginates newest first"""
+        self.assertEqual(
+            self.search({"q": "dja*", "order": "recent"}),
+            [self.python.pk, self.django.pk],
+        )
+
+    def test_index_follows_writes(self):
+        """Test the index is kept in sync on update and delete"""
+        self.python.payload = "only python now"
+        self.python.save()
+        self.django.delete()
+        self.assertEqual(self.search("django"), [])
+        self.assertEqual(self.search("python"), [self.python.pk])
+
+    def test_operators_are_not_interpreted(self):
+        """Test FTS5 syntax in the query is treated as plain words"""
+        self.assertEqual(self.search('django" OR NEAR(elon'), [])
+        response = self.client.get("/api/v1/tweets/search", {"q": "!!!"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_rebuild_command_and_admin_filter(self):
+        """Test rebuild_search_index and ElonMuskFilter use the index"""
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {search.FTS_TABLE}({search.FTS_TABLE}) VALUES ('delete-all')")
+        self.assertEqual(self.search("django"), [])
+        call_command("rebuild_search_index", stdout=StringIO())
+        self.assertEqual(self.search("django"), [self.django.pk, self.python.pk])
+
+        elon_filter = ElonMuskFilter(None, {"elon_musk": ["contains"]}, Tweet, None)
+        self.assertEqual(list(elon_filter.queryset(None, Tweet.objects.all())), [self.elon])
+
+
+class TweetListHTMLTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="htmluser", password="testpassword123")
+        Tweet.objects.bulk_create([Tweet(user=self.user, payload=f"tweet {i}") for i in range(25)])
+
+    def test_paginated(self):
+        """Test GET / renders one page of tweets with links to older and newer pages"""
+        response = self.client.get("/")
+        self.assertEqual(len(response.context["tweets"]), 20)
+        self.assertContains(response, "@htmluser", count=20)
+        self.assertContains(response, 'rel="next"')
+        self.assertNotContains(response, 'rel="prev"')
+
+        response = self.client.get(response.context["next"])
+        self.assertEqual(len(response.context["tweets"]), 5)
+        self.assertContains(response, 'rel="prev"')
+        self.assertEqual(self.client.get("/", {"cursor": "broken"}).status_code, 404)
+
+    def test_fragment_cache_keyed_on_updated_at(self):
+        """Test tweet cards are served from the fragment cache until updated_at changes"""
+        tweet = Tweet.objects.order_by("-created_at", "-id").first()
+        self.client.get("/")
+        # updated_at을 건드리지 않은 변경은 캐시된 조각에 반영되지 않는다
+        Tweet.objects.filter(pk=tweet.pk).update(payload="changed behind the cache")
+        self.assertNotContains(self.client.get("/"), "changed behind the cache")
+
+        tweet.refresh_from_db()
+        tweet.payload = "edited"
+        tweet.save()
+        self.assertContains(self.client.get("/"), "edited")
+
+
+class LargeTableAdminTestCase(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(username="admin", password="testpassword123")
+        self.alice = User.objects.create_user(username="alice", password="testpassword123")
+        self.tweet = Tweet.objects.create(user=self.alice, payload="hello")
+        Like.objects.like(self.admin, self.tweet.pk)
+        self.client.force_login(self.admin)
+
+    def grow(self):
+        start = User.objects.count()
+        for i in range(start, start + 5):
+            author = User.objects.create_user(username=f"author{i}", password="testpassword123")
+            tweet = Tweet.objects.create(user=author, payload=f"tweet {i}")
+            Like.objects.like(author, tweet.pk)
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, [query["sql"] for query in captured]
+
+    def test_changelists_skip_count_and_row_queries(self):
+        """Test the changelists run no COUNT(*) and a fixed number of queries"""
+        for url in ["/admin/tweets/tweet/", "/admin/tweets/like/"]:
+            with self.subTest(url=url):
+                self.get(url)  # 세션 사용자를 인증 캐시에 올린다
+                _, before = self.get(url)
+                self.assertFalse([sql for sql in before if "COUNT(" in sql.upper()])
+                self.grow()
+                _, after = self.get(url)
+                self.assertEqual(len(after), len(before))
+
+    def test_username_filter(self):
+        """Test the user filter is a username input, not a list of every user"""
+        response, queries = self.get("/admin/tweets/tweet/")
+        self.assertContains(response, 'name="username"')
+        self.assertNotContains(response, f"?user__id__exact={self.alice.pk}")
+
+        self.grow()
+        response, queries = self.get("/admin/tweets/tweet/?username=alice")
+        self.assertEqual(list(response.context["cl"].result_list), [self.tweet])
+        # 필터가 걸리면 최대 count_limit행까지만 센다
+        self.assertTrue([sql for sql in queries if "COUNT(" in sql.upper() and "LIMIT" in sql.upper()])
+
+
+class TweetEntityTestCase(APITestCase):
+    def setUp(self):
+        self.alice = User.objects.create_user(username="alice", password="password123")
+        self.bob = User.objects.create_user(username="bob.kim", password="password123")
+        self.client.force_authenticate(user=self.alice)
+
+    def post(self, payload):
+        response = self.client.post("/api/v1/tweets", {"payload": payload}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.json()["id"]
+
+    def test_extract_on_create_and_update(self):
+        """Test #tags and @mentions are indexed on create and re-indexed on edit"""
+        tweet_id = self.post("#Django 좋아요 @bob.kim. @ghost a#b x@y.com #파이썬")
+        self.assertEqual(
+            set(TweetTag.objects.filter(tweet_id=tweet_id).values_list("tag", flat=True)),
+            {"django", "파이썬"},
+        )
+        self.assertEqual(list(Mention.objects.filter(tweet_id=tweet_id).values_list("user", flat=True)), [self.bob.pk])
+
+        response = self.client.put(f"/api/v1/tweets/{tweet_id}", {"payload": "#python only"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(TweetTag.objects.filter(tweet_id=tweet_id).values_list("tag", flat=True)), ["python"])
+        self.assertFalse(Mention.objects.filter(tweet_id=tweet_id).exists())
+
+    def test_tag_and_mention_lists(self):
+        """Test tag and mention lists read the index with cursor pagination"""
+        first = self.post("#django first @bob.kim")
+        second = self.post("#Django second")
+        self.post("no tags")
+
+        response = self.client.get("/api/v1/tags/DJANGO/tweets?page_size=1")
+        self.assertEqual([tweet["id"] for tweet in response.json()["results"]], [second])
+        response = self.client.get(response.json()["next"])
+        self.assertEqual([tweet["id"] for tweet in response.json()["results"]], [first])
+        self.assertIsNone(response.json()["next"])
+
+        self.client.force_authenticate(user=self.bob)
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/v1/tweets/mentions")
+        self.assertEqual([tweet["id"] for tweet in response.json()["results"]], [first])
+
+
+class TrendTestCase(APITestCase):
+    def setUp(self):
+        trend_tracker.clear()
+        self.user = User.objects.create_user(username="alice", password="password123")
+        self.client.force_authenticate(user=self.user)
+
+    def test_sliding_window(self):
+        """Test counts fall out of the window bucket by bucket"""
+        tracker = TrendTracker({"1m": 60}, 6)
+        tracker.record("#Django #python", now=1000)
+        tracker.record("#django", now=1030)
+        self.assertEqual(tracker.top("hashtags", "1m", now=1030), [("django", 2), ("python", 1)])
+        # 1000초 버킷(1000~1009)이 윈도 밖으로 밀려난다
+        self.assertEqual(tracker.top("hashtags", "1m", now=1065), [("django", 1)])
+        self.assertEqual(tracker.top("hashtags", "1m", now=1100), [])
+
+    def test_keywords_skip_tags_mentions_and_stopwords(self):
+        """Test keywords exclude hashtags, mentions and stopwords"""
+        tracker = TrendTracker({"1m": 60}, 6)
+        tracker.record("the Deploy failed #ops @alice deploy 2024", now=0)
+        self.assertEqual(tracker.top("keywords", "1m", now=0), [("failed", 1), ("deploy", 1)])
+
+    def test_checkpoint_restore(self):
+        """Test a new process merges checkpoints of exited processes but not of live ones"""
+        with tempfile.TemporaryDirectory() as tmp:
+            tracker = TrendTracker({"1m": 60}, 6, checkpoint_dir=tmp, checkpoint_interval=3600)
+            tracker.record("#django", now=time.time())
+            tracker.checkpoint()
+            # 종료된 프로세스 둘(pid_max보다 큰 pid)과 살아 있는 부모 프로세스의 파일
+            own = Path(tmp) / f"{os.getpid()}.json"
+            shutil.copy(own, Path(tmp) / "4194400.json")
+            own.rename(Path(tmp) / "4194401.json")
+            tracker.record("#python", now=time.time())
+            tracker.checkpoint()
+            own.rename(Path(tmp) / f"{os.getppid()}.json")
+
+            restored = TrendTracker({"1m": 60}, 6, checkpoint_dir=tmp, checkpoint_interval=3600)
+            restored.start()
+            self.assertEqual(restored.top("hashtags", "1m"), [("django", 2)])
+            self.assertEqual(sorted(path.name for path in Path(tmp).iterdir()), [f"{os.getppid()}.json"])
+
+            # 버킷 크기가 바뀌면 체크포인트를 쓰지 않는다
+            restored.checkpoint()
+            own.rename(Path(tmp) / "4194402.json")
+            self.assertEqual(TrendTracker({"1m": 60}, 3, checkpoint_dir=tmp).top("hashtags", "1m"), [])
+
+    def test_trends_api_is_fed_by_new_tweets(self):
+        """Test creating tweets feeds the trends endpoint without querying tweets"""
+        for payload in ("#django rocks", "#django #python", "#python"):
+            self.client.post("/api/v1/tweets", {"payload": payload}, format="json")
+        self.client.post("/api/v1/tweets", {"payload": "#django again"}, format="json")
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/v1/trends?window=5m&limit=1")
+        self.assertEqual(response.json()["trends"], [{"term": "django", "count": 3}])
+
+        response = self.client.get("/api/v1/trends?window=1y")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TweetBatchAPITestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="alice", password="password123")
+        self.follower = User.objects.create_user(username="bob", password="password123")
+        Follow.objects.create(follower=self.follower, following=self.user)
+        self.client.force_authenticate(user=self.user)
+
+    def test_batch_create(self):
+        """Test batch create writes every tweet and runs fan-out, indexing and cache invalidation"""
+        self.client.get("/api/v1/tweets")
+        payloads = [{"payload": f"batch {i} #bulk"} for i in range(3)]
+        response = self.client.post("/api/v1/tweets/batch", payloads, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        ids = [tweet["id"] for tweet in response.json()["results"]]
+        self.assertEqual(len(ids), 3)
+        self.assertEqual(TimelineEntry.objects.filter(owner=self.follower, tweet_id__in=ids).count(), 3)
+        self.assertEqual(TweetTag.objects.filter(tag="bulk").count(), 3)
+        self.assertEqual(len(self.client.get("/api/v1/tweets").json()["results"]), 3)
+
+    def test_batch_create_invalidates_after_commit(self):
+        """Test a list page cached before the batch commits is dropped once it commits"""
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post("/api/v1/tweets/batch", [{"payload": "one"}, {"payload": "two"}], format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        # 커밋 전 데이터를 본 동시 요청이 새 세대 키에 빈 목록을 캐시한 상황
+        response_cache.set_list(APIRequestFactory().get("/api/v1/tweets"), {"results": [], "next": None})
+        for callback in callbacks:
+            callback()
+        self.assertEqual(len(self.client.get("/api/v1/tweets").json()["results"]), 2)
+
+    def test_batch_create_is_all_or_nothing(self):
+        """Test one invalid item rejects the whole batch with per-item errors"""
+        response = self.client.post("/api/v1/tweets/batch", [{"payload": "ok"}, {"payload": ""}], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(response.json()), ["1"])
+        self.assertIn("payload", response.json()["1"])
+        self.assertFalse(Tweet.objects.exists())
+
+        too_many = [{"payload": "x"}] * 101
+        response = self.client.post("/api/v1/tweets/batch", too_many, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_delete(self):
+        """Test batch delete removes only owned tweets and reports each id"""
+        mine = Tweet.objects.create(user=self.user, payload="mine")
+        theirs = Tweet.objects.create(user=self.follower, payload="theirs")
+        response = self.client.delete("/api/v1/tweets/batch", {"ids": [mine.pk, theirs.pk, 999999]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {"id": mine.pk, "result": "deleted"},
+                {"id": theirs.pk, "result": "forbidden"},
+                {"id": 999999, "result": "not_found"},
+            ],
+        )
+        self.assertFalse(Tweet.objects.filter(pk=mine.pk).exists())
+        self.assertTrue(Tweet.objects.filter(pk=theirs.pk).exists())
+
+        response = self.client.delete("/api/v1/tweets/batch", {"ids": "1,2"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        # true는 id 1로 취급하지 않는다
+        response = self.client.delete("/api/v1/tweets/batch", {"ids": [True]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TweetConditionalGetTestCase(APITestCase):
+    def setUp(self):
+        response_cache.invalidate()
+        self.user = User.objects.create_user(username="alice", password="password123")
+        self.tweet = Tweet.objects.create(user=self.user, payload="hello")
+        self.url = f"/api/v1/tweets/{self.tweet.pk}"
+        self.client.force_authenticate(user=self.user)
+
+    def test_etag(self):
+        """Test detail returns 304 for a matching ETag from cache and database"""
+        response = self.client.get(self.url)
+        etag = response["ETag"]
+        self.assertNotIn("Last-Modified", response)
+
+        # 캐시된 응답과 DB에서 만든 검증자가 같아야 한다
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        response_cache.invalidate(self.tweet.pk)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_if_modified_since_after_like(self):
+        """Test If-Modified-Since cannot return a stale 304 after a like"""
+        self.client.get(self.url)
+        since = http_date(self.tweet.updated_at.timestamp() + 60)
+        Like.objects.like(self.user, self.tweet.pk)
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["like_count"], 1)
+
+    def test_like_changes_etag(self):
+        """Test a like invalidates the ETag even though updated_at is unchanged"""
+        etag = self.client.get(self.url)["ETag"]
+        Like.objects.like(self.user, self.tweet.pk)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["like_count"], 1)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class TweetRowMapperTestCase(APITestCase):
+    def test_bytes_match_serializer(self):
+        """Test the row mapper and FastJSONRenderer produce TweetSerializer's exact bytes"""
+        user = User.objects.create_user(username="유저", password="password123")
+        for payload in ('따옴표 "quote" \\ 백슬래시', "line\u2028sep\u2029", "emoji 🎉 <b>&"):
+            Tweet.objects.create(user=user, payload=payload)
+        Tweet.objects.update(like_count=3)
+
+        tweets = Tweet.objects.with_author().order_by("-created_at", "-id")
+        expected = JSONRenderer().render(TweetSerializer(tweets, many=True).data)
+        values = rows.values(Tweet.objects.order_by("-created_at", "-id"))
+        self.assertEqual(FastJSONRenderer().render(rows.to_dicts(values)), expected)
+
+        with override_settings(TIME_ZONE="Asia/Seoul"):
+            expected = JSONRenderer().render(TweetSerializer(tweets, many=True).data)
+            self.assertEqual(FastJSONRenderer().render(rows.to_dicts(values)), expected)
+
+    def test_micro_benchmark_command(self):
+        """Test benchmark_serializers compares both paths on identical output"""
+        user = User.objects.create_user(username="alice", password="password123")
+        Tweet.objects.create(user=user, payload="hello")
+        out = StringIO()
+        call_command("benchmark_serializers", rows=1, iterations=2, stdout=out)
+        self.assertIn("출력 바이트 동일", out.getvalue())
@@ -0,0 +1,114 @@
+"""홈 타임라인 (fan-out-on-write)
+
+새 트윗은 작성 시점에 작성자와 팔로워들의 TimelineEntry로 복사된다. 팔로워가
+TIMELINE_FANOUT_FOLLOWER_LIMIT보다 많은 작성자는 복사하지 않고, 읽을 때 그
+작성자의 최신 트윗을 인덱스로 따로 읽어 병합한다. 그런 작성자 목록은 팔로워 수
+카운터(FollowerCount)의 count 인덱스로 찾아 TIMELINE_CELEBRITY_CACHE_TIMEOUT초 동안 캐시한다.
+
+타임라인 길이 제한은 팬아웃 때마다 모든 팔로워에 걸지 않고 TIMELINE_TRIM_PROBABILITY
+확률로 뽑힌 타임라인만 자른다. 그래서 타임라인은 TIMELINE_MAX_LENGTH보다 평균
+1 / TIMELINE_TRIM_PROBABILITY개쯤 길어질 수 있다.
+"""
+
+import random
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from users.models import Follow, FollowerCount
+
+from .models import TimelineEntry, Tweet
+
+CELEBRITY_CACHE_KEY = "timeline:celebrities"
+BATCH_SIZE = 500
+
+
+def get_celebrity_ids():
+    """팬아웃 대상에서 빠지는(팔로워가 너무 많은) 사용자 id 집합"""
+    celebrity_ids = cache.get(CELEBRITY_CACHE_KEY)
+    if celebrity_ids is None:
+        celebrities = FollowerCount.objects.filter(count__gt=settings.TIMELINE_FANOUT_FOLLOWER_LIMIT)
+        celebrity_ids = set(celebrities.values_list("user_id", flat=True))
+        cache.set(CELEBRITY_CACHE_KEY, celebrity_ids, settings.TIMELINE_CELEBRITY_CACHE_TIMEOUT)
+    return celebrity_ids
+
+
+def fan_out(*tweets):
+    """새 트윗들을 작성자와 팔로워들의 타임라인에 넣는다. 팔로워는 작성자마다 한 번 조회한다."""
+    limit = settings.TIMELINE_FANOUT_FOLLOWER_LIMIT
+    by_author = {}
+    for tweet in tweets:
+        by_author.setdefault(tweet.user_id, []).append(tweet)
+
+    entries, owner_ids = [], set()
+    for author_id, author_tweets in by_author.items():
+        followers = Follow.objects.filter(following_id=author_id).values_list("follower_id", flat=True)
+        follower_ids = list(followers[: limit + 1])
+        if len(follower_ids) > limit:
+            # 읽기 시점 병합으로 전환: 작성자 본인 타임라인에만 넣는다
+            follower_ids = []
+            cached = cache.get(CELEBRITY_CACHE_KEY)
+            if cached is not None and author_id not in cached:
+                cache.delete(CELEBRITY_CACHE_KEY)
+        author_owner_ids = [author_id, *follower_ids]
+        owner_ids.update(author_owner_ids)
+        entries += [
+            TimelineEntry(owner_id=owner_id, tweet=tweet, created_at=tweet.created_at)
+            for tweet in author_tweets
+            for owner_id in author_owner_ids
+        ]
+    TimelineEntry.objects.bulk_create(entries, batch_size=BATCH_SIZE, ignore_conflicts=True)
+    probability = settings.TIMELINE_TRIM_PROBABILITY
+    for owner_id in sorted(owner_ids):
+        if random.random() < probability:
+            trim(owner_id)
+
+
+def backfill(follower, following):
+    """새로 팔로우한 사용자의 최근 트윗을 타임라인에 채운다."""
+    if following.pk in get_celebrity_ids():
+        return
+    tweets = Tweet.objects.filter(user=following).order_by("-created_at", "-id")
+    tweets = tweets.values_list("id", "created_at")[: settings.TIMELINE_MAX_LENGTH]
+    entries = [
+        TimelineEntry(owner=follower, tweet_id=tweet_id, created_at=created_at) for tweet_id, created_at in tweets
+    ]
+    TimelineEntry.objects.bulk_create(entries, batch_size=BATCH_SIZE, ignore_conflicts=True)
+    trim(follower.pk)
+
+
+def remove_author(follower, following):
+    """언팔로우한 사용자의 트윗을 타임라인에서 뺀다."""
+    TimelineEntry.objects.filter(owner=follower, tweet__user=following).delete()
+
+
+def trim(owner_id):
+    """
+    타임라인을 최신 TIMELINE_MAX_LENGTH개로 자른다.
+
+    (owner, -created_at, -tweet) 인덱스에서 TIMELINE_MAX_LENGTH번째 다음 항목을 찾고,
+    그보다 오래된 항목을 같은 인덱스 범위로 지운다.
+    """
+    entries = TimelineEntry.objects.filter(owner_id=owner_id)
+    max_length = settings.TIMELINE_MAX_LENGTH
+    cutoff = entries.order_by("-created_at", "-tweet_id").values_list("created_at", "tweet_id")
+    cutoff = cutoff[max_length : max_length + 1]
+    for created_at, tweet_id in cutoff:
+        entries.filter(older_than(created_at, tweet_id)).delete()
+
+
+def older_than(created_at, tweet_id):
+    """(created_at, tweet_id) 위치와 그보다 오래된 항목"""
+    return Q(created_at__lt=created_at) | Q(created_at=created_at, tweet_id__lte=tweet_id)
+
+
+def home_timeline_sources(user):
+    """KeysetPagination.paginate_sources()에 넘길 홈 타임라인 소스 목록"""
+    sources = [(TimelineEntry.objects.filter(owner=user), ("created_at", "tweet_id"))]
+    celebrity_ids = get_celebrity_ids()
+    if celebrity_ids:
+        followed = Follow.objects.filter(follower=user, following_id__in=celebrity_ids)
+        for following_id in followed.values_list("following_id", flat=True):
+            sources.append((Tweet.objects.filter(user_id=following_id), ("created_at", "id")))
+    return sources
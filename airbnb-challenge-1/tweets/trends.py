@@ -0,0 +1,237 @@
+"""트렌드 해시태그/키워드 (프로세스 내 슬라이딩 윈도 카운터)
+
+새 트윗이 작성될 때 record()가 해시태그와 키워드를 윈도별 버킷 카운터에 더한다.
+윈도는 TRENDS_BUCKETS_PER_WINDOW개의 버킷으로 나뉘고, 윈도 밖으로 밀려난 버킷은
+합계에서 빼므로 조회 때 트윗 테이블을 GROUP BY 하지 않는다. 상위 항목은 카운터가
+바뀔 때까지 기억해 두므로 반복 조회는 슬라이스 한 번이다.
+
+카운터는 프로세스마다 따로 있으며, 백그라운드 스레드가 TRENDS_CHECKPOINT_DIR/<pid>.json에
+주기적으로 저장한다. 프로세스마다 파일이 달라 서로 덮어쓰지 않고, 새 프로세스는 이미
+종료된 프로세스의 파일을 하나씩 가져와(이름 바꾸기) 자기 카운터에 합친다.
+"""
+
+import atexit
+import heapq
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter, deque
+from pathlib import Path
+
+from django.conf import settings
+
+from .entities import HASHTAG_RE, MENTION_RE, extract_hashtags
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("hashtags", "keywords")
+MAX_LIMIT = 50
+CHECKPOINT_VERSION = 1
+
+WORD_RE = re.compile(r"\w{3,}")
+STOPWORDS = frozenset(
+    "the and for are but not you all any can had her was one our out has him his how its may new now "
+    "see who did get let say she too use this that with have from they will what when your just".split()
+)
+
+
+def extract_keywords(payload):
+    """해시태그/멘션을 뺀 나머지 단어 (3글자 이상, 숫자만으로 된 단어와 불용어 제외)"""
+    text = MENTION_RE.sub(" ", HASHTAG_RE.sub(" ", payload))
+    words = {word.casefold() for word in WORD_RE.findall(text)}
+    return {word for word in words if not word.isdigit() and word not in STOPWORDS}
+
+
+class SlidingWindowCounter:
+    """window_seconds 길이의 윈도를 bucket_seconds 크기 버킷으로 나눠 세는 카운터"""
+
+    def __init__(self, window_seconds, buckets):
+        self.bucket_seconds = max(1, window_seconds // buckets)
+        self.buckets = buckets
+        self._buckets = deque()  # (버킷 번호, Counter)
+        self._totals = Counter()
+        self._top = None
+
+    def add(self, terms, now):
+        bucket_id = int(now // self.bucket_seconds)
+        self.expire(now)
+        if not self._buckets or self._buckets[-1][0] != bucket_id:
+            self._buckets.append((bucket_id, Counter()))
+        self._buckets[-1][1].update(terms)
+        self._totals.update(terms)
+        self._top = None
+
+    def expire(self, now):
+        oldest = int(now // self.bucket_seconds) - self.buckets + 1
+        while self._buckets and self._buckets[0][0] < oldest:
+            _, counts = self._buckets.popleft()
+            for term, count in counts.items():
+                remaining = self._totals[term] - count
+                if remaining > 0:
+                    self._totals[term] = remaining
+                else:
+                    del self._totals[term]
+            self._top = None
+
+    def top(self, limit, now):
+        self.expire(now)
+        if self._top is None:
+            self._top = heapq.nlargest(MAX_LIMIT, self._totals.items(), key=lambda item: (item[1], item[0]))
+        return self._top[:limit]
+
+    def dump(self):
+        return {
+            "bucket_seconds": self.bucket_seconds,
+            "buckets": [[bucket_id, dict(counts)] for bucket_id, counts in self._buckets],
+        }
+
+    def load(self, state):
+        self._buckets = deque()
+        self.merge(state)
+
+    def merge(self, state):
+        """체크포인트의 버킷을 더한다. 버킷 크기가 바뀌었으면 버킷 번호의 의미가 달라지므로 버린다."""
+        buckets = {bucket_id: counts for bucket_id, counts in self._buckets}
+        if state and state["bucket_seconds"] == self.bucket_seconds:
+            for bucket_id, counts in state["buckets"]:
+                buckets.setdefault(bucket_id, Counter()).update(counts)
+        self._buckets = deque((bucket_id, buckets[bucket_id]) for bucket_id in sorted(buckets))
+        self._totals = Counter()
+        for _, counts in self._buckets:
+            self._totals.update(counts)
+        self._top = None
+
+
+class TrendTracker:
+    """종류(hashtags/keywords)와 윈도마다 SlidingWindowCounter를 하나씩 둔다."""
+
+    def __init__(self, windows, buckets_per_window, checkpoint_dir="", checkpoint_interval=60):
+        self.windows = windows
+        self.counters = {
+            (kind, window): SlidingWindowCounter(seconds, buckets_per_window)
+            for kind in KINDS
+            for window, seconds in windows.items()
+        }
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_interval = checkpoint_interval
+        self._lock = threading.Lock()
+        self._started = False
+
+    def start(self):
+        """
+        체크포인트를 불러오고 저장 스레드를 띄운다. 처음 record()/top() 때 한 번 불린다.
+
+        import만 하는 관리 명령이 스레드를 띄우지 않도록 생성자에서 하지 않는다.
+        """
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        if not self.checkpoint_dir:
+            return
+        self.restore()
+        threading.Thread(target=self._checkpoint_loop, name="trends-checkpoint", daemon=True).start()
+        atexit.register(self.checkpoint)
+
+    def _checkpoint_loop(self):
+        while True:
+            time.sleep(self.checkpoint_interval)
+            self.checkpoint()
+
+    def record(self, payload, now=None):
+        """트윗 하나의 해시태그와 키워드를 센다. 파일 I/O 없이 메모리 카운터만 바꾼다."""
+        if not self._started:
+            self.start()
+        now = time.time() if now is None else now
+        terms = {"hashtags": extract_hashtags(payload), "keywords": extract_keywords(payload)}
+        with self._lock:
+            for (kind, _), counter in self.counters.items():
+                if terms[kind]:
+                    counter.add(terms[kind], now)
+
+    def top(self, kind, window, limit=10, now=None):
+        """[(항목, 횟수)]를 횟수가 많은 순서로 최대 limit개 돌려준다."""
+        if not self._started:
+            self.start()
+        now = time.time() if now is None else now
+        with self._lock:
+            return self.counters[kind, window].top(min(limit, MAX_LIMIT), now)
+
+    def clear(self):
+        with self._lock:
+            for counter in self.counters.values():
+                counter.load(None)
+
+    @property
+    def checkpoint_path(self):
+        """이 프로세스의 체크포인트 파일"""
+        return Path(self.checkpoint_dir) / f"{os.getpid()}.json"
+
+    def checkpoint(self):
+        """카운터를 임시 파일에 쓴 뒤 교체해 체크포인트 파일이 깨지지 않게 한다."""
+        with self._lock:
+            state = {
+                "version": CHECKPOINT_VERSION,
+                "counters": {f"{kind}:{window}": counter.dump() for (kind, window), counter in self.counters.items()},
+            }
+        path = self.checkpoint_path
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.exception("트렌드 체크포인트를 저장하지 못했습니다: %s", path)
+
+    def restore(self):
+        """
+        종료된 프로세스의 체크포인트를 가져와 합친다. 윈도/버킷 설정이 바뀐 카운터는 버린다.
+
+        파일을 먼저 이 프로세스 이름으로 바꾸므로 동시에 시작한 프로세스끼리 같은 파일을
+        두 번 합치지 않는다. 아직 살아 있는 프로세스의 파일은 건드리지 않는다.
+        """
+        for path in sorted(Path(self.checkpoint_dir).glob("*.json")):
+            if not path.stem.isdigit() or process_alive(int(path.stem)):
+                continue
+            claimed = path.with_name(f"{path.stem}.restore-{os.getpid()}")
+            try:
+                os.rename(path, claimed)
+            except OSError:
+                continue  # 다른 프로세스가 먼저 가져갔다
+            try:
+                with open(claimed, encoding="utf-8") as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                logger.exception("트렌드 체크포인트를 읽지 못했습니다: %s", path)
+                state = {}
+            finally:
+                claimed.unlink(missing_ok=True)
+            if state.get("version") != CHECKPOINT_VERSION:
+                continue
+            with self._lock:
+                for (kind, window), counter in self.counters.items():
+                    counter.merge(state["counters"].get(f"{kind}:{window}"))
+
+
+def process_alive(pid):
+    if pid == os.getpid():
+        return False  # 같은 pid를 물려받은 새 프로세스라면 이전 파일은 가져와야 한다
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+trend_tracker = TrendTracker(
+    settings.TRENDS_WINDOWS,
+    settings.TRENDS_BUCKETS_PER_WINDOW,
+    checkpoint_dir=settings.TRENDS_CHECKPOINT_DIR,
+    checkpoint_interval=settings.TRENDS_CHECKPOINT_INTERVAL,
+)
@@ -1,25 +1,68 @@
+from datetime import datetime, time
+
+from django.conf import settings
+from django.db import transaction
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, render
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework import status
-from rest_framework.authentication import SessionAuthentication
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import Tweet
+from common.conditional import make_etag, not_modified, set_validators
+from common.pagination import KeysetPagination
+from common.throttling import ReadThrottle, TweetCreateThrottle, TweetDeleteThrottle
+
+from . import entities, export, rows, search, timeline
+from .cache import overlay_like_counts, response_cache
+from .models import Like, Mention, Tweet, TweetTag
 from .serializers import TweetSerializer
+from .trends import KINDS, MAX_LIMIT, trend_tracker
 
 
 def tweet_list(request):
-    """모든 Tweets를 보여주는 뷰"""
-    tweets = Tweet.objects.all()
-    return render(request, "tweets/list.html", {"tweets": tweets})
+    """트윗 목록 HTML (최신순, API와 같은 커서 페이지네이션)"""
+    paginator = KeysetPagination()
+    try:
+        # 페이지네이터는 DRF Request의 query_params를 읽는다
+        tweets = paginator.paginate_queryset(rows.values(Tweet.objects.all()), Request(request))
+    except NotFound:
+        raise Http404(paginator.invalid_cursor_message)
+    context = {
+        "tweets": tweets,
+        "next": paginator.get_next_link(),
+        "previous": paginator.get_previous_link(),
+        "fragment_cache_timeout": settings.TWEET_FRAGMENT_CACHE_TIMEOUT,
+    }
+    return render(request, "tweets/list.html", context)
+
+
+def tweet_etag(tweet=None, data=None):
+    """
+    트윗 상세 응답의 ETag
+
+    Tweet 객체나 직렬화된 응답(data) 중 하나로 같은 값을 만든다. like_count는
+    updated_at을 바꾸지 않고 갱신되므로 Last-Modified는 보내지 않는다.
+    """
+    if tweet is not None:
+        data = {
+            "id": tweet.pk,
+            "updated_at": rows.format_datetime(tweet.updated_at),
+            "like_count": tweet.like_count,
+            "username": tweet.user.username,
+        }
+    return make_etag(data["id"], data["updated_at"], data["like_count"], data["username"])
 
 
 class TweetListAPIView(APIView):
     """모든 Tweets를 반환하는 API 뷰"""
 
     def get(self, request):
-        tweets = Tweet.objects.all()
+        tweets = Tweet.objects.with_author()
         serializer = TweetSerializer(tweets, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -27,13 +70,24 @@ class TweetListAPIView(APIView):
 class TweetListCreateAPIView(APIView):
     """GET: 전체 트윗 목록 / POST: 새 트윗 생성"""
 
-    authentication_classes = [SessionAuthentication]
     permission_classes = [IsAuthenticated]
+    throttle_classes = [ReadThrottle, TweetCreateThrottle]
 
     def get(self, request):
-        tweets = Tweet.objects.all()
-        serializer = TweetSerializer(tweets, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        cached = response_cache.get_list(request)
+        if cached is None:
+            paginator = KeysetPagination()
+            tweets = paginator.paginate_queryset(rows.values(Tweet.objects.all()), request, view=self)
+            data = paginator.get_paginated_response_data(rows.to_dicts(tweets))
+            response_cache.set_list(request, data)
+        else:
+            data, stale_counts = cached
+            if stale_counts:
+                ids = [tweet["id"] for tweet in data["results"]]
+                like_counts = dict(Tweet.objects.filter(pk__in=ids).values_list("id", "like_count"))
+                data = overlay_like_counts(data, like_counts)
+                response_cache.set_list(request, data)
+        return Response(data, status=status.HTTP_200_OK)
 
     def post(self, request):
         serializer = TweetSerializer(data=request.data, context={"request": request})
@@ -43,19 +97,193 @@ class TweetListCreateAPIView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class TweetBatchAPIView(APIView):
+    """
+    POST: [{"payload": ...}, ...]를 한 번에 작성 (하나라도 검증에 실패하면 아무것도 만들지 않는다)
+    DELETE: {"ids": [...]} 중 본인 트윗을 한 번에 삭제하고 id마다 결과를 돌려준다
+    """
+
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [TweetCreateThrottle, TweetDeleteThrottle]
+    max_items = 100
+
+    def invalid_size(self, size):
+        if 1 <= size <= self.max_items:
+            return None
+        return Response(
+            {"detail": f"한 번에 1개부터 {self.max_items}개까지 처리할 수 있습니다."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    def post(self, request):
+        if not isinstance(request.data, list):
+            return Response(
+                {"detail": "트윗 목록(JSON 배열)을 보내야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        error = self.invalid_size(len(request.data))
+        if error:
+            return error
+        serializer = TweetSerializer(data=request.data, many=True, context={"request": request})
+        if not serializer.is_valid():
+            # 실패한 항목의 순번(index)마다 오류를 돌려준다
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        with transaction.atomic():
+            serializer.save()
+        return Response({"results": serializer.data}, status=status.HTTP_201_CREATED)
+
+    def delete(self, request):
+        raw_ids = request.data.get("ids") if isinstance(request.data, dict) else None
+        # JSON true/false는 bool(int의 하위 클래스)로 들어오므로 따로 막는다
+        if not isinstance(raw_ids, list) or not all(type(value) is int for value in raw_ids):
+            return Response(
+                {"detail": "ids는 숫자 목록이어야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        error = self.invalid_size(len(raw_ids))
+        if error:
+            return error
+        with transaction.atomic():
+            # 소유자 확인과 삭제 사이에 다른 요청이 끼어들지 않도록 같은 트랜잭션에서 행을 잠근다
+            # (SQLite는 BEGIN IMMEDIATE로 트랜잭션 전체가 직렬화된다)
+            tweets = Tweet.objects.select_for_update().filter(pk__in=raw_ids).order_by()
+            owners = dict(tweets.values_list("id", "user_id"))
+            owned = [pk for pk, user_id in owners.items() if user_id == request.user.pk]
+            Tweet.objects.filter(pk__in=owned).delete()
+
+        results = []
+        for pk in dict.fromkeys(raw_ids):
+            if pk not in owners:
+                result = "not_found"
+            elif owners[pk] != request.user.pk:
+                result = "forbidden"
+            else:
+                result = "deleted"
+            results.append({"id": pk, "result": result})
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+
+class HomeTimelineAPIView(APIView):
+    """로그인 사용자와 팔로우한 사용자들의 트윗 (홈 타임라인)"""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        paginator = KeysetPagination()
+        sources = timeline.home_timeline_sources(request.user)
+        tweets = paginator.paginate_sources(sources, rows.load, request, view=self)
+        return paginator.get_paginated_response(rows.to_dicts(tweets))
+
+
+class TagTweetListAPIView(APIView):
+    """#태그가 달린 트윗 (최신순, 커서 페이지네이션)"""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, tag):
+        paginator = KeysetPagination()
+        sources = [(TweetTag.objects.filter(tag=entities.normalize_tag(tag)), ("created_at", "tweet_id"))]
+        tweets = paginator.paginate_sources(sources, rows.load, request, view=self)
+        return paginator.get_paginated_response(rows.to_dicts(tweets))
+
+
+class MentionTweetListAPIView(APIView):
+    """로그인 사용자를 @멘션한 트윗 (최신순, 커서 페이지네이션)"""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        paginator = KeysetPagination()
+        sources = [(Mention.objects.filter(user=request.user), ("created_at", "tweet_id"))]
+        tweets = paginator.paginate_sources(sources, rows.load, request, view=self)
+        return paginator.get_paginated_response(rows.to_dicts(tweets))
+
+
+class TweetSearchAPIView(APIView):
+    """
+    ?q= 트윗 본문 전문 검색
+
+    order=rank(기본): bm25 관련도순 상위 page_size개 / order=recent: 최신순 커서 페이지.
+    `djan*`처럼 끝에 *를 붙이면 접두사 검색이 된다.
+    """
+
+    permission_classes = [IsAuthenticated]
+    orders = ("rank", "recent")
+
+    def get(self, request):
+        query = request.query_params.get("q", "")
+        if not search.parse_terms(query):
+            return Response(
+                {"detail": "q에 검색어를 입력해야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        order = request.query_params.get("order", "rank")
+        if order not in self.orders:
+            return Response(
+                {"detail": f"order는 {', '.join(self.orders)} 중 하나여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        paginator = KeysetPagination()
+        if order == "rank" and search.is_supported():
+            tweet_ids = search.ranked_ids(query, paginator.get_page_size(request))
+            tweets = rows.load(tweet_ids)
+            results = rows.to_dicts(tweets[pk] for pk in tweet_ids if pk in tweets)
+            return Response({"next": None, "previous": None, "results": results})
+
+        # 최신순이거나 FTS를 쓸 수 없는 DB에서는 검색 조건을 건 커서 페이지네이션
+        tweets = rows.values(Tweet.objects.filter(search.matches(query)))
+        tweets = paginator.paginate_queryset(tweets, request, view=self)
+        return paginator.get_paginated_response(rows.to_dicts(tweets))
+
+
+class TrendListAPIView(APIView):
+    """최근 윈도(?window=5m|1h|24h)에서 많이 쓰인 해시태그/키워드 (?kind=hashtags|keywords)"""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        window = request.query_params.get("window", "1h")
+        kind = request.query_params.get("kind", "hashtags")
+        if window not in trend_tracker.windows or kind not in KINDS:
+            return Response(
+                {
+                    "detail": f"window는 {', '.join(trend_tracker.windows)}, "
+                    f"kind는 {', '.join(KINDS)} 중 하나여야 합니다."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            limit = min(max(int(request.query_params.get("limit", 10)), 1), MAX_LIMIT)
+        except ValueError:
+            limit = 10
+        trends = trend_tracker.top(kind, window, limit)
+        return Response(
+            {"window": window, "kind": kind, "trends": [{"term": term, "count": count} for term, count in trends]},
+            status=status.HTTP_200_OK,
+        )
+
+
 class TweetDetailAPIView(APIView):
     """단일 트윗 조회/수정/삭제"""
 
-    authentication_classes = [SessionAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get_object(self, pk):
-        return get_object_or_404(Tweet, pk=pk)
+        return get_object_or_404(Tweet.objects.with_author(), pk=pk)
 
     def get(self, request, pk):
-        tweet = self.get_object(pk)
-        serializer = TweetSerializer(tweet)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # 캐시된 응답이 있으면 그 값으로, 없으면 불러온 트윗으로 ETag를 만든다
+        data = response_cache.get_detail(pk)
+        tweet = self.get_object(pk) if data is None else None
+        etag = tweet_etag(tweet, data)
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+        if data is None:
+            data = TweetSerializer(tweet).data
+            response_cache.set_detail(pk, data)
+        return set_validators(Response(data, status=status.HTTP_200_OK), etag)
 
     def put(self, request, pk):
         tweet = self.get_object(pk)
@@ -79,3 +307,112 @@ class TweetDetailAPIView(APIView):
             )
         tweet.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class TweetLikeAPIView(APIView):
+    """POST: 좋아요 / DELETE: 좋아요 취소 (여러 번 호출해도 결과가 같다)"""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        try:
+            created = Like.objects.like(request.user, pk)
+        except Tweet.DoesNotExist:
+            raise Http404
+        return Response(
+            {"tweet": pk, "liked": True},
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+    def delete(self, request, pk):
+        try:
+            Like.objects.unlike(request.user, pk)
+        except Tweet.DoesNotExist:
+            raise Http404
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class TweetLikedLookupAPIView(APIView):
+    """?ids=1,2,3 중 로그인 사용자가 좋아요한 트윗 id 목록"""
+
+    permission_classes = [IsAuthenticated]
+    max_ids = 100
+
+    def get(self, request):
+        raw_ids = request.query_params.get("ids", "")
+        try:
+            tweet_ids = {int(value) for value in raw_ids.split(",") if value}
+        except ValueError:
+            return Response(
+                {"detail": "ids는 쉼표로 구분된 숫자여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(tweet_ids) > self.max_ids:
+            return Response(
+                {"detail": f"ids는 최대 {self.max_ids}개까지 조회할 수 있습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        liked = Like.objects.liked_tweet_ids(request.user, tweet_ids) if tweet_ids else set()
+        return Response({"liked": sorted(liked)}, status=status.HTTP_200_OK)
+
+
+class TweetCacheStatsAPIView(APIView):
+    """트윗 응답 캐시 적중/실패 횟수 (관리자 전용)"""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(response_cache.stats(), status=status.HTTP_200_OK)
+
+
+class TweetExportAPIView(APIView):
+    """트윗 스트리밍 내보내기 (?output=ndjson|json&user=&since=&until=)"""
+
+    permission_classes = [IsAuthenticated]
+    formats = {
+        "ndjson": (export.stream_ndjson, "application/x-ndjson"),
+        "json": (export.stream_json_array, "application/json"),
+    }
+
+    def parse_datetime_param(self, request, name):
+        value = request.query_params.get(name)
+        if not value:
+            return None
+        # 형식은 맞지만 범위를 벗어난 값(25시, 2월 30일)은 None 대신 ValueError가 난다
+        try:
+            parsed = parse_datetime(value)
+            date = parse_date(value) if parsed is None else None
+        except ValueError:
+            parsed = date = None
+        if parsed is None:
+            if date is None:
+                raise ValidationError({name: "ISO 8601 날짜 또는 날짜/시간이어야 합니다."})
+            parsed = datetime.combine(date, time.min)
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    def get_queryset(self, request):
+        tweets = Tweet.objects.order_by("-created_at", "-id")
+        user = request.query_params.get("user")
+        if user:
+            if not user.isdigit():
+                raise ValidationError({"user": "사용자 id는 숫자여야 합니다."})
+            tweets = tweets.filter(user_id=int(user))
+        since = self.parse_datetime_param(request, "since")
+        if since:
+            tweets = tweets.filter(created_at__gte=since)
+        until = self.parse_datetime_param(request, "until")
+        if until:
+            tweets = tweets.filter(created_at__lt=until)
+        return tweets
+
+    def get(self, request):
+        output = request.query_params.get("output", "ndjson")
+        if output not in self.formats:
+            raise ValidationError({"output": f"{', '.join(self.formats)} 중 하나여야 합니다."})
+        stream, content_type = self.formats[output]
+        rows = export.iter_rows(self.get_queryset(request))
+        response = StreamingHttpResponse(stream(rows), content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="tweets.{output}"'
+        return response
@@ -0,0 +1,63 @@
+"""users.views의 목록/상세/작성 API를 async ORM으로 구현한 뷰
+
+settings.API_VIEWS가 "async"면 users/urls.py가 이 모듈의 뷰를 연결한다.
+"""
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.shortcuts import aget_object_or_404
+from rest_framework import status
+
+from common.conditional import not_modified, set_validators
+from common.pagination import KeysetPagination
+from common.throttling import LoginThrottle, ReadThrottle
+from common.views import AsyncAPIView
+from tweets import rows
+
+from .serializers import UserCreateSerializer, UserSerializer
+from .views import page_etag, page_summary, user_tweets
+
+
+class UserListCreateAPIView(AsyncAPIView):
+    """GET: 사용자 목록 / POST: 회원가입"""
+
+    login_required = False
+    throttle_classes = [ReadThrottle, LoginThrottle]
+
+    async def get(self, request):
+        if not request.user.is_authenticated:
+            return self.render({"detail": "로그인이 필요합니다."}, status.HTTP_401_UNAUTHORIZED)
+        users = [user async for user in User.objects.aiterator()]
+        return self.render(UserSerializer(users, many=True).data)
+
+    async def post(self, request):
+        serializer = UserCreateSerializer(data=request.data)
+        # username 중복 검사와 비밀번호 해싱은 동기 코드이므로 스레드에서 실행한다
+        if not await sync_to_async(serializer.is_valid)():
+            return self.render(serializer.errors, status.HTTP_400_BAD_REQUEST)
+        user = await sync_to_async(serializer.save)()
+        return self.render(UserSerializer(user).data, status.HTTP_201_CREATED)
+
+
+class UserDetailAPIView(AsyncAPIView):
+    """단일 사용자 정보"""
+
+    async def get(self, request, pk):
+        user = await aget_object_or_404(User, pk=pk)
+        return self.render(UserSerializer(user).data)
+
+
+class UserTweetsAPIView(AsyncAPIView):
+    """특정 사용자의 트윗 목록"""
+
+    async def get(self, request, pk):
+        user = await aget_object_or_404(User, pk=pk)
+        paginator = KeysetPagination()
+        page, aggregates = page_summary(request, user, paginator)
+        etag = page_etag(user, paginator, await page.aaggregate(**aggregates))
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+        tweets = await paginator.apaginate_queryset(user_tweets(user), request, view=self)
+        data = paginator.get_paginated_response_data(rows.to_dicts(tweets))
+        return set_validators(self.render(data), etag)
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from users.models import FollowerCount
+
+
+class Command(BaseCommand):
+    help = "Follow 테이블을 기준으로 사용자별 팔로워 수(FollowerCount)를 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        created = FollowerCount.objects.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"{created}명의 팔로워 수를 다시 계산했습니다."))
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_follower_counts(apps, schema_editor):
+    """기존 Follow 데이터로 팔로워 수를 채운다."""
+    Follow = apps.get_model("users", "Follow")
+    FollowerCount = apps.get_model("users", "FollowerCount")
+    counts = Follow.objects.order_by().values_list("following_id").annotate(count=Count("id"))
+    FollowerCount.objects.bulk_create(
+        [FollowerCount(user_id=user_id, count=count) for user_id, count in counts], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FollowerCount",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="follower_count",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(db_index=True, default=0)),
+            ],
+        ),
+        migrations.RunPython(populate_follower_counts, migrations.RunPython.noop),
+    ]
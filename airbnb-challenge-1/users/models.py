@@ -1,3 +1,88 @@
-from django.db import models
+from django.contrib.auth.models import User
+from django.db import models, router, transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
 
-# Create your models here.
+from common.models import TimeStampedModel
+
+
+class FollowQuerySet(models.QuerySet):
+    """Follow 쓰기용 QuerySet"""
+
+    def delete(self):
+        """
+        지우는 팔로우 수만큼 사용자별 팔로워 수를 내린다.
+
+        post_delete 수신기를 두면 사용자 삭제의 CASCADE가 fast delete를 못 하므로
+        명시적인 삭제 경로(이 메서드, Follow.delete())에서만 센다.
+        """
+        with transaction.atomic(using=self.db, savepoint=False):
+            counts = list(self.order_by().values_list("following_id").annotate(count=Count("id")))
+            deleted = super().delete()
+            for following_id, count in counts:
+                FollowerCount.objects.using(self.db).adjust([following_id], -count)
+        return deleted
+
+
+class Follow(TimeStampedModel):
+    """팔로우 관계 모델: follower가 following을 팔로우한다"""
+
+    follower = models.ForeignKey(User, on_delete=models.CASCADE, related_name="following_set")
+    following = models.ForeignKey(User, on_delete=models.CASCADE, related_name="follower_set")
+
+    objects = FollowQuerySet.as_manager()
+
+    class Meta:
+        unique_together = ["follower", "following"]
+        indexes = [
+            # 팬아웃 시 작성자의 팔로워 목록 조회용
+            models.Index(fields=["following", "follower"], name="follow_following_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.follower.username} follows {self.following.username}"
+
+    def delete(self, using=None, keep_parents=False):
+        """팔로우 하나를 지우고 팔로워 수를 내린다. (FollowQuerySet.delete() 참고)"""
+        using = using or router.db_for_write(Follow, instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            deleted = super().delete(using=using, keep_parents=keep_parents)
+            FollowerCount.objects.using(using).adjust([self.following_id], -1)
+        return deleted
+
+
+class FollowerCountQuerySet(models.QuerySet):
+    """FollowerCount 갱신용 QuerySet"""
+
+    def adjust(self, user_ids, delta):
+        """user_ids의 팔로워 수를 F() 식으로 delta만큼 바꾼다. 0 아래로는 내리지 않는다."""
+        if delta > 0:
+            self.bulk_create([FollowerCount(user_id=user_id) for user_id in user_ids], ignore_conflicts=True)
+        return self.filter(user_id__in=user_ids).update(count=Greatest(F("count") + delta, 0))
+
+    def rebuild(self, batch_size=1000):
+        """Follow 테이블을 기준으로 팔로워 수를 다시 만든다. 만든 행 수를 돌려준다."""
+        counts = Follow.objects.order_by().values_list("following_id").annotate(count=Count("id"))
+        with transaction.atomic(using=self.db):
+            self.all().delete()
+            rows = [FollowerCount(user_id=user_id, count=count) for user_id, count in counts]
+            self.bulk_create(rows, batch_size=batch_size)
+        return len(rows)
+
+
+class FollowerCount(models.Model):
+    """
+    사용자별 팔로워 수 (비정규화 카운터)
+
+    팔로워가 TIMELINE_FANOUT_FOLLOWER_LIMIT보다 많은 사용자를 count 인덱스 범위 스캔으로
+    찾기 위해 둔다. Follow 생성은 signals에서, 삭제는 FollowQuerySet/Follow.delete()에서 센다.
+    bulk_create로 넣은 팔로우는 세지 않으므로 rebuild_follower_counts로 다시 만든다.
+    """
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="follower_count")
+    count = models.PositiveIntegerField(default=0, db_index=True)
+
+    objects = FollowerCountQuerySet.as_manager()
+
+    def __str__(self):
+        return f"{self.user_id}: {self.count}"
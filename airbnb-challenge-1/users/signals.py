@@ -0,0 +1,24 @@
+from django.contrib.auth.models import User
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import Follow, FollowerCount
+
+
+@receiver(post_save, sender=Follow)
+def increment_follower_count(sender, instance, created, **kwargs):
+    """팔로우가 새로 생기면 팔로우 대상의 팔로워 수를 1 올린다."""
+    if created:
+        FollowerCount.objects.adjust([instance.following_id], 1)
+
+
+# Follow에는 post_delete 수신기를 두지 않는다. 명시적인 삭제는 FollowQuerySet.delete()/Follow.delete()가 센다.
+
+
+@receiver(pre_delete, sender=User)
+def decrement_followed_counts(sender, instance, **kwargs):
+    """사용자가 지워지면 CASCADE로 사라질 팔로우만큼 팔로우 대상의 팔로워 수를 UPDATE 한 번으로 내린다."""
+    followed = FollowerCount.objects.filter(user__follower_set__follower=instance)
+    followed.update(count=Greatest(F("count") - 1, 0))
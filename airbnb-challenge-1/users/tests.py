@@ -1,3 +1,162 @@
-from django.test import TestCase
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from common.authentication import user_cache
+from tweets.models import TimelineEntry, Tweet
+
+from .models import Follow, FollowerCount
+
+
+class UserFollowAPITestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="follower", password="testpassword123")
+        self.other_user = User.objects.create_user(username="followee", password="testpassword123")
+        self.tweet = Tweet.objects.create(payload="old tweet", user=self.other_user)
+        self.follow_url = f"/api/v1/users/{self.other_user.pk}/follow"
+        self.client.force_authenticate(user=self.user)
+
+    def test_follow_backfills_timeline(self):
+        """Test POST /api/v1/users/<pk>/follow"""
+        response = self.client.post(self.follow_url)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Follow.objects.filter(follower=self.user, following=self.other_user).exists())
+        self.assertTrue(TimelineEntry.objects.filter(owner=self.user, tweet=self.tweet).exists())
+
+        response = self.client.post(self.follow_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_unfollow_removes_timeline_entries(self):
+        """Test DELETE /api/v1/users/<pk>/follow"""
+        self.client.post(self.follow_url)
+        response = self.client.delete(self.follow_url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Follow.objects.filter(follower=self.user).exists())
+        self.assertFalse(TimelineEntry.objects.filter(owner=self.user).exists())
+
+    def test_follower_count_maintained(self):
+        """Test follow, unfollow and user deletion keep FollowerCount in step"""
+        self.client.post(self.follow_url)
+        self.assertEqual(FollowerCount.objects.get(user=self.other_user).count, 1)
+        self.client.delete(self.follow_url)
+        self.assertEqual(FollowerCount.objects.get(user=self.other_user).count, 0)
+
+        self.client.post(self.follow_url)
+        self.user.delete()
+        self.assertEqual(FollowerCount.objects.get(user=self.other_user).count, 0)
+
+    def test_rebuild_follower_counts_command(self):
+        """Test rebuild_follower_counts repairs counts after bulk-created follows"""
+        Follow.objects.bulk_create([Follow(follower=self.user, following=self.other_user)])
+        call_command("rebuild_follower_counts", stdout=StringIO())
+        self.assertEqual(FollowerCount.objects.get(user=self.other_user).count, 1)
+
+    def test_cannot_follow_self(self):
+        """Test following yourself returns 400"""
+        response = self.client.post(f"/api/v1/users/{self.user.pk}/follow")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class UserSessionTestCase(APITestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = User.objects.create_user(username="session-user", password="testpassword123")
+
+    def test_session_user_read_from_database(self):
+        """Test the default DB session profile doesn't serve a deactivated user from another process's cache"""
+        self.client.login(username="session-user", password="testpassword123")
+        self.assertEqual(self.client.get("/api/v1/users").status_code, status.HTTP_200_OK)
+        # 시그널이 닿지 않는 다른 프로세스에서 비활성화된 것처럼 update()로 바꾼다
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertEqual(self.client.get("/api/v1/users").status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(
+        SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies",
+        AUTHENTICATION_BACKENDS=["common.backends.CachedModelBackend"],
+    )
+    def test_session_read_path_skips_database(self):
+        """Test a logged-in request resolves the session user without queries"""
+        response = self.client.post(
+            "/api/v1/users/login",
+            {"username": "session-user", "password": "testpassword123"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        detail_url = f"/api/v1/users/{self.user.pk}"
+        self.client.get(detail_url)
+        # 세션 사용자 조회 없이 상세 조회 쿼리 1번만 실행된다
+        with self.assertNumQueries(1):
+            response = self.client.get(detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(
+        PASSWORD_HASHERS=[
+            "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+            "django.contrib.auth.hashers.MD5PasswordHasher",
+        ]
+    )
+    def test_login_upgrades_password_hash(self):
+        """Test a legacy MD5 hash is re-hashed with PBKDF2 on login"""
+        with self.settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]):
+            fast_hash = make_password("testpassword123")
+        User.objects.filter(pk=self.user.pk).update(password=fast_hash)
+        response = self.client.post(
+            "/api/v1/users/login",
+            {"username": "session-user", "password": "testpassword123"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$"))
+
+
+class UserTweetsConditionalGetTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="author", password="testpassword123")
+        self.tweet = Tweet.objects.create(payload="first", user=self.user)
+        self.url = f"/api/v1/users/{self.user.pk}/tweets"
+        self.client.force_authenticate(user=self.user)
+
+    def test_not_modified_without_serialization(self):
+        """Test an unchanged page returns 304 from the summary query without reading the page"""
+        etag = self.client.get(self.url)["ETag"]
+        with mock.patch("users.views.KeysetPagination.paginate_queryset") as paginate:
+            with self.assertNumQueries(2):  # 사용자, 페이지 집계
+                response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        paginate.assert_not_called()
+        self.assertNotIn("Last-Modified", response)
+
+    def test_changes_invalidate_etag(self):
+        """Test new, edited, liked, re-liked and deleted tweets change the page ETag"""
+        other = Tweet.objects.create(payload="other", user=self.user)
+        etags = [self.client.get(self.url)["ETag"]]
+        Tweet.objects.create(payload="second", user=self.user)
+        etags.append(self.client.get(self.url)["ETag"])
+        self.tweet.payload = "edited"
+        self.tweet.save()
+        etags.append(self.client.get(self.url)["ETag"])
+        Tweet.objects.adjust_like_count(self.tweet.pk, 1)
+        etags.append(self.client.get(self.url)["ETag"])
+        # 좋아요 합은 같아도 다른 트윗으로 옮겨 가면 바뀐다
+        Tweet.objects.adjust_like_count(self.tweet.pk, -1)
+        Tweet.objects.adjust_like_count(other.pk, 1)
+        etags.append(self.client.get(self.url)["ETag"])
+        other.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=",".join(etags))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(set(etags) | {response["ETag"]}), 6)
+
+    def test_pages_have_different_etags(self):
+        """Test the cursor and page size are part of the ETag"""
+        Tweet.objects.create(payload="second", user=self.user)
+        first = self.client.get(self.url, {"page_size": 1})
+        second = self.client.get(first.data["next"])
+        self.assertNotEqual(first["ETag"], second["ETag"])
+        self.assertEqual(self.client.get(first.data["next"], HTTP_IF_NONE_MATCH=second["ETag"]).status_code, 304)
@@ -1,23 +1,21 @@
+from django.conf import settings
 from django.urls import path
 
-from .views import (
-    UserDetailAPIView,
-    UserListCreateAPIView,
-    UserLoginAPIView,
-    UserLogoutAPIView,
-    UserPasswordUpdateAPIView,
-    UserTweetsAPIView,
-)
+from . import async_views, views
+
+# settings.API_VIEWS에 따라 목록/상세 API를 async 뷰로 바꿔 연결한다
+api_views = async_views if settings.API_VIEWS == "async" else views
 
 urlpatterns = [
-    path("api/v1/users", UserListCreateAPIView.as_view(), name="api_user_list"),
-    path("api/v1/users/<int:pk>", UserDetailAPIView.as_view(), name="api_user_detail"),
+    path("api/v1/users", api_views.UserListCreateAPIView.as_view(), name="api_user_list"),
+    path("api/v1/users/<int:pk>", api_views.UserDetailAPIView.as_view(), name="api_user_detail"),
     path(
         "api/v1/users/<int:pk>/tweets",
-        UserTweetsAPIView.as_view(),
+        api_views.UserTweetsAPIView.as_view(),
         name="api_user_tweet_list",
     ),
-    path("api/v1/users/password", UserPasswordUpdateAPIView.as_view(), name="api_user_password_update"),
-    path("api/v1/users/login", UserLoginAPIView.as_view(), name="api_user_login"),
-    path("api/v1/users/logout", UserLogoutAPIView.as_view(), name="api_user_logout"),
+    path("api/v1/users/<int:pk>/follow", views.UserFollowAPIView.as_view(), name="api_user_follow"),
+    path("api/v1/users/password", views.UserPasswordUpdateAPIView.as_view(), name="api_user_password_update"),
+    path("api/v1/users/login", views.UserLoginAPIView.as_view(), name="api_user_login"),
+    path("api/v1/users/logout", views.UserLogoutAPIView.as_view(), name="api_user_logout"),
 ]
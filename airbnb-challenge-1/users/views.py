@@ -1,15 +1,22 @@
 from django.contrib.auth import login, logout
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Count, F, Max, Sum
 from django.shortcuts import get_object_or_404
 from rest_framework import status
-from rest_framework.authentication import SessionAuthentication
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from common import tasks
+from common.conditional import make_etag, not_modified, set_validators
+from common.pagination import KeysetPagination
+from common.throttling import LoginAccountThrottle, LoginThrottle, LoginUsernameThrottle, ReadThrottle
+from tweets import rows, timeline
+from tweets import tasks as tweet_tasks
 from tweets.models import Tweet
-from tweets.serializers import TweetSerializer
 
+from .models import Follow
 from .serializers import (
     LoginSerializer,
     PasswordUpdateSerializer,
@@ -18,11 +25,43 @@ from .serializers import (
 )
 
 
+def user_tweets(user):
+    """user의 트윗을 tweets.rows 매퍼가 읽는 행으로 돌려주는 queryset"""
+    return rows.values(Tweet.objects.filter(user=user))
+
+
+def page_summary(request, user, paginator):
+    """
+    사용자 트윗 한 페이지의 ETag를 만들 집계 queryset (아직 실행하지 않음)
+
+    페이지를 읽기 전에 같은 커서 범위(page_size + 1행)를 JOIN과 본문 없이 집계한다.
+    id 합은 삭제되거나 밀려 들어온 트윗을, updated_at은 수정을, like_count 합과
+    id 가중 합은 좋아요를 반영한다.
+    """
+    paginator.prepare(request)
+    page = paginator.order_queryset(Tweet.objects.filter(user=user), (paginator.ordering_field, "id"))
+    return page, {
+        "rows": Count("id"),
+        "ids": Sum("id"),
+        "updated_at": Max("updated_at"),
+        "likes": Sum("like_count"),
+        "weighted_likes": Sum(F("like_count") * F("id")),
+    }
+
+
+def page_etag(user, paginator, summary):
+    """
+    page_summary() 집계로 만든 ETag. 좋아요와 삭제는 updated_at을 바꾸지 않으므로
+    Last-Modified는 보내지 않는다.
+    """
+    return make_etag(user.username, paginator.position, paginator.reverse, paginator.page_size, summary)
+
+
 class UserListCreateAPIView(APIView):
     """GET: 사용자 목록 / POST: 회원가입"""
 
-    authentication_classes = [SessionAuthentication]
     permission_classes = [AllowAny]
+    throttle_classes = [ReadThrottle, LoginThrottle]
 
     def get(self, request):
         if not request.user.is_authenticated:
@@ -42,7 +81,6 @@ class UserListCreateAPIView(APIView):
 class UserDetailAPIView(APIView):
     """단일 사용자 정보"""
 
-    authentication_classes = [SessionAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request, pk):
@@ -54,21 +92,54 @@ class UserDetailAPIView(APIView):
 class UserTweetsAPIView(APIView):
     """특정 사용자의 트윗 목록"""
 
-    authentication_classes = [SessionAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request, pk):
         user = get_object_or_404(User, pk=pk)
-        tweets = Tweet.objects.filter(user=user)
-        serializer = TweetSerializer(tweets, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        paginator = KeysetPagination()
+        page, aggregates = page_summary(request, user, paginator)
+        etag = page_etag(user, paginator, page.aggregate(**aggregates))
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+        tweets = paginator.paginate_queryset(user_tweets(user), request, view=self)
+        return set_validators(paginator.get_paginated_response(rows.to_dicts(tweets)), etag)
+
+
+class UserFollowAPIView(APIView):
+    """POST: 팔로우 / DELETE: 언팔로우"""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        following = get_object_or_404(User, pk=pk)
+        if following == request.user:
+            return Response(
+                {"detail": "자기 자신은 팔로우할 수 없습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        with transaction.atomic():
+            _, created = Follow.objects.get_or_create(follower=request.user, following=following)
+            if created:
+                tasks.enqueue(tweet_tasks.backfill_timeline, request.user.pk, following.pk)
+        return Response(
+            {"following": following.pk},
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+    def delete(self, request, pk):
+        following = get_object_or_404(User, pk=pk)
+        deleted, _ = Follow.objects.filter(follower=request.user, following=following).delete()
+        if deleted:
+            timeline.remove_author(request.user, following)
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class UserPasswordUpdateAPIView(APIView):
     """로그인 사용자의 비밀번호를 변경한다."""
 
-    authentication_classes = [SessionAuthentication]
     permission_classes = [IsAuthenticated]
+    throttle_classes = [LoginThrottle]
 
     def put(self, request):
         serializer = PasswordUpdateSerializer(data=request.data, context={"user": request.user})
@@ -81,8 +152,8 @@ class UserPasswordUpdateAPIView(APIView):
 class UserLoginAPIView(APIView):
     """세션 기반 로그인"""
 
-    authentication_classes = [SessionAuthentication]
     permission_classes = [AllowAny]
+    throttle_classes = [LoginThrottle, LoginUsernameThrottle, LoginAccountThrottle]
 
     def post(self, request):
         serializer = LoginSerializer(data=request.data)
@@ -96,7 +167,6 @@ class UserLoginAPIView(APIView):
 class UserLogoutAPIView(APIView):
     """세션 기반 로그아웃"""
 
-    authentication_classes = [SessionAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request):